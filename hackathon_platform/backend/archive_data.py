@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Script to move past hackathons and old activity logs into the archive tables
+"""
+import sys
+import os
+import argparse
+from datetime import datetime, timedelta
+
+# Add the backend directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import text
+from utils.database import engine, SessionLocal
+from utils.archival import archive_hackathons, archive_activity_logs, ARCHIVE_BATCH_SIZE, ACTIVITY_LOG_BATCH_SIZE
+
+def archive_data(hackathon_days: int, log_days: int, batch_size: int, log_batch_size: int, vacuum: bool):
+    """Archive hackathons that ended and logs written more than the given days ago"""
+    db = SessionLocal()
+    now = datetime.utcnow()
+    
+    try:
+        hackathons = archive_hackathons(db, now - timedelta(days=hackathon_days), batch_size)
+        print(f"Archived {hackathons} hackathons that ended more than {hackathon_days} days ago")
+        
+        logs = archive_activity_logs(db, now - timedelta(days=log_days), log_batch_size)
+        print(f"Archived {logs} activity logs older than {log_days} days")
+        
+    except Exception as e:
+        print(f"Error archiving data: {str(e)}")
+        db.rollback()
+        return
+    finally:
+        db.close()
+    
+    # SQLite keeps freed pages in the file until it is vacuumed
+    if vacuum and engine.dialect.name == "sqlite":
+        print("Vacuuming database...")
+        with engine.connect() as connection:
+            connection.execution_options(isolation_level="AUTOCOMMIT").execute(text("VACUUM"))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--hackathon-days", type=int, default=365, help="Archive past hackathons that ended this many days ago")
+    parser.add_argument("--log-days", type=int, default=180, help="Archive activity logs older than this many days")
+    parser.add_argument("--batch-size", type=int, default=ARCHIVE_BATCH_SIZE, help="Hackathons per transaction")
+    parser.add_argument("--log-batch-size", type=int, default=ACTIVITY_LOG_BATCH_SIZE, help="Activity logs per transaction")
+    parser.add_argument("--vacuum", action="store_true", help="Reclaim disk space afterwards (SQLite)")
+    args = parser.parse_args()
+    
+    print("Archiving data...")
+    archive_data(args.hackathon_days, args.log_days, args.batch_size, args.log_batch_size, args.vacuum)
+    print("Archival complete!")
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Script to fill in dashboard time-series rollups for days recorded before rollups existed
+"""
+import sys
+import os
+
+# Add the backend directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import func, literal
+from utils.database import SessionLocal
+from models.database import Hackathon, Participant, Submission, MetricRollup
+from utils.rollups import bucket_start, record_events
+
+BATCH_SIZE = 5000
+
+def _metric_sources(db):
+    """Raw (moment, hackathon_id, organizer_id, dimension) rows of the metrics the raw tables still hold"""
+    # Status transitions are not stored as rows, so status_changes only has its live rollups,
+    # and archived hackathons have no raw rows left. Creations are broken down by status like
+    # the live counter, using the status the hackathon has now.
+    return {
+        "hackathons": db.query(
+            Hackathon.created_at, Hackathon.id, Hackathon.organizer_id, func.coalesce(Hackathon.status, "")
+        ),
+        "registrations": db.query(
+            Participant.registration_date, Participant.hackathon_id, Hackathon.organizer_id, literal("")
+        ).join(Hackathon, Hackathon.id == Participant.hackathon_id),
+        "submissions": db.query(
+            Submission.submitted_at, Submission.hackathon_id, Hackathon.organizer_id, literal("")
+        ).join(Hackathon, Hackathon.id == Submission.hackathon_id),
+    }
+
+def _rolled_up_days(db, metric):
+    """(hackathon_id, day) pairs that already have rollups for a metric"""
+    return set(
+        db.query(MetricRollup.hackathon_id, MetricRollup.bucket_start)
+        .filter(MetricRollup.metric == metric, MetricRollup.granularity == "day")
+        .distinct()
+    )
+
+def backfill_rollups():
+    """Count raw rows into the rollups of hackathon days that have none yet"""
+    db = SessionLocal()
+    
+    try:
+        for metric, source in _metric_sources(db).items():
+            print(f"Backfilling {metric}...")
+            # Days with rollups were counted live; adding raw rows again would double them
+            covered = _rolled_up_days(db, metric)
+            events = (
+                event for event in source.yield_per(BATCH_SIZE)
+                if event[0] is not None and (event[1], bucket_start(event[0], "day")) not in covered
+            )
+            record_events(db, metric, events)
+            db.commit()
+        
+        print(f"Rollup rows: {db.query(MetricRollup).count()}")
+        
+    except Exception as e:
+        print(f"Error backfilling rollups: {str(e)}")
+        db.rollback()
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    print("Backfilling dashboard rollups...")
+    backfill_rollups()
+    print("Rollup backfill complete!")
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Script to build the participant skill index from the participants.skills column
+"""
+import sys
+import os
+
+# Add the backend directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from utils.database import SessionLocal
+from models.database import Hackathon
+from utils.skill_index import rebuild_skill_index
+
+def backfill_skill_index():
+    """Rebuild the skill index of every hackathon, one transaction per hackathon"""
+    db = SessionLocal()
+    indexed = 0
+    
+    try:
+        hackathon_ids = [row[0] for row in db.query(Hackathon.id).order_by(Hackathon.id)]
+        for hackathon_id in hackathon_ids:
+            written = rebuild_skill_index(db, hackathon_id)
+            db.commit()
+            indexed += written
+            print(f"Hackathon {hackathon_id}: {written} skill entries")
+        
+        print(f"Indexed {indexed} skill entries across {len(hackathon_ids)} hackathons")
+        
+    except Exception as e:
+        print(f"Error building skill index: {str(e)}")
+        db.rollback()
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    print("Building participant skill index...")
+    backfill_skill_index()
+    print("Skill index complete!")
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Benchmark an application surge through the admission queue.
+
+Seeds a temporary SQLite database with one open hackathon and fires
+applications at POST /api/hackathons/{id}/apply with high concurrency (a share
+of them repeating an email), then polls every ticket. Reports sustained
+inserts per second and checks that every unique email was stored exactly once
+and every ticket resolved. For comparison, the same load is written with one
+transaction per applicant from a thread pool.
+
+    python benchmarks/bench_admission_surge.py [--applications 5000] [--concurrency 200] [--duplicates 0.1]
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+# Use a throwaway database before the app modules create their engine
+_db_dir = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_db_dir, 'bench.db')}"
+
+# Add the backend directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+from sqlalchemy import func
+from main import app
+from utils.database import SessionLocal, ensure_schema
+from utils.admission import admission_queue
+from models.database import User, Hackathon, Participant
+from utils.auth import get_password_hash
+
+def seed() -> tuple:
+    """Create an organizer and two hackathons whose application window is open"""
+    ensure_schema()
+    db = SessionLocal()
+    try:
+        organizer = User(
+            email="organizer@hackathon.com",
+            username="organizer",
+            hashed_password=get_password_hash("password"),
+            full_name="Bench Organizer",
+            role="organizer"
+        )
+        db.add(organizer)
+        db.flush()
+        
+        now = datetime.utcnow()
+        hackathons = []
+        for name in ("Queued surge", "Direct surge"):
+            hackathon = Hackathon(
+                name=name,
+                description="Surge benchmark",
+                start_date=now + timedelta(days=30),
+                end_date=now + timedelta(days=32),
+                application_open=now - timedelta(days=1),
+                application_close=now + timedelta(days=7),
+                prize_pool="$10,000",
+                rules="Be nice",
+                submission_requirements="TBD",
+                communication_channels="TBD",
+                organizer_id=organizer.id
+            )
+            db.add(hackathon)
+            hackathons.append(hackathon)
+        db.commit()
+        return tuple(hackathon.id for hackathon in hackathons)
+    finally:
+        db.close()
+
+def build_applications(count: int, duplicate_share: float) -> list:
+    """Application bodies; a share reuse an earlier email with different casing"""
+    random.seed(42)
+    applications = []
+    for index in range(count):
+        if applications and random.random() < duplicate_share:
+            email = random.choice(applications)["email"].upper()
+        else:
+            email = f"applicant{index}@example.com"
+        applications.append({
+            "name": f"Applicant {index}",
+            "email": email,
+            "region": random.choice(["EU", "NA", "APAC"]),
+            "skills": random.sample(["Python", "React", "Go", "ML", "Design"], 2),
+        })
+    return applications
+
+async def run_queued(hackathon_id: int, applications: list, concurrency: int) -> dict:
+    """Submit through the HTTP endpoint and wait for every ticket to resolve"""
+    admission_queue.start()
+    semaphore = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+    
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def apply(body: dict):
+            async with semaphore:
+                response = await client.post(f"/api/hackathons/{hackathon_id}/apply", json=body)
+                return response.status_code, response.json()
+        
+        start = time.perf_counter()
+        responses = await asyncio.gather(*(apply(body) for body in applications))
+        submitted = time.perf_counter() - start
+        
+        tickets = {payload["ticket_id"] for status_code, payload in responses if status_code == 202}
+        outcomes = {}
+        while len(outcomes) < len(tickets):
+            for ticket_id in tickets - set(outcomes):
+                payload = (await client.get(f"/api/hackathons/{hackathon_id}/applications/{ticket_id}")).json()
+                if payload["status"] != "queued":
+                    outcomes[ticket_id] = payload["status"]
+            await asyncio.sleep(0.01)
+        elapsed = time.perf_counter() - start
+    
+    await admission_queue.stop()
+    return {
+        "rejected": sum(1 for status_code, _ in responses if status_code != 202),
+        "submitted_seconds": submitted,
+        "elapsed": elapsed,
+        "accepted": sum(1 for outcome in outcomes.values() if outcome == "accepted"),
+        "failed": sum(1 for outcome in outcomes.values() if outcome == "failed"),
+        "batches": admission_queue.batches,
+        "write_seconds": admission_queue.write_seconds,
+    }
+
+def run_direct(hackathon_id: int, applications: list, concurrency: int) -> dict:
+    """One check-and-insert transaction per applicant, as a handler without the queue would do"""
+    def insert(body: dict) -> str:
+        db = SessionLocal()
+        try:
+            email = body["email"].strip().lower()
+            exists = db.query(Participant.id).filter(
+                Participant.hackathon_id == hackathon_id, func.lower(Participant.email) == email
+            ).first()
+            if exists:
+                return "duplicate"
+            db.add(Participant(
+                name=body["name"], email=email, region=body["region"], skills=body["skills"],
+                hackathon_id=hackathon_id
+            ))
+            db.commit()
+            return "accepted"
+        except Exception:
+            db.rollback()
+            return "failed"
+        finally:
+            db.close()
+    
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        outcomes = list(pool.map(insert, applications))
+    return {
+        "elapsed": time.perf_counter() - start,
+        "accepted": outcomes.count("accepted"),
+        "failed": outcomes.count("failed"),
+    }
+
+def stored_counts(hackathon_id: int) -> tuple:
+    """(rows, emails stored more than once) for a hackathon"""
+    db = SessionLocal()
+    try:
+        rows = db.query(func.count(Participant.id)).filter(Participant.hackathon_id == hackathon_id).scalar()
+        repeated = db.query(func.lower(Participant.email)).filter(
+            Participant.hackathon_id == hackathon_id
+        ).group_by(func.lower(Participant.email)).having(func.count(Participant.id) > 1).count()
+        return rows, repeated
+    finally:
+        db.close()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--applications", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--duplicates", type=float, default=0.1, help="Share of applications repeating an email")
+    args = parser.parse_args()
+    
+    queued_id, direct_id = seed()
+    applications = build_applications(args.applications, args.duplicates)
+    unique_emails = len({body["email"].lower() for body in applications})
+    
+    queued = asyncio.run(run_queued(queued_id, applications, args.concurrency))
+    direct = run_direct(direct_id, applications, min(args.concurrency, 64))
+    
+    print(f"{args.applications} applications, {unique_emails} unique emails, concurrency {args.concurrency}")
+    print(f"{'path':<26}{'seconds':>10}{'inserts/s':>12}{'stored':>9}{'repeated':>10}{'failed':>8}")
+    ok = True
+    for label, result, hackathon_id in (
+        ("admission queue", queued, queued_id),
+        ("transaction per request", direct, direct_id),
+    ):
+        rows, repeated = stored_counts(hackathon_id)
+        print(
+            f"{label:<26}{result['elapsed']:>10.2f}{rows / result['elapsed']:>12.0f}"
+            f"{rows:>9}{repeated:>10}{result['failed']:>8}"
+        )
+        if label == "admission queue":
+            ok = rows == unique_emails and repeated == 0 and result["failed"] == 0 and result["rejected"] == 0
+    
+    print(
+        f"queue: {queued['batches']} batches, all applications queued in {queued['submitted_seconds']:.2f}s, "
+        f"writer busy {queued['write_seconds']:.2f}s ({queued['accepted'] / queued['write_seconds']:.0f} inserts/s)"
+    )
+    if not ok:
+        print("FAIL: admission queue lost or duplicated applications")
+        sys.exit(1)
+    print("OK: every unique email stored exactly once, every ticket resolved")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Benchmark conditional GET and compression on the hackathon list/detail endpoints.
+
+Seeds a temporary SQLite database, then compares bytes on the wire and latency
+for plain, gzip-compressed and revalidated (304) requests.
+
+    python benchmarks/bench_http_cache.py [--hackathons 200] [--requests 50]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+# Use a throwaway database before the app modules create their engine
+_db_dir = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_db_dir, 'bench.db')}"
+
+# Add the backend directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.testclient import TestClient
+from main import app
+from utils.database import SessionLocal
+from models.database import User, Hackathon, Participant, Team
+from utils.auth import get_password_hash
+
+LOREM = (
+    "Build something amazing in 48 hours. Teams of up to four compete across "
+    "tracks covering AI, sustainability and fintech. "
+)
+
+def seed(hackathon_count: int):
+    """Create an organizer with hackathons that have long text and some children"""
+    db = SessionLocal()
+    try:
+        organizer = User(
+            email="organizer@hackathon.com",
+            username="organizer",
+            hashed_password=get_password_hash("organizer123"),
+            full_name="Event Organizer",
+            role="organizer",
+            is_active=True
+        )
+        db.add(organizer)
+        db.flush()
+        
+        now = datetime.utcnow()
+        for i in range(hackathon_count):
+            hackathon = Hackathon(
+                name=f"Hackathon {i}",
+                description=LOREM * 20,
+                rules=LOREM * 30,
+                start_date=now + timedelta(days=i),
+                end_date=now + timedelta(days=i + 2),
+                application_open=now,
+                application_close=now + timedelta(days=i),
+                prize_pool="$10,000",
+                submission_requirements="TBD",
+                communication_channels="TBD",
+                organizer_id=organizer.id
+            )
+            db.add(hackathon)
+            db.flush()
+            for j in range(5):
+                team = Team(name=f"Team {j}", hackathon_id=hackathon.id)
+                db.add(team)
+                db.add(Participant(name=f"P{j}", email=f"p{j}@x.com", hackathon_id=hackathon.id))
+        db.commit()
+    finally:
+        db.close()
+
+def measure(client: TestClient, url: str, headers: dict, requests: int):
+    """Return (status, wire bytes, mean latency in ms) for repeated GETs"""
+    wire_bytes = 0
+    status_code = None
+    start = time.perf_counter()
+    for _ in range(requests):
+        response = client.get(url, headers=headers)
+        status_code = response.status_code
+        # Content-Length reflects the encoded body that went over the wire
+        wire_bytes = int(response.headers.get("content-length", len(response.content)))
+    elapsed = (time.perf_counter() - start) / requests * 1000
+    return status_code, wire_bytes, elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--hackathons", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=50)
+    args = parser.parse_args()
+    
+    with TestClient(app) as client:
+        seed(args.hackathons)
+        token = client.post(
+            "/api/auth/login",
+            json={"email": "organizer@hackathon.com", "password": "organizer123"}
+        ).json()["access_token"]
+        auth = {"Authorization": f"Bearer {token}"}
+        
+        print(f"{'endpoint':<28}{'mode':<12}{'status':>8}{'bytes':>10}{'ms/req':>10}")
+        for label, url in (("list (size=100)", "/api/hackathons/?size=100"), ("detail", "/api/hackathons/1")):
+            etag = client.get(url, headers=auth).headers["etag"]
+            modes = (
+                ("identity", {**auth, "Accept-Encoding": "identity"}),
+                ("gzip", {**auth, "Accept-Encoding": "gzip"}),
+                ("304", {**auth, "Accept-Encoding": "gzip", "If-None-Match": etag}),
+            )
+            for mode, headers in modes:
+                status_code, wire_bytes, latency = measure(client, url, headers, args.requests)
+                print(f"{label:<28}{mode:<12}{status_code:>8}{wire_bytes:>10}{latency:>10.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Benchmark worker startup: import time of the app and time to first successful response.
+
+Each run starts a fresh interpreter. Startup is measured twice: against an empty
+database (schema gets created) and against a database that is already current
+(schema work must be skipped). Pass --max-warm-seconds to fail when the warm
+time to first response regresses past a budget.
+
+    python benchmarks/bench_startup.py [--runs 5] [--max-warm-seconds 3]
+"""
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that must never be imported while starting a worker
+HEAVY_MODULES = ("pandas", "alembic")
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def measure_import(env: dict) -> float:
+    """Seconds to import the app in a fresh interpreter"""
+    code = (
+        "import sys, time; t = time.perf_counter(); import main; "
+        "print(time.perf_counter() - t); "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], cwd=BACKEND_DIR, env=env,
+        capture_output=True, text=True, check=True
+    ).stdout.split("\n")
+    if output[1]:
+        print(f"warning: heavy modules imported at startup: {output[1]}")
+    return float(output[0])
+
+def measure_first_response(env: dict, timeout: float = 30) -> float:
+    """Seconds from spawning uvicorn until GET /health succeeds"""
+    port = _free_port()
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=BACKEND_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        while time.perf_counter() - start < timeout:
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}/health", timeout=1) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - start
+            except OSError:
+                time.sleep(0.01)
+        raise RuntimeError("server did not answer in time")
+    finally:
+        process.terminate()
+        process.wait()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-warm-seconds", type=float, default=None)
+    args = parser.parse_args()
+    
+    workdir = tempfile.mkdtemp()
+    env = dict(os.environ)
+    
+    imports = []
+    for _ in range(args.runs):
+        env["DATABASE_URL"] = f"sqlite:///{os.path.join(workdir, 'import.db')}"
+        imports.append(measure_import(env))
+    
+    cold, warm = [], []
+    for run in range(args.runs):
+        env["DATABASE_URL"] = f"sqlite:///{os.path.join(workdir, f'startup{run}.db')}"
+        cold.append(measure_first_response(env))
+        warm.append(measure_first_response(env))
+    
+    print(f"{'measurement':<34}{'median s':>10}{'max s':>10}")
+    for label, values in (
+        ("import main", imports),
+        ("first response, empty database", cold),
+        ("first response, current schema", warm),
+    ):
+        print(f"{label:<34}{statistics.median(values):>10.3f}{max(values):>10.3f}")
+    
+    if args.max_warm_seconds is not None and statistics.median(warm) > args.max_warm_seconds:
+        print(f"FAIL: warm startup above {args.max_warm_seconds}s budget")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
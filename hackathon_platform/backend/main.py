@@ -1,19 +1,44 @@
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 from fastapi.responses import JSONResponse
 import os
-from utils.database import create_tables
-from routers import auth, hackathons
+from utils.database import ensure_schema, SessionLocal
+from utils.revocation import revocation_list
+from utils.admission import admission_queue
+from utils.outbox import outbox_dispatcher
+from utils.events import hub
+from utils.http_cache import CompressionMiddleware, CachedStaticFiles
+from utils.landing import STATIC_DIR, LANDING_DIR
+from utils.storage import upload_pruner
+from utils.replicas import ReadYourWritesMiddleware
+from utils.idempotency import IdempotencyMiddleware
+from routers import auth, hackathons, submissions, judging, events, participants, dashboard, archive, applications, uploads, calendars
 
 # Lifespan event handler
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Startup
-    create_tables()
+    # Startup: skips schema work when the migrations are already applied
+    ensure_schema()
+    # Drop revocations of tokens that have expired anyway and load the rest
+    with SessionLocal() as db:
+        revocation_list.prune(db)
+    # Resumable uploads abandoned for longer than the session TTL, now and periodically
+    upload_pruner.start()
+    # Writer that drains public applications in batches
+    admission_queue.start()
+    # Change events published by other workers (only with a shared cache tier)
+    hub.start()
+    # Notification delivery from the outbox (only when SMTP is configured)
+    if outbox_dispatcher is not None:
+        outbox_dispatcher.start()
     yield
-    # Shutdown (if needed)
+    # Shutdown: write out applications that are still queued
+    await admission_queue.stop()
+    await hub.stop()
+    await upload_pruner.stop()
+    if outbox_dispatcher is not None:
+        await outbox_dispatcher.stop()
 
 # Create FastAPI app
 app = FastAPI(
@@ -25,6 +50,10 @@ app = FastAPI(
     redoc_url="/redoc"
 )
 
+# Replay responses of retried create requests that carry an Idempotency-Key.
+# Added first so it sits innermost and stores uncompressed responses.
+app.add_middleware(IdempotencyMiddleware)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -34,13 +63,28 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Mount static files
-if os.path.exists("static"):
-    app.mount("/static", StaticFiles(directory="static"), name="static")
+# Compress large JSON bodies (long descriptions/rules); small ones are not worth it
+app.add_middleware(CompressionMiddleware, minimum_size=int(os.getenv("GZIP_MINIMUM_SIZE", "1024")))
+
+# Keep users on the primary database right after they write (no-op without replicas)
+app.add_middleware(ReadYourWritesMiddleware)
+
+# Mount static files (pre-rendered landing pages live in static/landing)
+os.makedirs(LANDING_DIR, exist_ok=True)
+app.mount("/static", CachedStaticFiles(directory=STATIC_DIR), name="static")
 
 # Include routers
 app.include_router(auth.router, prefix="/api")
 app.include_router(hackathons.router, prefix="/api")
+app.include_router(submissions.router, prefix="/api")
+app.include_router(judging.router, prefix="/api")
+app.include_router(events.router, prefix="/api")
+app.include_router(participants.router, prefix="/api")
+app.include_router(dashboard.router, prefix="/api")
+app.include_router(archive.router, prefix="/api")
+app.include_router(applications.router, prefix="/api")
+app.include_router(uploads.router, prefix="/api")
+app.include_router(calendars.router, prefix="/api")
 
 # Root endpoint
 @app.get("/")
@@ -0,0 +1,280 @@
+"""baseline schema
+
+Revision ID: 0001
+Revises: 
+Create Date: 2026-10-19 12:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Databases created with create_all() before migrations existed already have
+    # some of these tables; only create the missing ones
+    existing_tables = set(sa.inspect(op.get_bind()).get_table_names())
+
+    if 'users' not in existing_tables:
+        op.create_table('users',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('email', sa.String(), nullable=False),
+        sa.Column('username', sa.String(), nullable=False),
+        sa.Column('hashed_password', sa.String(), nullable=False),
+        sa.Column('full_name', sa.String(), nullable=False),
+        sa.Column('role', sa.String(), nullable=False),
+        sa.Column('is_active', sa.Boolean(), nullable=True),
+        sa.Column('registration_date', sa.DateTime(), nullable=True),
+        sa.Column('last_login', sa.DateTime(), nullable=True),
+        sa.Column('profile_data', sa.JSON(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+        )
+        with op.batch_alter_table('users', schema=None) as batch_op:
+            batch_op.create_index(batch_op.f('ix_users_email'), ['email'], unique=True)
+            batch_op.create_index(batch_op.f('ix_users_id'), ['id'], unique=False)
+            batch_op.create_index(batch_op.f('ix_users_username'), ['username'], unique=True)
+
+    if 'activity_logs' not in existing_tables:
+        op.create_table('activity_logs',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('action', sa.String(), nullable=False),
+        sa.Column('resource_type', sa.String(), nullable=False),
+        sa.Column('resource_id', sa.Integer(), nullable=True),
+        sa.Column('details', sa.JSON(), nullable=True),
+        sa.Column('timestamp', sa.DateTime(), nullable=True),
+        sa.Column('ip_address', sa.String(), nullable=True),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+        with op.batch_alter_table('activity_logs', schema=None) as batch_op:
+            batch_op.create_index(batch_op.f('ix_activity_logs_id'), ['id'], unique=False)
+
+    if 'hackathons' not in existing_tables:
+        op.create_table('hackathons',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('description', sa.Text(), nullable=False),
+        sa.Column('type', sa.String(), nullable=True),
+        sa.Column('theme', sa.String(), nullable=True),
+        sa.Column('location', sa.String(), nullable=True),
+        sa.Column('start_date', sa.DateTime(), nullable=False),
+        sa.Column('end_date', sa.DateTime(), nullable=False),
+        sa.Column('application_open', sa.DateTime(), nullable=False),
+        sa.Column('application_close', sa.DateTime(), nullable=False),
+        sa.Column('application_start_date', sa.DateTime(), nullable=True),
+        sa.Column('application_end_date', sa.DateTime(), nullable=True),
+        sa.Column('prize_pool', sa.String(), nullable=False),
+        sa.Column('rules', sa.Text(), nullable=False),
+        sa.Column('eligibility', sa.Text(), nullable=True),
+        sa.Column('min_team_size', sa.Integer(), nullable=True),
+        sa.Column('max_team_size', sa.Integer(), nullable=True),
+        sa.Column('submission_requirements', sa.Text(), nullable=False),
+        sa.Column('evaluation_criteria', sa.Text(), nullable=True),
+        sa.Column('communication_channels', sa.Text(), nullable=False),
+        sa.Column('sponsors', sa.Text(), nullable=True),
+        sa.Column('status', sa.String(), nullable=True),
+        sa.Column('is_featured', sa.Boolean(), nullable=True),
+        sa.Column('landing_page_type', sa.String(), nullable=True),
+        sa.Column('custom_landing_url', sa.String(), nullable=True),
+        sa.Column('landing_color_scheme', sa.String(), nullable=True),
+        sa.Column('landing_logo_url', sa.String(), nullable=True),
+        sa.Column('has_sponsors', sa.Boolean(), nullable=True),
+        sa.Column('sponsors_data', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.Column('organizer_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['organizer_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+        with op.batch_alter_table('hackathons', schema=None) as batch_op:
+            batch_op.create_index(batch_op.f('ix_hackathons_id'), ['id'], unique=False)
+            batch_op.create_index(batch_op.f('ix_hackathons_name'), ['name'], unique=False)
+
+    if 'judges' not in existing_tables:
+        op.create_table('judges',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('email', sa.String(), nullable=False),
+        sa.Column('affiliation', sa.String(), nullable=True),
+        sa.Column('max_assignments', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('hackathon_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['hackathon_id'], ['hackathons.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+        with op.batch_alter_table('judges', schema=None) as batch_op:
+            batch_op.create_index(batch_op.f('ix_judges_hackathon_id'), ['hackathon_id'], unique=False)
+            batch_op.create_index(batch_op.f('ix_judges_id'), ['id'], unique=False)
+
+    if 'mentor_sessions' not in existing_tables:
+        op.create_table('mentor_sessions',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('mentor_name', sa.String(), nullable=False),
+        sa.Column('mentor_email', sa.String(), nullable=False),
+        sa.Column('session_topic', sa.String(), nullable=False),
+        sa.Column('session_date', sa.DateTime(), nullable=False),
+        sa.Column('duration_minutes', sa.Integer(), nullable=True),
+        sa.Column('max_participants', sa.Integer(), nullable=True),
+        sa.Column('registered_count', sa.Integer(), nullable=True),
+        sa.Column('meeting_link', sa.String(), nullable=True),
+        sa.Column('notes', sa.Text(), nullable=True),
+        sa.Column('hackathon_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['hackathon_id'], ['hackathons.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+        with op.batch_alter_table('mentor_sessions', schema=None) as batch_op:
+            batch_op.create_index(batch_op.f('ix_mentor_sessions_id'), ['id'], unique=False)
+
+    if 'sponsors' not in existing_tables:
+        op.create_table('sponsors',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('name_key', sa.String(), nullable=False),
+        sa.Column('tier', sa.String(), nullable=True),
+        sa.Column('logo_url', sa.String(), nullable=True),
+        sa.Column('banner_url', sa.String(), nullable=True),
+        sa.Column('website', sa.String(), nullable=True),
+        sa.Column('description', sa.Text(), nullable=True),
+        sa.Column('position', sa.Integer(), nullable=True),
+        sa.Column('hackathon_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['hackathon_id'], ['hackathons.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+        with op.batch_alter_table('sponsors', schema=None) as batch_op:
+            batch_op.create_index(batch_op.f('ix_sponsors_hackathon_id'), ['hackathon_id'], unique=False)
+            batch_op.create_index(batch_op.f('ix_sponsors_id'), ['id'], unique=False)
+            batch_op.create_index(batch_op.f('ix_sponsors_name_key'), ['name_key'], unique=False)
+
+    if 'teams' not in existing_tables:
+        op.create_table('teams',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('description', sa.Text(), nullable=True),
+        sa.Column('status', sa.String(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('hackathon_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['hackathon_id'], ['hackathons.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+        with op.batch_alter_table('teams', schema=None) as batch_op:
+            batch_op.create_index(batch_op.f('ix_teams_id'), ['id'], unique=False)
+
+    if 'participants' not in existing_tables:
+        op.create_table('participants',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('email', sa.String(), nullable=False),
+        sa.Column('university_company', sa.String(), nullable=True),
+        sa.Column('region', sa.String(), nullable=True),
+        sa.Column('skills', sa.JSON(), nullable=True),
+        sa.Column('registration_date', sa.DateTime(), nullable=True),
+        sa.Column('status', sa.String(), nullable=True),
+        sa.Column('hackathon_id', sa.Integer(), nullable=False),
+        sa.Column('team_id', sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(['hackathon_id'], ['hackathons.id'], ),
+        sa.ForeignKeyConstraint(['team_id'], ['teams.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+        with op.batch_alter_table('participants', schema=None) as batch_op:
+            batch_op.create_index(batch_op.f('ix_participants_id'), ['id'], unique=False)
+
+    if 'submissions' not in existing_tables:
+        op.create_table('submissions',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('title', sa.String(), nullable=False),
+        sa.Column('description', sa.Text(), nullable=False),
+        sa.Column('github_url', sa.String(), nullable=True),
+        sa.Column('demo_url', sa.String(), nullable=True),
+        sa.Column('presentation_url', sa.String(), nullable=True),
+        sa.Column('status', sa.String(), nullable=True),
+        sa.Column('score', sa.Float(), nullable=True),
+        sa.Column('feedback', sa.Text(), nullable=True),
+        sa.Column('submitted_at', sa.DateTime(), nullable=True),
+        sa.Column('evaluated_at', sa.DateTime(), nullable=True),
+        sa.Column('hackathon_id', sa.Integer(), nullable=False),
+        sa.Column('team_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['hackathon_id'], ['hackathons.id'], ),
+        sa.ForeignKeyConstraint(['team_id'], ['teams.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+        with op.batch_alter_table('submissions', schema=None) as batch_op:
+            batch_op.create_index(batch_op.f('ix_submissions_id'), ['id'], unique=False)
+
+    if 'judge_assignments' not in existing_tables:
+        op.create_table('judge_assignments',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('assigned_at', sa.DateTime(), nullable=True),
+        sa.Column('hackathon_id', sa.Integer(), nullable=False),
+        sa.Column('judge_id', sa.Integer(), nullable=False),
+        sa.Column('submission_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['hackathon_id'], ['hackathons.id'], ),
+        sa.ForeignKeyConstraint(['judge_id'], ['judges.id'], ),
+        sa.ForeignKeyConstraint(['submission_id'], ['submissions.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+        with op.batch_alter_table('judge_assignments', schema=None) as batch_op:
+            batch_op.create_index(batch_op.f('ix_judge_assignments_hackathon_id'), ['hackathon_id'], unique=False)
+            batch_op.create_index(batch_op.f('ix_judge_assignments_id'), ['id'], unique=False)
+            batch_op.create_index(batch_op.f('ix_judge_assignments_judge_id'), ['judge_id'], unique=False)
+            batch_op.create_index(batch_op.f('ix_judge_assignments_submission_id'), ['submission_id'], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('judge_assignments', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_judge_assignments_submission_id'))
+        batch_op.drop_index(batch_op.f('ix_judge_assignments_judge_id'))
+        batch_op.drop_index(batch_op.f('ix_judge_assignments_id'))
+        batch_op.drop_index(batch_op.f('ix_judge_assignments_hackathon_id'))
+
+    op.drop_table('judge_assignments')
+    with op.batch_alter_table('submissions', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_submissions_id'))
+
+    op.drop_table('submissions')
+    with op.batch_alter_table('participants', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_participants_id'))
+
+    op.drop_table('participants')
+    with op.batch_alter_table('teams', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_teams_id'))
+
+    op.drop_table('teams')
+    with op.batch_alter_table('sponsors', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_sponsors_name_key'))
+        batch_op.drop_index(batch_op.f('ix_sponsors_id'))
+        batch_op.drop_index(batch_op.f('ix_sponsors_hackathon_id'))
+
+    op.drop_table('sponsors')
+    with op.batch_alter_table('mentor_sessions', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_mentor_sessions_id'))
+
+    op.drop_table('mentor_sessions')
+    with op.batch_alter_table('judges', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_judges_id'))
+        batch_op.drop_index(batch_op.f('ix_judges_hackathon_id'))
+
+    op.drop_table('judges')
+    with op.batch_alter_table('hackathons', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_hackathons_name'))
+        batch_op.drop_index(batch_op.f('ix_hackathons_id'))
+
+    op.drop_table('hackathons')
+    with op.batch_alter_table('activity_logs', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_activity_logs_id'))
+
+    op.drop_table('activity_logs')
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_users_username'))
+        batch_op.drop_index(batch_op.f('ix_users_id'))
+        batch_op.drop_index(batch_op.f('ix_users_email'))
+
+    op.drop_table('users')
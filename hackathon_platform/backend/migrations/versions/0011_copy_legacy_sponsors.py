@@ -0,0 +1,118 @@
+"""copy legacy sponsors
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-19 21:00:00
+
+"""
+import json
+import logging
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from models.schemas import is_web_url, parse_sponsors_data
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0011'
+down_revision: Union[str, None] = '0010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 500
+URL_FIELDS = ('logo_url', 'banner_url', 'website')
+
+logger = logging.getLogger('alembic.runtime.migration')
+
+hackathons = sa.table(
+    'hackathons',
+    sa.column('id', sa.Integer),
+    sa.column('sponsors_data', sa.Text),
+)
+sponsors = sa.table(
+    'sponsors',
+    sa.column('hackathon_id', sa.Integer),
+    sa.column('name', sa.String),
+    sa.column('name_key', sa.String),
+    sa.column('tier', sa.String),
+    sa.column('logo_url', sa.String),
+    sa.column('banner_url', sa.String),
+    sa.column('website', sa.String),
+    sa.column('description', sa.Text),
+    sa.column('position', sa.Integer),
+)
+
+
+def _text(value):
+    return value.strip() if isinstance(value, str) and value.strip() else None
+
+
+def _sponsor_rows(hackathon_id, sponsors_data):
+    """Sponsor rows of one legacy JSON string; items without a name are dropped"""
+    rows = []
+    for item in parse_sponsors_data(sponsors_data):
+        if not isinstance(item, dict) or _text(item.get('name')) is None:
+            continue
+        name = _text(item['name'])
+        row = {
+            'hackathon_id': hackathon_id,
+            'name': name,
+            'name_key': name.lower(),
+            'tier': _text(item.get('tier')),
+            'description': _text(item.get('description')),
+            'position': len(rows),
+        }
+        for field in URL_FIELDS:
+            # The API only accepts http(s) links now; anything else would end up in landing pages
+            url = _text(item.get(field))
+            row[field] = url if url is not None and is_web_url(url) else None
+        rows.append(row)
+    return rows
+
+
+def upgrade() -> None:
+    connection = op.get_bind()
+    unreadable = []
+    last_id = 0
+    while True:
+        batch = connection.execute(
+            sa.select(hackathons.c.id, hackathons.c.sponsors_data)
+            .where(hackathons.c.id > last_id, hackathons.c.sponsors_data.isnot(None))
+            .order_by(hackathons.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not batch:
+            break
+        last_id = batch[-1].id
+
+        # Hackathons that already have rows were converted before this revision existed
+        converted = set(connection.execute(
+            sa.select(sponsors.c.hackathon_id)
+            .where(sponsors.c.hackathon_id.in_([row.id for row in batch]))
+            .distinct()
+        ).scalars())
+
+        rows = []
+        for hackathon_id, sponsors_data in batch:
+            if hackathon_id in converted:
+                continue
+            try:
+                rows.extend(_sponsor_rows(hackathon_id, sponsors_data))
+            except (ValueError, TypeError, json.JSONDecodeError):
+                unreadable.append(hackathon_id)
+        if rows:
+            connection.execute(sa.insert(sponsors), rows)
+
+    if unreadable:
+        # The legacy column is kept, so these can still be fixed by hand
+        logger.warning(
+            "sponsors_data of %d hackathon(s) is not valid JSON and was not copied: ids %s",
+            len(unreadable), ", ".join(str(hackathon_id) for hackathon_id in unreadable)
+        )
+
+
+def downgrade() -> None:
+    # The legacy column was never cleared, so there is nothing to copy back
+    pass
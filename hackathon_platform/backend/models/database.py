@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey, Float, JSON
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey, Float, JSON, Index, UniqueConstraint, LargeBinary, text
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from utils.database import Base
@@ -54,12 +54,12 @@ class Hackathon(Base):
     landing_color_scheme = Column(String, default="#1976d2")  # Keep as string for now
     landing_logo_url = Column(String, nullable=True)
     has_sponsors = Column(Boolean, default=False)
-    sponsors_data = Column(Text, nullable=True)  # JSON string of sponsor data
+    sponsors_data = Column(Text, nullable=True)  # Legacy JSON string, superseded by the sponsors table
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Foreign keys
-    organizer_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    organizer_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     
     # Relationships
     organizer = relationship("User", back_populates="organized_hackathons")
@@ -67,9 +67,34 @@ class Hackathon(Base):
     participants = relationship("Participant", back_populates="hackathon")
     submissions = relationship("Submission", back_populates="hackathon")
     mentor_sessions = relationship("MentorSession", back_populates="hackathon")
+    judges = relationship("Judge", back_populates="hackathon")
+    sponsor_list = relationship("Sponsor", back_populates="hackathon", order_by="Sponsor.position")
+
+class Sponsor(Base):
+    __tablename__ = "sponsors"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, nullable=False)
+    name_key = Column(String, nullable=False, index=True)  # Lower-cased name for filtering
+    tier = Column(String, nullable=True)  # 'platinum', 'gold', 'silver', 'bronze'
+    logo_url = Column(String, nullable=True)
+    banner_url = Column(String, nullable=True)
+    website = Column(String, nullable=True)
+    description = Column(Text, nullable=True)
+    position = Column(Integer, default=0)  # Display order on the landing page
+    
+    # Foreign keys
+    hackathon_id = Column(Integer, ForeignKey("hackathons.id"), nullable=False, index=True)
+    
+    # Relationships
+    hackathon = relationship("Hackathon", back_populates="sponsor_list")
 
 class Participant(Base):
     __tablename__ = "participants"
+    __table_args__ = (
+        # One application per email and hackathon, whatever the email's case
+        Index("uq_participants_hackathon_email", "hackathon_id", text("lower(email)"), unique=True),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False)
@@ -87,6 +112,25 @@ class Participant(Base):
     # Relationships
     hackathon = relationship("Hackathon", back_populates="participants")
     team = relationship("Team", back_populates="members")
+    skill_entries = relationship("ParticipantSkill", back_populates="participant")
+
+# Inverted index from a normalized skill to the participants that list it,
+# so skill filters and counts never scan the participants.skills JSON column
+class ParticipantSkill(Base):
+    __tablename__ = "participant_skills"
+    __table_args__ = (
+        Index("ix_participant_skills_hackathon_skill", "hackathon_id", "skill", "participant_id"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    skill = Column(String, nullable=False)  # Lower-cased, whitespace-collapsed skill name
+    
+    # Foreign keys
+    hackathon_id = Column(Integer, ForeignKey("hackathons.id"), nullable=False)
+    participant_id = Column(Integer, ForeignKey("participants.id"), nullable=False, index=True)
+    
+    # Relationships
+    participant = relationship("Participant", back_populates="skill_entries")
 
 class Team(Base):
     __tablename__ = "teams"
@@ -127,6 +171,7 @@ class Submission(Base):
     # Relationships
     hackathon = relationship("Hackathon", back_populates="submissions")
     team = relationship("Team", back_populates="submissions")
+    judge_assignments = relationship("JudgeAssignment", back_populates="submission")
 
 class MentorSession(Base):
     __tablename__ = "mentor_sessions"
@@ -141,13 +186,76 @@ class MentorSession(Base):
     registered_count = Column(Integer, default=0)
     meeting_link = Column(String, nullable=True)
     notes = Column(Text, nullable=True)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Foreign keys
-    hackathon_id = Column(Integer, ForeignKey("hackathons.id"), nullable=False)
+    hackathon_id = Column(Integer, ForeignKey("hackathons.id"), nullable=False, index=True)
     
     # Relationships
     hackathon = relationship("Hackathon", back_populates="mentor_sessions")
 
+class Judge(Base):
+    __tablename__ = "judges"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, nullable=False)
+    email = Column(String, nullable=False)
+    affiliation = Column(String, nullable=True)  # Compared with participants' university_company for conflicts
+    max_assignments = Column(Integer, nullable=True)  # Optional per-judge load cap
+    created_at = Column(DateTime, default=datetime.utcnow)
+    
+    # Foreign keys
+    hackathon_id = Column(Integer, ForeignKey("hackathons.id"), nullable=False, index=True)
+    
+    # Relationships
+    hackathon = relationship("Hackathon", back_populates="judges")
+    assignments = relationship("JudgeAssignment", back_populates="judge")
+
+class JudgeAssignment(Base):
+    __tablename__ = "judge_assignments"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    assigned_at = Column(DateTime, default=datetime.utcnow)
+    
+    # Foreign keys
+    hackathon_id = Column(Integer, ForeignKey("hackathons.id"), nullable=False, index=True)
+    judge_id = Column(Integer, ForeignKey("judges.id"), nullable=False, index=True)
+    submission_id = Column(Integer, ForeignKey("submissions.id"), nullable=False, index=True)
+    
+    # Relationships
+    judge = relationship("Judge", back_populates="assignments")
+    submission = relationship("Submission", back_populates="judge_assignments")
+
+class RevokedToken(Base):
+    __tablename__ = "revoked_tokens"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    jti = Column(String, unique=True, index=True, nullable=False)
+    token_type = Column(String, nullable=False)  # 'access' or 'refresh'
+    expires_at = Column(DateTime, nullable=False, index=True)  # Row can be pruned after this
+    revoked_at = Column(DateTime, default=datetime.utcnow, index=True)  # Other workers sync on this
+    
+    # Foreign keys
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
+
+# Pre-aggregated event counts per time bucket, maintained as rows are written.
+# hackathon_id/organizer_id are plain columns so history outlives deleted hackathons.
+class MetricRollup(Base):
+    __tablename__ = "metric_rollups"
+    __table_args__ = (
+        UniqueConstraint("metric", "granularity", "bucket_start", "hackathon_id", "dimension", name="uq_metric_rollups_bucket"),
+        Index("ix_metric_rollups_lookup", "metric", "granularity", "bucket_start"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    metric = Column(String, nullable=False)  # 'registrations', 'submissions', 'hackathons', 'status_changes'
+    granularity = Column(String, nullable=False)  # 'minute', 'hour', 'day'
+    bucket_start = Column(DateTime, nullable=False)
+    dimension = Column(String, nullable=False, default="")  # Breakdown value, e.g. the new status
+    value = Column(Integer, nullable=False, default=0)
+    hackathon_id = Column(Integer, nullable=False)
+    organizer_id = Column(Integer, nullable=False, index=True)
+
 class ActivityLog(Base):
     __tablename__ = "activity_logs"
     
@@ -164,3 +272,102 @@ class ActivityLog(Base):
     
     # Relationships
     user = relationship("User", back_populates="activity_logs")
+
+# Transactional outbox: notifications are written in the same transaction as
+# the change that causes them and delivered later by utils/outbox.py
+class OutboxMessage(Base):
+    __tablename__ = "outbox_messages"
+    __table_args__ = (
+        Index("ix_outbox_messages_due", "status", "next_attempt_at"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    kind = Column(String, nullable=False)  # e.g. 'participant.status_changed', 'hackathon.updated'
+    recipient = Column(String, nullable=False)
+    subject = Column(String, nullable=False)
+    body = Column(Text, nullable=False)
+    status = Column(String, nullable=False, default="pending")  # 'pending', 'sending', 'sent', 'failed'
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    claimed_by = Column(String, nullable=True)
+    claimed_until = Column(DateTime, nullable=True)  # Lease; expired leases are claimed again
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    sent_at = Column(DateTime, nullable=True)
+    hackathon_id = Column(Integer, nullable=True, index=True)
+
+# Uploaded files in content-addressed storage (see utils/storage.py); identical
+# bytes are stored once, however many times they are uploaded
+class StoredFile(Base):
+    __tablename__ = "stored_files"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    sha256 = Column(String(64), unique=True, index=True, nullable=False)
+    size = Column(Integer, nullable=False)
+    content_type = Column(String, nullable=False, default="application/octet-stream")
+    created_at = Column(DateTime, default=datetime.utcnow)
+    uploaded_by = Column(Integer, ForeignKey("users.id"), nullable=True)
+
+# Resumable upload in progress: bytes are appended to a partial file until the
+# session is completed and the file moves into content-addressed storage
+class UploadSession(Base):
+    __tablename__ = "upload_sessions"
+    
+    id = Column(String(32), primary_key=True)
+    filename = Column(String, nullable=True)
+    content_type = Column(String, nullable=False, default="application/octet-stream")
+    total_size = Column(Integer, nullable=True)  # Declared up front when known
+    received_size = Column(Integer, nullable=False, default=0)
+    expected_sha256 = Column(String(64), nullable=True)
+    status = Column(String, nullable=False, default="open")  # 'open', 'appending', 'completing', 'completed'
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, index=True)
+    owner_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    file_id = Column(Integer, ForeignKey("stored_files.id"), nullable=True)
+
+class SubmissionArtifact(Base):
+    __tablename__ = "submission_artifacts"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    filename = Column(String, nullable=False)
+    kind = Column(String, nullable=False, default="other")  # 'video', 'slides', 'archive', 'image', 'other'
+    created_at = Column(DateTime, default=datetime.utcnow)
+    
+    # Foreign keys
+    hackathon_id = Column(Integer, ForeignKey("hackathons.id"), nullable=False, index=True)
+    submission_id = Column(Integer, ForeignKey("submissions.id"), nullable=False, index=True)
+    file_id = Column(Integer, ForeignKey("stored_files.id"), nullable=False)
+    
+    # Relationships
+    file = relationship("StoredFile")
+
+# Cold storage for past hackathons: one row per event with all of its child
+# rows in a zlib-compressed JSON document (see utils/archival.py)
+class ArchivedHackathon(Base):
+    __tablename__ = "archived_hackathons"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    hackathon_id = Column(Integer, nullable=False, index=True)  # Id the hackathon had when live
+    name = Column(String, nullable=False)
+    status = Column(String, nullable=False)
+    start_date = Column(DateTime, nullable=False)
+    end_date = Column(DateTime, nullable=False, index=True)
+    participant_count = Column(Integer, default=0)
+    team_count = Column(Integer, default=0)
+    submission_count = Column(Integer, default=0)
+    payload = Column(LargeBinary, nullable=False)
+    payload_size = Column(Integer, nullable=False)  # Uncompressed JSON size in bytes
+    archived_at = Column(DateTime, default=datetime.utcnow)
+    organizer_id = Column(Integer, nullable=False, index=True)
+
+class ArchivedActivityLog(Base):
+    __tablename__ = "archived_activity_logs"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    action = Column(String, nullable=False)
+    resource_type = Column(String, nullable=False)
+    resource_id = Column(Integer, nullable=True)
+    details = Column(JSON, nullable=True)
+    timestamp = Column(DateTime, nullable=True, index=True)
+    ip_address = Column(String, nullable=True)
+    user_id = Column(Integer, nullable=False, index=True)
@@ -1,4 +1,6 @@
-from pydantic import BaseModel, EmailStr
+import json
+from urllib.parse import urlsplit
+from pydantic import BaseModel, EmailStr, field_validator
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from enum import Enum
@@ -28,6 +30,26 @@ class SubmissionStatus(str, Enum):
     UNDER_REVIEW = "under_review"
     EVALUATED = "evaluated"
 
+class TimeSeriesMetric(str, Enum):
+    REGISTRATIONS = "registrations"
+    SUBMISSIONS = "submissions"
+    HACKATHONS = "hackathons"
+    STATUS_CHANGES = "status_changes"
+
+class TimeSeriesGranularity(str, Enum):
+    MINUTE = "minute"
+    HOUR = "hour"
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+
+class ArtifactKind(str, Enum):
+    VIDEO = "video"
+    SLIDES = "slides"
+    ARCHIVE = "archive"
+    IMAGE = "image"
+    OTHER = "other"
+
 # Authentication Models
 class UserLogin(BaseModel):
     email: EmailStr
@@ -59,6 +81,14 @@ class TokenResponse(BaseModel):
     token_type: str
     user: UserResponse
     expires_in: int
+    refresh_token: Optional[str] = None
+    refresh_expires_in: Optional[int] = None
+
+class RefreshRequest(BaseModel):
+    refresh_token: str
+
+class LogoutRequest(BaseModel):
+    refresh_token: Optional[str] = None
 
 # Dashboard Models
 class DashboardMetrics(BaseModel):
@@ -91,6 +121,55 @@ class DashboardResponse(BaseModel):
     recent_activities: List[Dict[str, Any]]
     filters: DashboardFilters
 
+def is_web_url(value: str) -> bool:
+    """Whether a link is http(s) or a path on this site, so it cannot run script in a page"""
+    # Browsers drop whitespace and control characters inside a scheme ("java\tscript:")
+    if any(ord(char) <= 0x20 or ord(char) == 0x7f for char in value) or "\\" in value:
+        return False
+    if value.startswith("/") and not value.startswith("//"):
+        return True
+    parts = urlsplit(value)
+    return parts.scheme.lower() in ("http", "https") and bool(parts.netloc)
+
+def check_web_url(value):
+    """Validator for optional link fields that end up in landing pages"""
+    if value is not None and value != "" and not is_web_url(value):
+        raise ValueError("must be an http(s) URL")
+    return value
+
+# Sponsor Models
+class SponsorBase(BaseModel):
+    name: str
+    tier: Optional[str] = None
+    logo_url: Optional[str] = None
+    banner_url: Optional[str] = None
+    website: Optional[str] = None
+    description: Optional[str] = None
+
+class SponsorCreate(SponsorBase):
+    _check_urls = field_validator("logo_url", "banner_url", "website")(check_web_url)
+
+class SponsorResponse(SponsorBase):
+    id: int
+    position: int
+    
+    class Config:
+        from_attributes = True
+
+def parse_sponsors_data(value):
+    """Accept sponsors as a list or as the legacy JSON string sent by older clients"""
+    if isinstance(value, str):
+        value = json.loads(value) if value.strip() else []
+    if isinstance(value, list):
+        items = []
+        for item in value:
+            if isinstance(item, dict) and "logo_url" not in item and "logo" in item:
+                # Older clients send {name, logo}
+                item = {**item, "logo_url": item["logo"]}
+            items.append(item)
+        return items
+    return value
+
 # Hackathon Models
 class HackathonBase(BaseModel):
     name: str
@@ -119,7 +198,9 @@ class HackathonBase(BaseModel):
     landing_color_scheme: Optional[str] = "#1976d2"  # Keep as string for now
     landing_logo_url: Optional[str] = None
     has_sponsors: Optional[bool] = False
-    sponsors_data: Optional[str] = None  # JSON string for now
+    sponsors_data: Optional[List[SponsorCreate]] = None
+    
+    _parse_sponsors = field_validator("sponsors_data", mode="before")(parse_sponsors_data)
 
 class HackathonCreate(BaseModel):
     name: str
@@ -144,7 +225,10 @@ class HackathonCreate(BaseModel):
     landing_color_scheme: Optional[str] = "#1976d2"
     landing_logo_url: Optional[str] = None
     has_sponsors: Optional[bool] = False
-    sponsors_data: Optional[str] = None
+    sponsors_data: Optional[List[SponsorCreate]] = None
+    
+    _parse_sponsors = field_validator("sponsors_data", mode="before")(parse_sponsors_data)
+    _check_urls = field_validator("custom_landing_url", "landing_logo_url")(check_web_url)
 
 class HackathonUpdate(BaseModel):
     name: Optional[str] = None
@@ -175,7 +259,10 @@ class HackathonUpdate(BaseModel):
     landing_color_scheme: Optional[str] = None
     landing_logo_url: Optional[str] = None
     has_sponsors: Optional[bool] = None
-    sponsors_data: Optional[str] = None
+    sponsors_data: Optional[List[SponsorCreate]] = None  # Replaces the sponsor list when given
+    
+    _parse_sponsors = field_validator("sponsors_data", mode="before")(parse_sponsors_data)
+    _check_urls = field_validator("custom_landing_url", "landing_logo_url")(check_web_url)
 
 class HackathonResponse(BaseModel):
     id: int
@@ -207,7 +294,7 @@ class HackathonResponse(BaseModel):
     landing_color_scheme: Optional[str] = None
     landing_logo_url: Optional[str] = None
     has_sponsors: Optional[bool] = None
-    sponsors_data: Optional[str] = None
+    sponsors_data: List[SponsorResponse] = []
     
     class Config:
         from_attributes = True
@@ -220,6 +307,27 @@ class HackathonListResponse(BaseModel):
     has_next: bool
     has_prev: bool
 
+class HackathonBatchRequest(BaseModel):
+    ids: List[int]
+
+class HackathonBatchItem(BaseModel):
+    id: int
+    status: str  # 'ok', 'not_found' or 'forbidden'
+    hackathon: Optional[HackathonResponse] = None
+
+class HackathonBatchResponse(BaseModel):
+    results: List[HackathonBatchItem]
+
+class HackathonSuggestion(BaseModel):
+    id: int
+    name: str
+    theme: Optional[str] = None
+    organizer_name: Optional[str] = None
+
+class HackathonAutocompleteResponse(BaseModel):
+    query: str
+    suggestions: List[HackathonSuggestion]
+
 # Generic Response Models
 class SuccessResponse(BaseModel):
     success: bool
@@ -230,3 +338,211 @@ class ErrorResponse(BaseModel):
     success: bool = False
     message: str
     details: Optional[str] = None
+
+# Leaderboard Models
+class ScoreUpdate(BaseModel):
+    score: float
+    feedback: Optional[str] = None
+
+class LeaderboardEntry(BaseModel):
+    rank: int
+    team_id: int
+    team_name: str
+    score: float
+
+class LeaderboardResponse(BaseModel):
+    hackathon_id: int
+    total_teams: int
+    entries: List[LeaderboardEntry]
+
+# Judging Models
+class JudgeCreate(BaseModel):
+    name: str
+    email: EmailStr
+    affiliation: Optional[str] = None
+    max_assignments: Optional[int] = None
+
+class JudgeResponse(BaseModel):
+    id: int
+    hackathon_id: int
+    name: str
+    email: str
+    affiliation: Optional[str] = None
+    max_assignments: Optional[int] = None
+    created_at: datetime
+    
+    class Config:
+        from_attributes = True
+
+class JudgeExclusion(BaseModel):
+    judge_id: int
+    team_id: int
+
+class JudgeScheduleRequest(BaseModel):
+    reviews_per_submission: int = 3
+    judge_ids: Optional[List[int]] = None  # Defaults to every judge of the hackathon
+    exclusions: List[JudgeExclusion] = []
+    replace_existing: bool = False  # Reschedule submissions that are already under review
+
+class JudgeLoad(BaseModel):
+    judge_id: int
+    name: str
+    assignments: int
+
+class JudgeScheduleResponse(BaseModel):
+    scheduled_submissions: int
+    total_assignments: int
+    reviews_per_submission: int
+    judge_loads: List[JudgeLoad]
+
+class JudgeAssignmentResponse(BaseModel):
+    submission_id: int
+    title: str
+    status: str
+    assigned_at: datetime
+
+# Participant Models
+class ParticipantResponse(BaseModel):
+    id: int
+    hackathon_id: int
+    name: str
+    email: str
+    university_company: Optional[str] = None
+    region: Optional[str] = None
+    skills: List[str] = []
+    registration_date: Optional[datetime] = None
+    status: str
+    team_id: Optional[int] = None
+    
+    class Config:
+        from_attributes = True
+
+    @field_validator("skills", mode="before")
+    @classmethod
+    def _skills_list(cls, value):
+        return value or []
+
+class ParticipantStatusUpdate(BaseModel):
+    status: ParticipantStatus
+
+class ApplicationCreate(BaseModel):
+    name: str
+    email: EmailStr
+    university_company: Optional[str] = None
+    region: Optional[str] = None
+    skills: List[str] = []
+
+class ApplicationTicket(BaseModel):
+    ticket_id: str
+    hackathon_id: int
+    status: str  # 'queued', 'accepted', 'duplicate', 'failed'
+    participant_id: Optional[int] = None
+    detail: Optional[str] = None
+
+class FacetCount(BaseModel):
+    value: str
+    count: int
+
+class ParticipantFacets(BaseModel):
+    status: List[FacetCount]
+    region: List[FacetCount]
+    university_company: List[FacetCount]
+    skills: List[FacetCount]
+
+class ParticipantListResponse(BaseModel):
+    participants: List[ParticipantResponse]
+    total: int
+    page: int
+    size: int
+    has_next: bool
+    has_prev: bool
+    facets: ParticipantFacets
+
+# Archive Models
+class ArchivedHackathonSummary(BaseModel):
+    hackathon_id: int
+    organizer_id: int
+    name: str
+    status: str
+    start_date: datetime
+    end_date: datetime
+    participant_count: int
+    team_count: int
+    submission_count: int
+    archived_at: datetime
+    
+    class Config:
+        from_attributes = True
+
+class ArchivedHackathonDetail(ArchivedHackathonSummary):
+    data: Dict[str, Any]  # Hackathon row and child rows keyed by table name
+
+class ArchivedHackathonListResponse(BaseModel):
+    hackathons: List[ArchivedHackathonSummary]
+    total: int
+    page: int
+    size: int
+    has_next: bool
+    has_prev: bool
+
+class ArchivedActivityLogResponse(BaseModel):
+    id: int
+    action: str
+    resource_type: str
+    resource_id: Optional[int] = None
+    details: Optional[Any] = None
+    timestamp: Optional[datetime] = None
+    ip_address: Optional[str] = None
+    user_id: int
+    
+    class Config:
+        from_attributes = True
+
+class ArchivedActivityLogListResponse(BaseModel):
+    logs: List[ArchivedActivityLogResponse]
+    total: int
+    page: int
+    size: int
+    has_next: bool
+    has_prev: bool
+
+# Upload Models
+class StoredFileResponse(BaseModel):
+    sha256: str
+    size: int
+    content_type: str
+    url: str
+    created_at: Optional[datetime] = None
+
+class UploadSessionCreate(BaseModel):
+    filename: Optional[str] = None
+    content_type: Optional[str] = None
+    total_size: Optional[int] = None
+    sha256: Optional[str] = None
+
+class UploadSessionResponse(BaseModel):
+    upload_id: str
+    status: str  # 'open', 'appending', 'completing', 'completed'
+    received_size: int
+    total_size: Optional[int] = None
+    chunk_size: int
+    file: Optional[StoredFileResponse] = None
+
+class SubmissionArtifactCreate(BaseModel):
+    file_sha256: str
+    filename: str
+    kind: ArtifactKind = ArtifactKind.OTHER
+
+class SubmissionArtifactResponse(BaseModel):
+    id: int
+    submission_id: int
+    filename: str
+    kind: str
+    created_at: Optional[datetime] = None
+    file: StoredFileResponse
+
+class HackathonLogoUpdate(BaseModel):
+    file_sha256: str
+
+class CalendarSubscriptionResponse(BaseModel):
+    organizer_feed_url: str
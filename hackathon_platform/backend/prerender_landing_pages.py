@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Script to pre-render every hackathon landing page into static/landing
+"""
+import sys
+import os
+
+# Add the backend directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy.orm import selectinload
+from utils.database import SessionLocal
+from models.database import Hackathon
+from utils.landing import LANDING_DIR, prerender_landing, remove_landing
+
+BATCH_SIZE = 200
+
+def prerender_landing_pages():
+    """Render pages whose content changed and drop files of hackathons that no longer exist"""
+    db = SessionLocal()
+    rendered = 0
+    unchanged = 0
+    seen = set()
+    last_id = 0
+    
+    try:
+        while True:
+            hackathons = (
+                db.query(Hackathon)
+                .options(selectinload(Hackathon.sponsor_list))
+                .filter(Hackathon.id > last_id)
+                .order_by(Hackathon.id)
+                .limit(BATCH_SIZE)
+                .all()
+            )
+            if not hackathons:
+                break
+            last_id = hackathons[-1].id
+            
+            for hackathon in hackathons:
+                seen.add(hackathon.id)
+                if prerender_landing(hackathon):
+                    rendered += 1
+                else:
+                    unchanged += 1
+            db.expunge_all()
+        
+        orphans = set()
+        for name in os.listdir(LANDING_DIR) if os.path.isdir(LANDING_DIR) else []:
+            prefix = name.split(".", 1)[0]
+            if prefix.isdigit() and int(prefix) not in seen:
+                orphans.add(int(prefix))
+        for hackathon_id in orphans:
+            remove_landing(hackathon_id)
+        
+        print(f"Rendered {rendered} landing pages ({unchanged} unchanged, {len(orphans)} removed)")
+        
+    except Exception as e:
+        print(f"Error rendering landing pages: {str(e)}")
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    print("Pre-rendering landing pages...")
+    prerender_landing_pages()
+    print("Landing pages complete!")
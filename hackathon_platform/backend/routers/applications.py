@@ -0,0 +1,117 @@
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy.orm import Session
+from datetime import datetime
+from utils.replicas import get_read_db
+from utils.cache import cache
+from utils.admission import admission_queue, Application, AdmissionQueueFull, Ticket
+from models.database import Hackathon
+from models.schemas import ApplicationCreate, ApplicationTicket
+
+router = APIRouter(prefix="/hackathons", tags=["applications"])
+
+# Seconds the application window of a hackathon stays cached (writes evict it sooner)
+APPLICATION_WINDOW_CACHE_TTL = 60
+# Seconds a client is asked to wait when the admission queue is full
+QUEUE_FULL_RETRY_AFTER = 5
+
+def _application_window(db: Session, hackathon_id: int):
+    """Organizer and application window of a hackathon, cached so a surge does not hit the database"""
+    cache_key = f"application_window:{hackathon_id}"
+    window = cache.get(cache_key)
+    if window is not None:
+        return window
+    
+    hackathon = db.query(
+        Hackathon.organizer_id, Hackathon.status,
+        Hackathon.application_start_date, Hackathon.application_end_date,
+        Hackathon.application_open, Hackathon.application_close
+    ).filter(Hackathon.id == hackathon_id).first()
+    if hackathon is None:
+        return None
+    
+    # The new window columns are optional; fall back to the legacy ones
+    opens_at = hackathon.application_start_date or hackathon.application_open
+    closes_at = hackathon.application_end_date or hackathon.application_close
+    window = {
+        "organizer_id": hackathon.organizer_id,
+        "status": hackathon.status,
+        "opens_at": opens_at.isoformat() if opens_at else None,
+        "closes_at": closes_at.isoformat() if closes_at else None,
+    }
+    cache.set(cache_key, window, ttl=APPLICATION_WINDOW_CACHE_TTL)
+    return window
+
+def _to_ticket_response(ticket: Ticket) -> ApplicationTicket:
+    return ApplicationTicket(
+        ticket_id=ticket.id,
+        hackathon_id=ticket.hackathon_id,
+        status=ticket.status,
+        participant_id=ticket.participant_id,
+        detail=ticket.detail
+    )
+
+@router.post("/{hackathon_id}/apply", response_model=ApplicationTicket, status_code=status.HTTP_202_ACCEPTED)
+async def apply_to_hackathon(
+    hackathon_id: int,
+    application_data: ApplicationCreate,
+    db: Session = Depends(get_read_db)
+):
+    """Queue an application to a hackathon (public endpoint); poll the returned ticket"""
+    try:
+        window = _application_window(db, hackathon_id)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to submit application: {str(e)}"
+        )
+    finally:
+        # Nothing else needs the session; release it before queueing
+        db.close()
+    
+    if window is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Hackathon not found"
+        )
+    
+    now = datetime.utcnow()
+    opens_at = datetime.fromisoformat(window["opens_at"]) if window["opens_at"] else None
+    closes_at = datetime.fromisoformat(window["closes_at"]) if window["closes_at"] else None
+    if window["status"] == "past" or (opens_at and now < opens_at) or (closes_at and now > closes_at):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Applications for this hackathon are not open"
+        )
+    
+    try:
+        ticket = admission_queue.submit(Application(
+            hackathon_id=hackathon_id,
+            organizer_id=window["organizer_id"],
+            name=application_data.name,
+            email=application_data.email,
+            university_company=application_data.university_company,
+            region=application_data.region,
+            skills=application_data.skills
+        ))
+    except AdmissionQueueFull:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many applications right now, please retry shortly",
+            headers={"Retry-After": str(QUEUE_FULL_RETRY_AFTER)}
+        )
+    
+    return _to_ticket_response(ticket)
+
+@router.get("/{hackathon_id}/applications/{ticket_id}", response_model=ApplicationTicket)
+async def get_application_ticket(hackathon_id: int, ticket_id: str, response: Response):
+    """Get the outcome of a queued application (public endpoint)"""
+    ticket = admission_queue.get_ticket(ticket_id)
+    if ticket is None or ticket.hackathon_id != hackathon_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Ticket not found or expired"
+        )
+    
+    if ticket.status == "queued":
+        response.headers["Retry-After"] = "1"
+    return _to_ticket_response(ticket)
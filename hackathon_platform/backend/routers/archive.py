@@ -0,0 +1,145 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+from typing import Optional
+from datetime import datetime
+from utils.replicas import get_read_db
+from utils.archival import decode_payload
+from models.database import ArchivedHackathon, ArchivedActivityLog, User
+from models.schemas import (
+    ArchivedHackathonSummary, ArchivedHackathonDetail, ArchivedHackathonListResponse,
+    ArchivedActivityLogResponse, ArchivedActivityLogListResponse
+)
+from utils.auth import get_current_active_user
+
+router = APIRouter(prefix="/archive", tags=["archive"])
+
+@router.get("/hackathons", response_model=ArchivedHackathonListResponse)
+async def get_archived_hackathons(
+    page: int = Query(1, ge=1),
+    size: int = Query(10, ge=1, le=100),
+    search: Optional[str] = None,
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_read_db)
+):
+    """List archived hackathons (payloads are not loaded)"""
+    try:
+        query = db.query(ArchivedHackathon).with_entities(
+            *[ArchivedHackathon.__table__.c[field] for field in ArchivedHackathonSummary.model_fields]
+        )
+        
+        # Organizers only see their own events
+        if current_user.role == "organizer":
+            query = query.filter(ArchivedHackathon.organizer_id == current_user.id)
+        if search:
+            query = query.filter(ArchivedHackathon.name.contains(search))
+        
+        total = query.count()
+        rows = (
+            query.order_by(ArchivedHackathon.end_date.desc(), ArchivedHackathon.id.desc())
+            .offset((page - 1) * size)
+            .limit(size)
+            .all()
+        )
+        
+        return ArchivedHackathonListResponse(
+            hackathons=[ArchivedHackathonSummary(**row._asdict()) for row in rows],
+            total=total,
+            page=page,
+            size=size,
+            has_next=(page * size) < total,
+            has_prev=page > 1
+        )
+        
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to fetch archived hackathons: {str(e)}"
+        )
+
+@router.get("/hackathons/{hackathon_id}", response_model=ArchivedHackathonDetail)
+async def get_archived_hackathon(
+    hackathon_id: int,
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_read_db)
+):
+    """Get an archived hackathon with all of its archived child records"""
+    try:
+        archived = (
+            db.query(ArchivedHackathon)
+            .filter(ArchivedHackathon.hackathon_id == hackathon_id)
+            .order_by(ArchivedHackathon.id.desc())
+            .first()
+        )
+        
+        if not archived:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Archived hackathon not found"
+            )
+        
+        # Check access permissions
+        if current_user.role == "organizer" and archived.organizer_id != current_user.id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Access denied"
+            )
+        
+        summary = ArchivedHackathonSummary.model_validate(archived)
+        return ArchivedHackathonDetail(**summary.model_dump(), data=decode_payload(archived.payload))
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to fetch archived hackathon: {str(e)}"
+        )
+
+@router.get("/activity-logs", response_model=ArchivedActivityLogListResponse)
+async def get_archived_activity_logs(
+    page: int = Query(1, ge=1),
+    size: int = Query(50, ge=1, le=500),
+    user_id: Optional[int] = None,
+    resource_type: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_read_db)
+):
+    """List archived activity logs; organizers only see their own"""
+    try:
+        query = db.query(ArchivedActivityLog)
+        
+        if current_user.role == "organizer":
+            query = query.filter(ArchivedActivityLog.user_id == current_user.id)
+        elif user_id is not None:
+            query = query.filter(ArchivedActivityLog.user_id == user_id)
+        if resource_type:
+            query = query.filter(ArchivedActivityLog.resource_type == resource_type)
+        if start_date:
+            query = query.filter(ArchivedActivityLog.timestamp >= start_date)
+        if end_date:
+            query = query.filter(ArchivedActivityLog.timestamp <= end_date)
+        
+        total = query.count()
+        logs = (
+            query.order_by(ArchivedActivityLog.timestamp.desc(), ArchivedActivityLog.id.desc())
+            .offset((page - 1) * size)
+            .limit(size)
+            .all()
+        )
+        
+        return ArchivedActivityLogListResponse(
+            logs=[ArchivedActivityLogResponse.model_validate(log) for log in logs],
+            total=total,
+            page=page,
+            size=size,
+            has_next=(page * size) < total,
+            has_prev=page > 1
+        )
+        
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to fetch archived activity logs: {str(e)}"
+        )
@@ -1,18 +1,59 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.security import HTTPBearer
+import math
+from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
 from utils.database import get_db
-from utils.auth import authenticate_user, create_access_token, get_password_hash, ACCESS_TOKEN_EXPIRE_MINUTES
+from utils.auth import (
+    authenticate_user, create_access_token, create_refresh_token, decode_token, token_expiry,
+    get_password_hash, get_current_active_user, ACCESS_TOKEN_EXPIRE_MINUTES, REFRESH_TOKEN_EXPIRE_DAYS
+)
+from utils.rate_limit import check_login_rate, client_address, login_rate_metrics, record_login_success
+from utils.revocation import revocation_list
 from models.database import User
-from models.schemas import UserLogin, UserCreate, UserResponse, TokenResponse
+from models.schemas import UserLogin, UserCreate, UserResponse, TokenResponse, RefreshRequest, LogoutRequest
 
 router = APIRouter(prefix="/auth", tags=["authentication"])
 security = HTTPBearer()
 
+def _issue_tokens(user: User) -> TokenResponse:
+    """Create a fresh access/refresh token pair for a user"""
+    access_token = create_access_token(
+        data={"sub": user.username}, expires_delta=timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    )
+    refresh_token = create_refresh_token(data={"sub": user.username})
+    
+    return TokenResponse(
+        access_token=access_token,
+        token_type="bearer",
+        user=UserResponse(
+            id=user.id,
+            email=user.email,
+            username=user.username,
+            full_name=user.full_name,
+            role=user.role,
+            is_active=user.is_active,
+            registration_date=user.registration_date,
+            last_login=user.last_login
+        ),
+        expires_in=ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+        refresh_token=refresh_token,
+        refresh_expires_in=REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
+    )
+
 @router.post("/login", response_model=TokenResponse)
-async def login(user_data: UserLogin, db: Session = Depends(get_db)):
+async def login(user_data: UserLogin, request: Request, db: Session = Depends(get_db)):
     """Authenticate user and return access token"""
+    # Throttle per IP and per account before any database or bcrypt work
+    allowed, retry_after = check_login_rate(client_address(request), user_data.email)
+    if not allowed:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many login attempts, please try again later",
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+        )
+    
     try:
         # Authenticate user
         user = authenticate_user(db, user_data.email, user_data.password)
@@ -29,41 +70,97 @@ async def login(user_data: UserLogin, db: Session = Depends(get_db)):
                 detail="User account is inactive"
             )
         
-        # Create access token
-        access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-        access_token = create_access_token(
-            data={"sub": user.username}, expires_delta=access_token_expires
-        )
-        
         # Update last login
         user.last_login = datetime.utcnow()
         db.commit()
+        record_login_success(user_data.email)
         
-        # Prepare user response
-        user_response = UserResponse(
-            id=user.id,
-            email=user.email,
-            username=user.username,
-            full_name=user.full_name,
-            role=user.role,
-            is_active=user.is_active,
-            registration_date=user.registration_date,
-            last_login=user.last_login
+        return _issue_tokens(user)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Login failed: {str(e)}"
         )
+
+@router.post("/refresh", response_model=TokenResponse)
+async def refresh(refresh_data: RefreshRequest, db: Session = Depends(get_db)):
+    """Exchange a refresh token for a new token pair; each refresh token works once"""
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Invalid refresh token",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+    
+    payload = decode_token(refresh_data.refresh_token, token_type="refresh")
+    if payload is None or payload.get("jti") is None:
+        raise credentials_exception
+    
+    try:
+        user = db.query(User).filter(User.username == payload["sub"]).first()
+        if user is None or not user.is_active:
+            raise credentials_exception
         
-        return TokenResponse(
-            access_token=access_token,
-            token_type="bearer",
-            user=user_response,
-            expires_in=ACCESS_TOKEN_EXPIRE_MINUTES * 60
+        # Rotation: revoking the old token is the same insert that detects reuse,
+        # because jti is unique and a concurrent or replayed refresh fails here
+        revocation_list.revoke(db, payload["jti"], "refresh", token_expiry(payload), user.id)
+        try:
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Refresh token has already been used",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        
+        return _issue_tokens(user)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Token refresh failed: {str(e)}"
         )
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(
+    logout_data: LogoutRequest = LogoutRequest(),
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """Revoke the current access token and, optionally, a refresh token"""
+    try:
+        access_payload = decode_token(credentials.credentials)
+        if access_payload.get("jti") is not None:
+            revocation_list.revoke(db, access_payload["jti"], "access", token_expiry(access_payload), current_user.id)
+        
+        if logout_data.refresh_token:
+            refresh_payload = decode_token(logout_data.refresh_token, token_type="refresh")
+            if (
+                refresh_payload is not None
+                and refresh_payload["sub"] == current_user.username
+                and refresh_payload.get("jti") is not None
+                and not revocation_list.is_revoked(db, refresh_payload["jti"])
+            ):
+                revocation_list.revoke(
+                    db, refresh_payload["jti"], "refresh", token_expiry(refresh_payload), current_user.id
+                )
+        
+        db.commit()
         
     except HTTPException:
         raise
     except Exception as e:
+        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Login failed: {str(e)}"
+            detail=f"Logout failed: {str(e)}"
         )
 
 @router.post("/register", response_model=UserResponse)
@@ -116,3 +213,14 @@ async def register(user_data: UserCreate, db: Session = Depends(get_db)):
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Registration failed: {str(e)}"
         )
+
+@router.get("/login/metrics", response_model=dict)
+async def get_login_metrics(current_user: User = Depends(get_current_active_user)):
+    """Get login rate limiting counters (super admins only)"""
+    if current_user.role != "superadmin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only super admins can view login metrics"
+        )
+    
+    return login_rate_metrics()
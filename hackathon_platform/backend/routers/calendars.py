@@ -0,0 +1,96 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy.orm import Session
+from typing import Optional
+from utils.replicas import get_read_db
+from models.database import Hackathon, User
+from models.schemas import CalendarSubscriptionResponse
+from utils.auth import get_current_active_user
+from utils.http_cache import REVALIDATE_CACHE_CONTROL, etag_matches
+from utils.ical import feed_body, feed_etag, feed_token, feed_token_matches
+
+router = APIRouter(prefix="/calendars", tags=["calendars"])
+
+CALENDAR_MEDIA_TYPE = "text/calendar"
+# Token feeds are per user, so shared caches must not keep them
+PRIVATE_CACHE_CONTROL = "private, no-cache"
+
+def _feed_response(request: Request, db: Session, scope: str, hackathon_filter, filename: str, cache_control: str,
+                   calendar_name: Optional[str] = None, include_private: bool = False, required: bool = False):
+    etag, hackathon_count = feed_etag(db, scope, hackathon_filter, include_private)
+    if required and not hackathon_count:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Hackathon not found"
+        )
+
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    body = feed_body(db, scope, etag, hackathon_filter, calendar_name, include_private)
+    headers["Content-Disposition"] = f'inline; filename="{filename}"'
+    return Response(content=body, media_type=CALENDAR_MEDIA_TYPE, headers=headers)
+
+@router.get("/hackathons/{hackathon_id}.ics")
+async def get_hackathon_calendar(
+    hackathon_id: int,
+    request: Request,
+    db: Session = Depends(get_read_db)
+):
+    """Public calendar of a hackathon: its dates, application window and mentor sessions"""
+    try:
+        return _feed_response(
+            request, db, f"hackathon:{hackathon_id}", Hackathon.id == hackathon_id,
+            f"hackathon-{hackathon_id}.ics", REVALIDATE_CACHE_CONTROL, required=True
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to build calendar: {str(e)}"
+        )
+
+@router.get("/organizers/{organizer_id}.ics")
+async def get_organizer_calendar(
+    organizer_id: int,
+    request: Request,
+    token: str = Query(..., max_length=64),
+    db: Session = Depends(get_read_db)
+):
+    """Calendar of every hackathon an organizer runs, including meeting links.
+
+    Calendar apps cannot send bearer tokens, so the feed is authorized by the
+    token in the URL handed out by GET /calendars/subscription.
+    """
+    if not feed_token_matches(organizer_id, token):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Invalid calendar token"
+        )
+
+    try:
+        return _feed_response(
+            request, db, f"organizer:{organizer_id}", Hackathon.organizer_id == organizer_id,
+            f"organizer-{organizer_id}.ics", PRIVATE_CACHE_CONTROL, calendar_name="My hackathons", include_private=True
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to build calendar: {str(e)}"
+        )
+
+@router.get("/subscription", response_model=CalendarSubscriptionResponse)
+async def get_calendar_subscription(
+    request: Request,
+    current_user: User = Depends(get_current_active_user)
+):
+    """Subscription URL of the current user's organizer calendar"""
+    url = request.url_for("get_organizer_calendar", organizer_id=current_user.id)
+    return CalendarSubscriptionResponse(
+        organizer_feed_url=f"{url}?token={feed_token(current_user.id)}"
+    )
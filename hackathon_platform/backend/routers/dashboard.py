@@ -0,0 +1,78 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+from typing import Optional
+from datetime import datetime, timedelta
+from utils.replicas import get_read_db
+from utils.rollups import bucket_range, load_series
+from models.database import User
+from models.schemas import ChartData, TimeSeriesMetric, TimeSeriesGranularity
+from utils.auth import get_current_active_user
+
+router = APIRouter(prefix="/dashboard", tags=["dashboard"])
+
+# Default window per granularity when no start date is given
+DEFAULT_SPANS = {
+    "minute": timedelta(hours=2),
+    "hour": timedelta(days=2),
+    "day": timedelta(days=30),
+    "week": timedelta(weeks=26),
+    "month": timedelta(days=365),
+}
+MAX_BUCKETS = 2000
+
+@router.get("/timeseries", response_model=ChartData)
+async def get_timeseries(
+    metric: TimeSeriesMetric,
+    granularity: TimeSeriesGranularity = TimeSeriesGranularity.DAY,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    hackathon_id: Optional[int] = None,
+    breakdown: bool = Query(False, description="One dataset per dimension (e.g. status)"),
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_read_db)
+):
+    """Chart data for a metric over a time range, served from the rollups"""
+    end = end_date or datetime.utcnow()
+    start = start_date or end - DEFAULT_SPANS[granularity.value]
+    if start > end:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="start_date must be before end_date"
+        )
+    
+    buckets = bucket_range(start, end, granularity.value)
+    if len(buckets) > MAX_BUCKETS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Range spans more than {MAX_BUCKETS} {granularity.value} buckets; use a coarser granularity"
+        )
+    
+    try:
+        # Organizers only see their own hackathons
+        organizer_id = current_user.id if current_user.role == "organizer" else None
+        series = load_series(
+            db, metric.value, granularity.value, start, end,
+            hackathon_id=hackathon_id, organizer_id=organizer_id
+        )
+        
+        if breakdown:
+            datasets = [
+                {"label": dimension or metric.value, "data": [values.get(bucket, 0) for bucket in buckets]}
+                for dimension, values in sorted(series.items())
+            ]
+        else:
+            datasets = [{
+                "label": metric.value,
+                "data": [sum(values.get(bucket, 0) for values in series.values()) for bucket in buckets]
+            }]
+        
+        return ChartData(
+            labels=[bucket.isoformat() for bucket in buckets],
+            datasets=datasets
+        )
+        
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to fetch time series: {str(e)}"
+        )
@@ -0,0 +1,56 @@
+import asyncio
+from fastapi import APIRouter, Depends, Header, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+from typing import Optional
+from utils.database import get_db
+from models.database import User
+from utils.auth import get_current_active_user
+from utils.events import hub
+
+router = APIRouter(prefix="/events", tags=["events"])
+
+# Seconds between keep-alive comments so proxies keep idle streams open
+HEARTBEAT_INTERVAL = 15
+# Reconnect delay suggested to EventSource clients, in milliseconds
+RETRY_MILLISECONDS = 3000
+
+@router.get("/stream")
+async def stream_events(
+    last_event_id: Optional[str] = Query(None),
+    last_event_id_header: Optional[str] = Header(None, alias="Last-Event-ID"),
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """Stream hackathon change events for the current user as Server-Sent Events"""
+    # Organizers only see their own hackathons, like get_hackathons
+    organizer_id = current_user.id if current_user.role == "organizer" else None
+    # Release the connection; the stream itself never touches the database
+    db.close()
+
+    subscription, replay, reset = hub.subscribe(organizer_id, last_event_id_header or last_event_id)
+
+    async def event_stream():
+        try:
+            yield f"retry: {RETRY_MILLISECONDS}\n\n"
+            if reset:
+                yield "event: reset\ndata: {}\n\n"
+            for message in replay:
+                yield message
+            while not subscription.overflowed:
+                try:
+                    message = await asyncio.wait_for(subscription.queue.get(), timeout=HEARTBEAT_INTERVAL)
+                except asyncio.TimeoutError:
+                    yield ": heartbeat\n\n"
+                    continue
+                yield message
+            # Fell too far behind: ask the client to refetch and reconnect fresh
+            yield "event: reset\ndata: {}\n\n"
+        finally:
+            hub.unsubscribe(subscription)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -1,25 +1,144 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, joinedload, selectinload
+from typing import Dict, List
 from datetime import datetime
 from utils.database import get_db
-from models.database import Hackathon, User
+from utils.replicas import get_read_db
+from models.database import (
+    Hackathon, User, Participant, Team, Submission, Sponsor, StoredFile
+)
 from models.schemas import (
     HackathonCreate, HackathonResponse, HackathonUpdate, HackathonListResponse,
-    SuccessResponse, ErrorResponse
+    HackathonBatchRequest, HackathonBatchItem, HackathonBatchResponse,
+    HackathonSuggestion, HackathonAutocompleteResponse,
+    SponsorCreate, SuccessResponse, ErrorResponse, HackathonLogoUpdate
 )
-from utils.auth import get_current_active_user
+from utils.auth import get_current_active_user, get_hackathon_for_user
+from utils.leaderboard import discard_leaderboard
+from utils.events import hub, hackathon_event
+from utils.http_cache import weak_etag, etag_matches
+from utils.cache import cache
+from utils.rollups import record_event
+from utils.notifications import notify_hackathon_update
+from utils.landing import landing_payload, refresh_landing, remove_landing
+from utils.storage import file_url
+from utils.archival import HACKATHON_CHILD_MODELS
+from utils.autocomplete import get_autocomplete_index, index_hackathon, unindex_hackathons
 
 router = APIRouter(prefix="/hackathons", tags=["hackathons"])
 
+# Seconds a landing page payload stays cached (writes evict it sooner)
+LANDING_CACHE_TTL = 300
+
+# Maximum number of ids accepted by the batch endpoints
+MAX_BATCH_IDS_GET = 100
+MAX_BATCH_IDS_POST = 1000
+
+# Most suggestions returned by the autocomplete endpoint
+MAX_AUTOCOMPLETE_LIMIT = 20
+
+def _hackathon_counts(db: Session, hackathon_ids: List[int]) -> Dict[int, Dict[str, int]]:
+    """Count participants, teams and submissions for many hackathons with grouped queries"""
+    counts = {hackathon_id: {'participant_count': 0, 'team_count': 0, 'submission_count': 0} for hackathon_id in hackathon_ids}
+    if not hackathon_ids:
+        return counts
+    
+    for model, key in ((Participant, 'participant_count'), (Team, 'team_count'), (Submission, 'submission_count')):
+        rows = (
+            db.query(model.hackathon_id, func.count(model.id))
+            .filter(model.hackathon_id.in_(hackathon_ids))
+            .group_by(model.hackathon_id)
+            .all()
+        )
+        for hackathon_id, count in rows:
+            counts[hackathon_id][key] = count
+    
+    return counts
+
+def _to_hackathon_response(hackathon: Hackathon, counts: Dict[str, int]) -> HackathonResponse:
+    """Build the API response for a hackathon with precomputed child counts"""
+    hackathon_dict = hackathon.__dict__.copy()
+    hackathon_dict['organizer'] = hackathon.organizer
+    hackathon_dict['sponsors_data'] = hackathon.sponsor_list
+    hackathon_dict.update(counts)
+    
+    # Map field names for frontend compatibility and ensure required fields have values
+    hackathon_dict['prize_pool_details'] = hackathon_dict.get('prize_pool') or ''
+    hackathon_dict['theme_focus_area'] = hackathon_dict.get('theme') or ''
+    
+    return HackathonResponse(**hackathon_dict)
+
+def _replace_sponsors(db: Session, hackathon: Hackathon, sponsors: List[SponsorCreate]):
+    """Replace the sponsor rows of a hackathon, keeping the given order"""
+    db.query(Sponsor).filter(Sponsor.hackathon_id == hackathon.id).delete(synchronize_session=False)
+    db.add_all([
+        Sponsor(
+            hackathon_id=hackathon.id,
+            name=sponsor.name,
+            name_key=sponsor.name.strip().lower(),
+            tier=sponsor.tier,
+            logo_url=sponsor.logo_url,
+            banner_url=sponsor.banner_url,
+            website=sponsor.website,
+            description=sponsor.description,
+            position=position
+        )
+        for position, sponsor in enumerate(sponsors)
+    ])
+    db.expire(hackathon, ['sponsor_list'])
+
+def _get_hackathons_batch(db: Session, ids: List[int], current_user: User) -> HackathonBatchResponse:
+    """Resolve many hackathon ids at once, preserving request order"""
+    unique_ids = list(dict.fromkeys(ids))
+    
+    # One IN query; organizer scoping is part of the SQL filter
+    query = (
+        db.query(Hackathon)
+        .options(joinedload(Hackathon.organizer), selectinload(Hackathon.sponsor_list))
+        .filter(Hackathon.id.in_(unique_ids))
+    )
+    if current_user.role == "organizer":
+        query = query.filter(Hackathon.organizer_id == current_user.id)
+    hackathons = {hackathon.id: hackathon for hackathon in query.all()}
+    
+    # Ids that were filtered out are either missing or owned by someone else
+    missing_ids = [hackathon_id for hackathon_id in unique_ids if hackathon_id not in hackathons]
+    existing_ids = set()
+    if missing_ids:
+        existing_ids = {
+            row[0] for row in db.query(Hackathon.id).filter(Hackathon.id.in_(missing_ids)).all()
+        }
+    
+    counts = _hackathon_counts(db, list(hackathons))
+    
+    results = []
+    for hackathon_id in ids:
+        hackathon = hackathons.get(hackathon_id)
+        if hackathon is not None:
+            results.append(HackathonBatchItem(
+                id=hackathon_id,
+                status="ok",
+                hackathon=_to_hackathon_response(hackathon, counts[hackathon_id])
+            ))
+        elif hackathon_id in existing_ids:
+            results.append(HackathonBatchItem(id=hackathon_id, status="forbidden"))
+        else:
+            results.append(HackathonBatchItem(id=hackathon_id, status="not_found"))
+    
+    return HackathonBatchResponse(results=results)
+
 @router.get("/", response_model=HackathonListResponse)
 async def get_hackathons(
+    request: Request,
+    response: Response,
     page: int = Query(1, ge=1),
     size: int = Query(10, ge=1, le=100),
-    status: str = Query(None),
+    status_filter: str = Query(None, alias="status"),
     search: str = Query(None),
+    sponsor: str = Query(None),
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Get paginated list of hackathons"""
     try:
@@ -30,8 +149,8 @@ async def get_hackathons(
             query = query.filter(Hackathon.organizer_id == current_user.id)
         
         # Apply status filter
-        if status:
-            query = query.filter(Hackathon.status == status)
+        if status_filter:
+            query = query.filter(Hackathon.status == status_filter)
         
         # Apply search filter
         if search:
@@ -40,28 +159,46 @@ async def get_hackathons(
                 Hackathon.description.contains(search)
             )
         
-        # Get total count
-        total = query.count()
-        
-        # Apply pagination
-        hackathons = query.offset((page - 1) * size).limit(size).all()
+        # Apply sponsor filter through the indexed sponsors table
+        if sponsor:
+            query = query.filter(Hackathon.id.in_(
+                select(Sponsor.hackathon_id).where(Sponsor.name_key == sponsor.strip().lower())
+            ))
+        
+        # Get total count together with the values the ETag is derived from:
+        # latest update and child totals of the filtered set
+        filtered_ids = query.with_entities(Hackathon.id).scalar_subquery()
+        child_totals = [
+            select(func.count(model.id)).where(model.hackathon_id.in_(filtered_ids)).scalar_subquery()
+            for model in (Participant, Team, Submission)
+        ]
+        total, last_updated, *child_counts = query.with_entities(
+            func.count(Hackathon.id), func.max(Hackathon.updated_at), *child_totals
+        ).one()
+        
+        etag = weak_etag(
+            "hackathons", current_user.id, current_user.role, page, size,
+            status_filter, search, sponsor, total, last_updated, *child_counts
+        )
+        if etag_matches(request, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = "private, no-cache"
+        
+        # Apply pagination; organizers and sponsors are loaded with the page
+        hackathons = (
+            query.options(joinedload(Hackathon.organizer), selectinload(Hackathon.sponsor_list))
+            .offset((page - 1) * size)
+            .limit(size)
+            .all()
+        )
+        counts = _hackathon_counts(db, [hackathon.id for hackathon in hackathons])
         
         # Convert to response format
-        hackathon_responses = []
-        for hackathon in hackathons:
-            hackathon_dict = hackathon.__dict__.copy()
-            hackathon_dict['organizer'] = hackathon.organizer
-            hackathon_dict['participant_count'] = len(hackathon.participants)
-            hackathon_dict['team_count'] = len(hackathon.teams)
-            hackathon_dict['submission_count'] = len(hackathon.submissions)
-            
-            # Map field names for frontend compatibility
-            hackathon_dict['prize_pool_details'] = hackathon_dict.get('prize_pool', '')
-            hackathon_dict['theme_focus_area'] = hackathon_dict.get('theme', '')
-            hackathon_dict['application_start_date'] = hackathon_dict.get('application_start_date')
-            hackathon_dict['application_end_date'] = hackathon_dict.get('application_end_date')
-            
-            hackathon_responses.append(HackathonResponse(**hackathon_dict))
+        hackathon_responses = [
+            _to_hackathon_response(hackathon, counts[hackathon.id])
+            for hackathon in hackathons
+        ]
         
         return HackathonListResponse(
             hackathons=hackathon_responses,
@@ -78,11 +215,86 @@ async def get_hackathons(
             detail=f"Failed to fetch hackathons: {str(e)}"
         )
 
+@router.get("/batch", response_model=HackathonBatchResponse)
+async def get_hackathons_batch(
+    ids: str = Query(..., description="Comma-separated hackathon ids"),
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_read_db)
+):
+    """Get several hackathons by id in one request"""
+    try:
+        hackathon_ids = [int(value) for value in ids.split(",") if value.strip()]
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="ids must be a comma-separated list of integers"
+        )
+    
+    if not hackathon_ids or len(hackathon_ids) > MAX_BATCH_IDS_GET:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Provide between 1 and {MAX_BATCH_IDS_GET} ids"
+        )
+    
+    try:
+        return _get_hackathons_batch(db, hackathon_ids, current_user)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to fetch hackathons: {str(e)}"
+        )
+
+@router.post("/batch", response_model=HackathonBatchResponse)
+async def post_hackathons_batch(
+    batch_data: HackathonBatchRequest,
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_read_db)
+):
+    """Get several hackathons by id; POST variant for long id lists"""
+    if not batch_data.ids or len(batch_data.ids) > MAX_BATCH_IDS_POST:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Provide between 1 and {MAX_BATCH_IDS_POST} ids"
+        )
+    
+    try:
+        return _get_hackathons_batch(db, batch_data.ids, current_user)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to fetch hackathons: {str(e)}"
+        )
+
+@router.get("/autocomplete", response_model=HackathonAutocompleteResponse)
+async def autocomplete_hackathons(
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(8, ge=1, le=MAX_AUTOCOMPLETE_LIMIT),
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """Hackathons whose name, theme or organizer has a word starting with ``q``, for search-as-you-type"""
+    try:
+        # Organizers only see their own hackathons, as in the list endpoint
+        organizer_id = current_user.id if current_user.role == "organizer" else None
+        suggestions = get_autocomplete_index(db).search(q, limit, organizer_id)
+        return HackathonAutocompleteResponse(
+            query=q,
+            suggestions=[HackathonSuggestion(**suggestion) for suggestion in suggestions]
+        )
+        
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to autocomplete hackathons: {str(e)}"
+        )
+
 @router.get("/{hackathon_id}", response_model=HackathonResponse)
 async def get_hackathon(
     hackathon_id: int,
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Get specific hackathon details"""
     try:
@@ -101,26 +313,16 @@ async def get_hackathon(
                 detail="Access denied"
             )
         
-        # Prepare response
-        hackathon_dict = hackathon.__dict__.copy()
-        hackathon_dict['organizer'] = hackathon.organizer
-        hackathon_dict['participant_count'] = len(hackathon.participants)
-        hackathon_dict['team_count'] = len(hackathon.teams)
-        hackathon_dict['submission_count'] = len(hackathon.submissions)
-        
-        # Map field names for frontend compatibility and ensure required fields have values
-        hackathon_dict['prize_pool_details'] = hackathon_dict.get('prize_pool') or ''
-        hackathon_dict['theme_focus_area'] = hackathon_dict.get('theme') or ''
-        hackathon_dict['application_start_date'] = hackathon_dict.get('application_start_date')
-        hackathon_dict['application_end_date'] = hackathon_dict.get('application_end_date')
-        
-        # Ensure all required fields have default values if missing
-        if 'prize_pool_details' not in hackathon_dict or hackathon_dict['prize_pool_details'] is None:
-            hackathon_dict['prize_pool_details'] = ''
-        if 'theme_focus_area' not in hackathon_dict or hackathon_dict['theme_focus_area'] is None:
-            hackathon_dict['theme_focus_area'] = ''
-        
-        return HackathonResponse(**hackathon_dict)
+        # Child counts with grouped queries instead of loading every child row
+        counts = _hackathon_counts(db, [hackathon.id])[hackathon.id]
+        
+        etag = weak_etag("hackathon", hackathon.id, hackathon.updated_at, sorted(counts.items()))
+        if etag_matches(request, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = "private, no-cache"
+        
+        return _to_hackathon_response(hackathon, counts)
         
     except HTTPException:
         raise
@@ -173,7 +375,6 @@ async def create_hackathon(
             landing_color_scheme=hackathon_data.landing_color_scheme,
             landing_logo_url=hackathon_data.landing_logo_url,
             has_sponsors=hackathon_data.has_sponsors,
-            sponsors_data=hackathon_data.sponsors_data,
             organizer_id=current_user.id,
             status="upcoming",  # Default status
             is_featured=False,  # Default to not featured
@@ -183,29 +384,22 @@ async def create_hackathon(
         
         # Save to database
         db.add(hackathon)
+        db.flush()
+        if hackathon_data.sponsors_data:
+            _replace_sponsors(db, hackathon, hackathon_data.sponsors_data)
+        record_event(db, "hackathons", hackathon.id, hackathon.organizer_id, hackathon.created_at, hackathon.status)
+        record_event(db, "status_changes", hackathon.id, hackathon.organizer_id, hackathon.created_at, hackathon.status)
         db.commit()
         db.refresh(hackathon)
+        refresh_landing(hackathon)
+        index_hackathon(hackathon)
+        hub.publish(*hackathon_event("hackathon.created", hackathon))
         
         # Prepare response
-        hackathon_dict = hackathon.__dict__.copy()
-        hackathon_dict['organizer'] = current_user
-        hackathon_dict['participant_count'] = 0
-        hackathon_dict['team_count'] = 0
-        hackathon_dict['submission_count'] = 0
-        
-        # Map field names for frontend compatibility and ensure required fields have values
-        hackathon_dict['prize_pool_details'] = hackathon_dict.get('prize_pool') or ''
-        hackathon_dict['theme_focus_area'] = hackathon_dict.get('theme') or ''
-        hackathon_dict['application_start_date'] = hackathon_dict.get('application_start_date')
-        hackathon_dict['application_end_date'] = hackathon_dict.get('application_end_date')
-        
-        # Ensure all required fields have default values if missing
-        if 'prize_pool_details' not in hackathon_dict or hackathon_dict['prize_pool_details'] is None:
-            hackathon_dict['prize_pool_details'] = ''
-        if 'theme_focus_area' not in hackathon_dict or hackathon_dict['theme_focus_area'] is None:
-            hackathon_dict['theme_focus_area'] = ''
-        
-        return HackathonResponse(**hackathon_dict)
+        return _to_hackathon_response(
+            hackathon,
+            {'participant_count': 0, 'team_count': 0, 'submission_count': 0}
+        )
         
     except HTTPException:
         raise
@@ -249,38 +443,46 @@ async def update_hackathon(
             'prize_pool_details': 'prize_pool'
         }
         
+        previous_status = hackathon.status
+        changed_fields = []
+        
+        # Sponsors live in their own table
+        sponsors = update_data.pop('sponsors_data', None)
+        if sponsors is not None:
+            _replace_sponsors(db, hackathon, hackathon_data.sponsors_data)
+            changed_fields.append('sponsors_data')
+        
         for field, value in update_data.items():
             if value is not None:
                 # Map frontend field names to database field names
                 db_field = field_mappings.get(field, field)
                 if hasattr(hackathon, db_field):
+                    if getattr(hackathon, db_field) != value:
+                        changed_fields.append(field)
                     setattr(hackathon, db_field, value)
         
         hackathon.updated_at = datetime.utcnow()
+        if hackathon.status != previous_status:
+            record_event(db, "status_changes", hackathon.id, hackathon.organizer_id, hackathon.updated_at, hackathon.status)
+        
+        # Participant emails go through the outbox, committed with the change
+        notify_hackathon_update(db, hackathon, changed_fields)
         
         db.commit()
         db.refresh(hackathon)
+        cache.invalidate(f"landing:{hackathon_id}")
+        cache.invalidate(f"application_window:{hackathon_id}")
+        # Rewrites the static landing files only if the public payload changed
+        refresh_landing(hackathon)
+        index_hackathon(hackathon)
+        
+        if hackathon.status != previous_status:
+            hub.publish(*hackathon_event("hackathon.status_changed", hackathon, changed_fields, previous_status))
+        elif changed_fields:
+            hub.publish(*hackathon_event("hackathon.updated", hackathon, changed_fields))
         
         # Prepare response
-        hackathon_dict = hackathon.__dict__.copy()
-        hackathon_dict['organizer'] = hackathon.organizer
-        hackathon_dict['participant_count'] = len(hackathon.participants)
-        hackathon_dict['team_count'] = len(hackathon.teams)
-        hackathon_dict['submission_count'] = len(hackathon.submissions)
-        
-        # Map field names for frontend compatibility and ensure required fields have values
-        hackathon_dict['prize_pool_details'] = hackathon_dict.get('prize_pool') or ''
-        hackathon_dict['theme_focus_area'] = hackathon_dict.get('theme') or ''
-        hackathon_dict['application_start_date'] = hackathon_dict.get('application_start_date')
-        hackathon_dict['application_end_date'] = hackathon_dict.get('application_end_date')
-        
-        # Ensure all required fields have default values if missing
-        if 'prize_pool_details' not in hackathon_dict or hackathon_dict['prize_pool_details'] is None:
-            hackathon_dict['prize_pool_details'] = ''
-        if 'theme_focus_area' not in hackathon_dict or hackathon_dict['theme_focus_area'] is None:
-            hackathon_dict['theme_focus_area'] = ''
-        
-        return HackathonResponse(**hackathon_dict)
+        return _to_hackathon_response(hackathon, _hackathon_counts(db, [hackathon.id])[hackathon.id])
         
     except HTTPException:
         raise
@@ -291,6 +493,48 @@ async def update_hackathon(
             detail=f"Failed to update hackathon: {str(e)}"
         )
 
+@router.put("/{hackathon_id}/logo", response_model=HackathonResponse)
+async def set_hackathon_logo(
+    hackathon_id: int,
+    logo_data: HackathonLogoUpdate,
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """Use an uploaded image as the landing page logo"""
+    try:
+        hackathon = get_hackathon_for_user(db, hackathon_id, current_user)
+        
+        stored = db.query(StoredFile).filter(StoredFile.sha256 == logo_data.file_sha256.lower()).first()
+        if not stored:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="File has not been uploaded"
+            )
+        if not stored.content_type.startswith("image/"):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Logo must be an image"
+            )
+        
+        hackathon.landing_logo_url = file_url(stored.sha256)
+        hackathon.updated_at = datetime.utcnow()
+        db.commit()
+        db.refresh(hackathon)
+        cache.invalidate(f"landing:{hackathon_id}")
+        refresh_landing(hackathon)
+        hub.publish(*hackathon_event("hackathon.updated", hackathon, ["landing_logo_url"]))
+        
+        return _to_hackathon_response(hackathon, _hackathon_counts(db, [hackathon.id])[hackathon.id])
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to set logo: {str(e)}"
+        )
+
 @router.delete("/{hackathon_id}", response_model=SuccessResponse)
 async def delete_hackathon(
     hackathon_id: int,
@@ -314,22 +558,21 @@ async def delete_hackathon(
                 detail="You can only delete your own hackathons"
             )
         
-        # Delete related records (cascade delete)
-        for participant in hackathon.participants:
-            db.delete(participant)
-        
-        for team in hackathon.teams:
-            db.delete(team)
-        
-        for mentor_session in hackathon.mentor_sessions:
-            db.delete(mentor_session)
-        
-        for submission in hackathon.submissions:
-            db.delete(submission)
+        # Delete related records with one bulk DELETE per child table; deleting
+        # through the ORM would load (and delete) every child row one by one
+        for model in HACKATHON_CHILD_MODELS:
+            db.query(model).filter(model.hackathon_id == hackathon_id).delete(synchronize_session=False)
         
         # Delete the hackathon
-        db.delete(hackathon)
+        deleted_event = hackathon_event("hackathon.deleted", hackathon)
+        db.query(Hackathon).filter(Hackathon.id == hackathon_id).delete(synchronize_session=False)
         db.commit()
+        discard_leaderboard(hackathon_id)
+        cache.invalidate(f"landing:{hackathon_id}")
+        cache.invalidate(f"application_window:{hackathon_id}")
+        remove_landing(hackathon_id)
+        unindex_hackathons([hackathon_id])
+        hub.publish(*deleted_event)
         
         return SuccessResponse(
             success=True,
@@ -348,10 +591,15 @@ async def delete_hackathon(
 @router.get("/{hackathon_id}/landing", response_model=dict)
 async def get_hackathon_landing_page(
     hackathon_id: int,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Get hackathon landing page data (public endpoint)"""
     try:
+        cache_key = f"landing:{hackathon_id}"
+        landing_data = cache.get(cache_key)
+        if landing_data is not None:
+            return landing_data
+        
         hackathon = db.query(Hackathon).filter(Hackathon.id == hackathon_id).first()
         
         if not hackathon:
@@ -361,29 +609,8 @@ async def get_hackathon_landing_page(
             )
         
         # Return landing page data
-        landing_data = {
-            "id": hackathon.id,
-            "name": hackathon.name,
-            "description": hackathon.description,
-            "type": hackathon.type,
-            "theme_focus_area": hackathon.theme,
-            "location": hackathon.location,
-            "start_date": hackathon.start_date.isoformat() if hackathon.start_date else None,
-            "end_date": hackathon.end_date.isoformat() if hackathon.end_date else None,
-            "application_start_date": hackathon.application_start_date.isoformat() if hackathon.application_start_date else None,
-            "application_end_date": hackathon.application_end_date.isoformat() if hackathon.application_end_date else None,
-            "prize_pool_details": hackathon.prize_pool,
-            "rules": hackathon.rules,
-            "min_team_size": hackathon.min_team_size,
-            "max_team_size": hackathon.max_team_size,
-            "landing_page_type": hackathon.landing_page_type or "template",
-            "custom_landing_url": hackathon.custom_landing_url,
-            "landing_color_scheme": hackathon.landing_color_scheme or "#1976d2",
-            "landing_logo_url": hackathon.landing_logo_url,
-            "has_sponsors": hackathon.has_sponsors or False,
-            "sponsors_data": hackathon.sponsors_data,
-        }
-        
+        landing_data = landing_payload(hackathon)
+        cache.set(cache_key, landing_data, LANDING_CACHE_TTL)
         return landing_data
         
     except HTTPException:
@@ -0,0 +1,249 @@
+from collections import defaultdict
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import func, insert
+from sqlalchemy.orm import Session
+from typing import List
+from datetime import datetime
+from utils.database import get_db
+from utils.replicas import get_read_db
+from models.database import Judge, JudgeAssignment, Participant, Submission, User
+from models.schemas import (
+    JudgeCreate, JudgeResponse, JudgeScheduleRequest, JudgeScheduleResponse,
+    JudgeLoad, JudgeAssignmentResponse
+)
+from utils.auth import get_current_active_user, get_hackathon_for_user
+from utils.judge_scheduler import schedule_reviews, SchedulingError
+
+router = APIRouter(prefix="/hackathons", tags=["judging"])
+
+def _normalize_affiliation(value: str) -> str:
+    return " ".join(value.lower().split())
+
+@router.post("/{hackathon_id}/judges", response_model=JudgeResponse)
+async def create_judge(
+    hackathon_id: int,
+    judge_data: JudgeCreate,
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """Add a judge to a hackathon"""
+    try:
+        get_hackathon_for_user(db, hackathon_id, current_user)
+
+        judge = Judge(
+            hackathon_id=hackathon_id,
+            name=judge_data.name,
+            email=judge_data.email,
+            affiliation=judge_data.affiliation,
+            max_assignments=judge_data.max_assignments,
+            created_at=datetime.utcnow()
+        )
+        db.add(judge)
+        db.commit()
+        db.refresh(judge)
+
+        return JudgeResponse.model_validate(judge)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to create judge: {str(e)}"
+        )
+
+@router.get("/{hackathon_id}/judges", response_model=List[JudgeResponse])
+async def get_judges(
+    hackathon_id: int,
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_read_db)
+):
+    """List the judges of a hackathon"""
+    try:
+        get_hackathon_for_user(db, hackathon_id, current_user)
+
+        judges = db.query(Judge).filter(Judge.hackathon_id == hackathon_id).order_by(Judge.id).all()
+        return [JudgeResponse.model_validate(judge) for judge in judges]
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to fetch judges: {str(e)}"
+        )
+
+@router.post("/{hackathon_id}/judging/assignments", response_model=JudgeScheduleResponse)
+async def schedule_judge_assignments(
+    hackathon_id: int,
+    schedule_data: JudgeScheduleRequest,
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """Spread pending submissions over the hackathon judges and persist the assignments"""
+    try:
+        get_hackathon_for_user(db, hackathon_id, current_user)
+
+        judge_query = db.query(Judge).filter(Judge.hackathon_id == hackathon_id)
+        if schedule_data.judge_ids is not None:
+            judge_query = judge_query.filter(Judge.id.in_(schedule_data.judge_ids))
+        judges = judge_query.order_by(Judge.id).all()
+
+        if schedule_data.judge_ids is not None and len(judges) != len(set(schedule_data.judge_ids)):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Some judges do not belong to this hackathon"
+            )
+
+        # Submissions to (re)schedule; evaluated ones are never touched
+        pending_statuses = ["submitted", "under_review"] if schedule_data.replace_existing else ["submitted"]
+        pending_filter = (
+            Submission.hackathon_id == hackathon_id,
+            Submission.status.in_(pending_statuses)
+        )
+        pending = db.query(Submission.id, Submission.team_id).filter(*pending_filter).all()
+        # Later writes only touch these rows, not submissions that arrive meanwhile
+        pending_ids = [submission_id for submission_id, _ in pending]
+
+        if schedule_data.replace_existing and pending_ids:
+            db.query(JudgeAssignment).filter(
+                JudgeAssignment.hackathon_id == hackathon_id,
+                JudgeAssignment.submission_id.in_(pending_ids)
+            ).delete(synchronize_session=False)
+
+        # Current load of every judge, so repeated runs stay balanced
+        existing_load = dict(
+            db.query(JudgeAssignment.judge_id, func.count(JudgeAssignment.id))
+            .filter(JudgeAssignment.hackathon_id == hackathon_id)
+            .group_by(JudgeAssignment.judge_id)
+            .all()
+        )
+
+        # Conflicts of interest: same affiliation as a team member, or explicit exclusions
+        judges_by_affiliation = defaultdict(set)
+        for judge in judges:
+            if judge.affiliation:
+                judges_by_affiliation[_normalize_affiliation(judge.affiliation)].add(judge.id)
+
+        team_conflicts = defaultdict(set)
+        if judges_by_affiliation:
+            member_affiliations = (
+                db.query(Participant.team_id, Participant.university_company)
+                .filter(
+                    Participant.hackathon_id == hackathon_id,
+                    Participant.team_id.isnot(None),
+                    Participant.university_company.isnot(None)
+                )
+                .distinct()
+                .all()
+            )
+            for team_id, affiliation in member_affiliations:
+                team_conflicts[team_id] |= judges_by_affiliation.get(_normalize_affiliation(affiliation), set())
+        for exclusion in schedule_data.exclusions:
+            team_conflicts[exclusion.team_id].add(exclusion.judge_id)
+
+        conflicts = {
+            submission_id: team_conflicts[team_id]
+            for submission_id, team_id in pending
+            if team_id in team_conflicts
+        }
+
+        try:
+            assignments = schedule_reviews(
+                pending_ids,
+                [judge.id for judge in judges],
+                schedule_data.reviews_per_submission,
+                conflicts=conflicts,
+                capacities={judge.id: judge.max_assignments for judge in judges},
+                existing_load=existing_load
+            )
+        except SchedulingError as e:
+            db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+
+        # Persist everything in bulk: one executemany insert and one status update
+        now = datetime.utcnow()
+        if assignments:
+            db.execute(
+                insert(JudgeAssignment),
+                [
+                    {
+                        "hackathon_id": hackathon_id,
+                        "judge_id": judge_id,
+                        "submission_id": submission_id,
+                        "assigned_at": now
+                    }
+                    for judge_id, submission_id in assignments
+                ]
+            )
+            db.query(Submission).filter(Submission.id.in_(pending_ids), *pending_filter).update(
+                {Submission.status: "under_review"}, synchronize_session=False
+            )
+        db.commit()
+
+        loads = dict(existing_load)
+        for judge_id, _ in assignments:
+            loads[judge_id] = loads.get(judge_id, 0) + 1
+
+        return JudgeScheduleResponse(
+            scheduled_submissions=len(pending),
+            total_assignments=len(assignments),
+            reviews_per_submission=schedule_data.reviews_per_submission,
+            judge_loads=[
+                JudgeLoad(judge_id=judge.id, name=judge.name, assignments=loads.get(judge.id, 0))
+                for judge in judges
+            ]
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to schedule judges: {str(e)}"
+        )
+
+@router.get("/{hackathon_id}/judges/{judge_id}/assignments", response_model=List[JudgeAssignmentResponse])
+async def get_judge_assignments(
+    hackathon_id: int,
+    judge_id: int,
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_read_db)
+):
+    """List the submissions assigned to a judge"""
+    try:
+        get_hackathon_for_user(db, hackathon_id, current_user)
+
+        rows = (
+            db.query(Submission.id, Submission.title, Submission.status, JudgeAssignment.assigned_at)
+            .join(JudgeAssignment, JudgeAssignment.submission_id == Submission.id)
+            .filter(
+                JudgeAssignment.hackathon_id == hackathon_id,
+                JudgeAssignment.judge_id == judge_id
+            )
+            .order_by(Submission.id)
+            .all()
+        )
+
+        return [
+            JudgeAssignmentResponse(
+                submission_id=submission_id,
+                title=title,
+                status=submission_status,
+                assigned_at=assigned_at
+            )
+            for submission_id, title, submission_status, assigned_at in rows
+        ]
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to fetch judge assignments: {str(e)}"
+        )
@@ -0,0 +1,160 @@
+from collections import Counter
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from utils.database import get_db
+from utils.replicas import get_read_db
+from models.database import Participant, ParticipantSkill, User
+from models.schemas import (
+    ParticipantResponse, ParticipantListResponse, ParticipantFacets, FacetCount, ParticipantStatusUpdate
+)
+from utils.auth import get_current_active_user, get_hackathon_for_user
+from utils.skill_index import normalize_skill
+from utils.notifications import notify_participant_status
+
+router = APIRouter(prefix="/hackathons", tags=["participants"])
+
+# Facet values returned per facet, most frequent first
+MAX_FACET_VALUES = 50
+
+def _top_values(counter: Counter, limit: int) -> List[FacetCount]:
+    ranked = sorted(counter.items(), key=lambda item: (-item[1], item[0]))
+    return [FacetCount(value=value, count=count) for value, count in ranked[:limit]]
+
+@router.get("/{hackathon_id}/participants", response_model=ParticipantListResponse)
+async def get_participants(
+    hackathon_id: int,
+    page: int = Query(1, ge=1),
+    size: int = Query(50, ge=1, le=200),
+    status_filter: Optional[str] = Query(None, alias="status"),
+    region: Optional[str] = None,
+    university_company: Optional[str] = None,
+    skill: List[str] = Query([], description="Repeat to require several skills"),
+    facet_limit: int = Query(20, ge=1, le=MAX_FACET_VALUES),
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_read_db)
+):
+    """List the participants of a hackathon with filters and facet counts"""
+    try:
+        get_hackathon_for_user(db, hackathon_id, current_user)
+        
+        query = db.query(Participant).filter(Participant.hackathon_id == hackathon_id)
+        
+        if status_filter:
+            query = query.filter(Participant.status == status_filter)
+        if region:
+            query = query.filter(Participant.region == region)
+        if university_company:
+            query = query.filter(Participant.university_company == university_company)
+        
+        # Skill filters go through the inverted index: participants having every requested skill
+        skill_keys = sorted({key for key in map(normalize_skill, skill) if key is not None})
+        if skill_keys:
+            query = query.filter(Participant.id.in_(
+                select(ParticipantSkill.participant_id)
+                .where(
+                    ParticipantSkill.hackathon_id == hackathon_id,
+                    ParticipantSkill.skill.in_(skill_keys)
+                )
+                .group_by(ParticipantSkill.participant_id)
+                .having(func.count(func.distinct(ParticipantSkill.skill)) == len(skill_keys))
+            ))
+        
+        # One grouped pass yields the total and the status/region/organization facets
+        status_counts, region_counts, organization_counts = Counter(), Counter(), Counter()
+        total = 0
+        grouped = query.with_entities(
+            Participant.status, Participant.region, Participant.university_company, func.count(Participant.id)
+        ).group_by(Participant.status, Participant.region, Participant.university_company)
+        for participant_status, participant_region, organization, count in grouped:
+            total += count
+            if participant_status:
+                status_counts[participant_status] += count
+            if participant_region:
+                region_counts[participant_region] += count
+            if organization:
+                organization_counts[organization] += count
+        
+        # Skill facet from the index, restricted to the filtered participants
+        skill_counts = Counter(dict(
+            db.query(ParticipantSkill.skill, func.count(ParticipantSkill.id))
+            .filter(
+                ParticipantSkill.hackathon_id == hackathon_id,
+                ParticipantSkill.participant_id.in_(query.with_entities(Participant.id))
+            )
+            .group_by(ParticipantSkill.skill)
+            .all()
+        )) if total else Counter()
+        
+        participants = (
+            query.order_by(Participant.registration_date.desc(), Participant.id.desc())
+            .offset((page - 1) * size)
+            .limit(size)
+            .all()
+        )
+        
+        return ParticipantListResponse(
+            participants=[ParticipantResponse.model_validate(participant) for participant in participants],
+            total=total,
+            page=page,
+            size=size,
+            has_next=(page * size) < total,
+            has_prev=page > 1,
+            facets=ParticipantFacets(
+                status=_top_values(status_counts, facet_limit),
+                region=_top_values(region_counts, facet_limit),
+                university_company=_top_values(organization_counts, facet_limit),
+                skills=_top_values(skill_counts, facet_limit)
+            )
+        )
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to fetch participants: {str(e)}"
+        )
+
+@router.patch("/{hackathon_id}/participants/{participant_id}", response_model=ParticipantResponse)
+async def update_participant_status(
+    hackathon_id: int,
+    participant_id: int,
+    status_data: ParticipantStatusUpdate,
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """Approve or reject a participant; the decision email is queued with the change"""
+    try:
+        hackathon = get_hackathon_for_user(db, hackathon_id, current_user)
+        
+        participant = db.query(Participant).filter(
+            Participant.id == participant_id,
+            Participant.hackathon_id == hackathon_id
+        ).first()
+        
+        if not participant:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Participant not found"
+            )
+        
+        new_status = status_data.status.value
+        if participant.status != new_status:
+            participant.status = new_status
+            if new_status in ("approved", "rejected"):
+                notify_participant_status(db, participant, hackathon)
+            db.commit()
+            db.refresh(participant)
+        
+        return ParticipantResponse.model_validate(participant)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to update participant: {str(e)}"
+        )
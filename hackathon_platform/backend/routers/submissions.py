@@ -0,0 +1,300 @@
+import asyncio
+import json
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session, joinedload
+from typing import List
+from datetime import datetime
+from utils.database import get_db
+from utils.replicas import get_read_db
+from models.database import StoredFile, Submission, SubmissionArtifact, User
+from models.schemas import (
+    ScoreUpdate, LeaderboardEntry, LeaderboardResponse, SuccessResponse,
+    SubmissionArtifactCreate, SubmissionArtifactResponse, StoredFileResponse
+)
+from utils.auth import get_current_active_user, get_hackathon_for_user
+from utils.leaderboard import get_leaderboard, leaderboard_version, record_team_score
+from utils.storage import describe_file
+
+router = APIRouter(prefix="/hackathons", tags=["submissions"])
+
+# Seconds between keep-alive comments on the leaderboard stream
+HEARTBEAT_INTERVAL = 15
+
+@router.put("/{hackathon_id}/submissions/{submission_id}/score", response_model=SuccessResponse)
+async def score_submission(
+    hackathon_id: int,
+    submission_id: int,
+    score_data: ScoreUpdate,
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """Record a judge score for a submission and update the leaderboard"""
+    try:
+        get_hackathon_for_user(db, hackathon_id, current_user)
+
+        submission = db.query(Submission).filter(
+            Submission.id == submission_id,
+            Submission.hackathon_id == hackathon_id
+        ).first()
+
+        if not submission:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Submission not found"
+            )
+
+        submission.score = score_data.score
+        if score_data.feedback is not None:
+            submission.feedback = score_data.feedback
+        submission.status = "evaluated"
+        submission.evaluated_at = datetime.utcnow()
+
+        db.commit()
+
+        event = record_team_score(db, hackathon_id, submission.team_id)
+
+        return SuccessResponse(
+            success=True,
+            message="Score recorded successfully",
+            data={
+                "submission_id": submission.id,
+                "team_id": submission.team_id,
+                "score": submission.score,
+                "rank": event.get("rank") if event else None,
+            }
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to record score: {str(e)}"
+        )
+
+def _get_submission(db: Session, hackathon_id: int, submission_id: int) -> Submission:
+    submission = db.query(Submission).filter(
+        Submission.id == submission_id,
+        Submission.hackathon_id == hackathon_id
+    ).first()
+    if not submission:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Submission not found"
+        )
+    return submission
+
+def _artifact_response(artifact: SubmissionArtifact) -> SubmissionArtifactResponse:
+    return SubmissionArtifactResponse(
+        id=artifact.id,
+        submission_id=artifact.submission_id,
+        filename=artifact.filename,
+        kind=artifact.kind,
+        created_at=artifact.created_at,
+        file=StoredFileResponse(**describe_file(artifact.file))
+    )
+
+@router.post("/{hackathon_id}/submissions/{submission_id}/artifacts", response_model=SubmissionArtifactResponse)
+async def add_submission_artifact(
+    hackathon_id: int,
+    submission_id: int,
+    artifact_data: SubmissionArtifactCreate,
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """Attach an uploaded file (see /files and /uploads) to a submission"""
+    try:
+        get_hackathon_for_user(db, hackathon_id, current_user)
+        _get_submission(db, hackathon_id, submission_id)
+
+        stored = db.query(StoredFile).filter(StoredFile.sha256 == artifact_data.file_sha256.lower()).first()
+        if not stored:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="File has not been uploaded"
+            )
+
+        artifact = SubmissionArtifact(
+            hackathon_id=hackathon_id,
+            submission_id=submission_id,
+            file_id=stored.id,
+            filename=artifact_data.filename,
+            kind=artifact_data.kind.value,
+            created_at=datetime.utcnow()
+        )
+        db.add(artifact)
+        db.commit()
+        db.refresh(artifact)
+
+        return _artifact_response(artifact)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to add artifact: {str(e)}"
+        )
+
+@router.get("/{hackathon_id}/submissions/{submission_id}/artifacts", response_model=List[SubmissionArtifactResponse])
+async def get_submission_artifacts(
+    hackathon_id: int,
+    submission_id: int,
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_read_db)
+):
+    """List the files attached to a submission"""
+    try:
+        get_hackathon_for_user(db, hackathon_id, current_user)
+
+        artifacts = (
+            db.query(SubmissionArtifact)
+            .options(joinedload(SubmissionArtifact.file))
+            .filter(
+                SubmissionArtifact.hackathon_id == hackathon_id,
+                SubmissionArtifact.submission_id == submission_id
+            )
+            .order_by(SubmissionArtifact.id)
+            .all()
+        )
+        return [_artifact_response(artifact) for artifact in artifacts]
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to fetch artifacts: {str(e)}"
+        )
+
+@router.delete("/{hackathon_id}/submissions/{submission_id}/artifacts/{artifact_id}", response_model=SuccessResponse)
+async def delete_submission_artifact(
+    hackathon_id: int,
+    submission_id: int,
+    artifact_id: int,
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """Detach a file from a submission (the stored bytes stay, other links may share them)"""
+    try:
+        get_hackathon_for_user(db, hackathon_id, current_user)
+
+        deleted = db.query(SubmissionArtifact).filter(
+            SubmissionArtifact.id == artifact_id,
+            SubmissionArtifact.hackathon_id == hackathon_id,
+            SubmissionArtifact.submission_id == submission_id
+        ).delete(synchronize_session=False)
+        if not deleted:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Artifact not found"
+            )
+        db.commit()
+
+        return SuccessResponse(success=True, message="Artifact removed successfully")
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to remove artifact: {str(e)}"
+        )
+
+@router.get("/{hackathon_id}/leaderboard", response_model=LeaderboardResponse)
+async def get_hackathon_leaderboard(
+    hackathon_id: int,
+    top: int = Query(10, ge=1, le=1000),
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """Get the top-K teams of a hackathon (tied teams share a rank)"""
+    try:
+        get_hackathon_for_user(db, hackathon_id, current_user)
+
+        board = get_leaderboard(db, hackathon_id)
+
+        return LeaderboardResponse(
+            hackathon_id=hackathon_id,
+            total_teams=len(board),
+            entries=[LeaderboardEntry(**entry) for entry in board.top(top)]
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to fetch leaderboard: {str(e)}"
+        )
+
+@router.get("/{hackathon_id}/leaderboard/teams/{team_id}", response_model=LeaderboardEntry)
+async def get_team_rank(
+    hackathon_id: int,
+    team_id: int,
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """Get the current rank and score of a single team"""
+    try:
+        get_hackathon_for_user(db, hackathon_id, current_user)
+
+        entry = get_leaderboard(db, hackathon_id).rank_of(team_id)
+
+        if entry is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Team has no scored submissions"
+            )
+
+        return LeaderboardEntry(**entry)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to fetch team rank: {str(e)}"
+        )
+
+@router.get("/{hackathon_id}/leaderboard/stream")
+async def stream_leaderboard(
+    hackathon_id: int,
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """Stream leaderboard changes as Server-Sent Events"""
+    get_hackathon_for_user(db, hackathon_id, current_user)
+    board = get_leaderboard(db, hackathon_id)
+    # Release the connection; the stream itself never touches the database
+    db.close()
+    queue = board.subscribe()
+
+    async def event_stream():
+        seen_version = board.version
+        try:
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=HEARTBEAT_INTERVAL)
+                except asyncio.TimeoutError:
+                    # Scores written by other workers do not reach this board until it is read again
+                    version = leaderboard_version(hackathon_id)
+                    if version != seen_version and version != board.version:
+                        seen_version = version
+                        yield f"event: reset\ndata: {json.dumps({'type': 'reset', 'hackathon_id': hackathon_id})}\n\n"
+                    else:
+                        yield ": keep-alive\n\n"
+                    continue
+                yield f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
+        finally:
+            board.unsubscribe(queue)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -0,0 +1,204 @@
+import os
+from fastapi import APIRouter, Depends, Header, HTTPException, Path, Query, Request, Response, status
+from sqlalchemy.orm import Session
+from typing import Optional
+from utils.database import get_db
+from utils.replicas import get_read_db
+from models.database import StoredFile, UploadSession, User
+from models.schemas import StoredFileResponse, UploadSessionCreate, UploadSessionResponse
+from utils.auth import get_current_active_user
+from utils.http_cache import IMMUTABLE_CACHE_CONTROL, RangedFileResponse, etag_matches, parse_byte_range
+from utils.storage import (
+    UPLOAD_CHUNK_SIZE, UploadError, object_path, describe_file, store_stream,
+    create_upload_session, append_to_session, complete_session
+)
+
+router = APIRouter(tags=["uploads"])
+
+SHA256_PATTERN = r"^[0-9a-f]{64}$"
+# Types a browser may display in place; anything else (HTML, SVG, scripts) is downloaded
+INLINE_CONTENT_TYPES = {"image/png", "image/jpeg", "image/gif", "image/webp", "application/pdf"}
+# Uploaded bytes are untrusted: never sniff them into another type, and never run them as a page
+DOWNLOAD_SECURITY_HEADERS = {"X-Content-Type-Options": "nosniff", "Content-Security-Policy": "sandbox"}
+
+def _session_response(upload: UploadSession, stored: Optional[StoredFile] = None) -> UploadSessionResponse:
+    return UploadSessionResponse(
+        upload_id=upload.id,
+        status=upload.status,
+        received_size=upload.received_size,
+        total_size=upload.total_size,
+        chunk_size=UPLOAD_CHUNK_SIZE,
+        file=StoredFileResponse(**describe_file(stored)) if stored is not None else None
+    )
+
+def _get_upload_for_user(db: Session, upload_id: str, current_user: User) -> UploadSession:
+    upload = db.query(UploadSession).filter(UploadSession.id == upload_id).first()
+    if not upload or (current_user.role != "superadmin" and upload.owner_id != current_user.id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Upload not found"
+        )
+    return upload
+
+@router.post("/files", response_model=StoredFileResponse, status_code=status.HTTP_201_CREATED)
+async def upload_file(
+    request: Request,
+    content_sha256: Optional[str] = Header(None, alias="X-Content-SHA256"),
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """Store the raw request body in one go (use /uploads for resumable uploads)"""
+    try:
+        stored = await store_stream(
+            db,
+            request.stream(),
+            request.headers.get("content-type", "application/octet-stream"),
+            current_user.id,
+            expected_sha256=content_sha256
+        )
+        return StoredFileResponse(**describe_file(stored))
+
+    except UploadError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+    except HTTPException:
+        raise
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to store file: {str(e)}"
+        )
+
+@router.api_route("/files/{sha256}", methods=["GET", "HEAD"])
+async def download_file(
+    request: Request,
+    sha256: str = Path(..., pattern=SHA256_PATTERN),
+    filename: Optional[str] = Query(None, max_length=255),
+    db: Session = Depends(get_read_db)
+):
+    """Serve a stored file, honouring single byte ranges"""
+    stored = db.query(StoredFile).filter(StoredFile.sha256 == sha256).first()
+    path = object_path(sha256)
+    if not stored or not os.path.exists(path):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="File not found"
+        )
+
+    # Content-addressed: the hash is a strong validator and the bytes never change
+    etag = f'"{sha256}"'
+    headers = {"ETag": etag, "Cache-Control": IMMUTABLE_CACHE_CONTROL, **DOWNLOAD_SECURITY_HEADERS}
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    byte_range = None
+    if_range = request.headers.get("if-range")
+    if if_range is None or if_range.strip() == etag:
+        try:
+            byte_range = parse_byte_range(request.headers.get("range"), stored.size)
+        except ValueError:
+            return Response(
+                status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                headers={**headers, "Content-Range": f"bytes */{stored.size}"}
+            )
+
+    disposition = "inline" if stored.content_type.split(";")[0].strip().lower() in INLINE_CONTENT_TYPES else "attachment"
+    if disposition == "attachment" and filename is None:
+        headers["Content-Disposition"] = "attachment"
+    return RangedFileResponse(
+        path,
+        stored.size,
+        byte_range,
+        headers=headers,
+        media_type=stored.content_type,
+        filename=filename,
+        method=request.method,
+        content_disposition_type=disposition
+    )
+
+@router.post("/uploads", response_model=UploadSessionResponse, status_code=status.HTTP_201_CREATED)
+async def start_upload(
+    upload_data: UploadSessionCreate,
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """Open a resumable upload; send the bytes with PATCH /uploads/{upload_id}"""
+    try:
+        upload = create_upload_session(
+            db,
+            current_user.id,
+            upload_data.filename,
+            upload_data.content_type,
+            upload_data.total_size,
+            upload_data.sha256
+        )
+        return _session_response(upload)
+
+    except UploadError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to start upload: {str(e)}"
+        )
+
+@router.get("/uploads/{upload_id}", response_model=UploadSessionResponse)
+async def get_upload(
+    upload_id: str,
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """Current offset of an upload, to resume after a dropped connection"""
+    upload = _get_upload_for_user(db, upload_id, current_user)
+    stored = db.query(StoredFile).filter(StoredFile.id == upload.file_id).first() if upload.file_id else None
+    return _session_response(upload, stored)
+
+@router.patch("/uploads/{upload_id}", response_model=UploadSessionResponse)
+async def append_upload(
+    upload_id: str,
+    request: Request,
+    upload_offset: int = Header(..., alias="Upload-Offset", ge=0),
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """Append the request body at Upload-Offset, which must equal the bytes received so far"""
+    try:
+        upload = _get_upload_for_user(db, upload_id, current_user)
+        await append_to_session(db, upload, upload_offset, request.stream())
+        db.refresh(upload)
+        return _session_response(upload)
+
+    except UploadError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+    except HTTPException:
+        raise
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to append to upload: {str(e)}"
+        )
+
+@router.post("/uploads/{upload_id}/complete", response_model=UploadSessionResponse)
+async def finish_upload(
+    upload_id: str,
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """Verify a finished upload and move it into storage (deduplicated by SHA-256)"""
+    try:
+        upload = _get_upload_for_user(db, upload_id, current_user)
+        stored = await complete_session(db, upload)
+        return _session_response(upload, stored)
+
+    except UploadError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+    except HTTPException:
+        raise
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to complete upload: {str(e)}"
+        )
@@ -0,0 +1,383 @@
+"""
+Fixtures for the API tests: the route budgets (tests/test_route_budgets.py)
+and the focused behaviour tests next to them.
+
+Every test gets a private in-memory SQLite database copied from a template
+that is seeded once per data size. ``get_db`` and ``get_read_db`` are
+overridden to use it and ``SessionLocal`` is rebound, so background helpers
+such as the admission writer use it too. The DBAPI connection is wrapped to
+count the SQL statements executed and the rows fetched.
+"""
+import os
+import shutil
+import sqlite3
+import tempfile
+from datetime import datetime, timedelta
+
+# Settings are read at import time, so they must be in place before the app loads
+TEST_DIR = tempfile.mkdtemp(prefix="hackathon-tests-")
+os.environ["DATABASE_URL"] = "sqlite://"
+os.environ["REPLICA_DATABASE_URLS"] = ""
+os.environ["CACHE_BACKEND"] = "memory"
+os.environ["STATIC_DIR"] = os.path.join(TEST_DIR, "static")
+os.environ["STORAGE_DIR"] = os.path.join(TEST_DIR, "storage")
+os.environ["SMTP_HOST"] = ""
+# Load the revocation list once; a time-based resync would make counts flaky
+os.environ["REVOCATION_SYNC_SECONDS"] = "3600"
+
+from contextlib import asynccontextmanager
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+from main import app
+from models.database import (
+    User, Hackathon, Sponsor, Participant, ParticipantSkill, Team, Submission, MentorSession,
+    Judge, JudgeAssignment, MetricRollup, ArchivedHackathon, ArchivedActivityLog,
+    StoredFile, SubmissionArtifact
+)
+from utils.database import Base, SessionLocal, get_db
+from utils.replicas import get_read_db
+from utils.auth import create_access_token, get_password_hash
+from utils.admission import admission_queue
+from utils.archival import encode_payload
+from utils.skill_index import skill_keys
+
+# Children per hackathon at each data size; budgets must hold at both
+SMALL_SIZE = 10
+LARGE_SIZE = 10000
+SEED_BATCH_SIZE = 2000
+
+REGIONS = ["EMEA", "APAC", "NA", "LATAM", "MEA"]
+SKILLS = ["Python", "Rust", "Go", "TypeScript", "React", "SQL", "ML", "Design", "DevOps", "Kotlin"]
+PARTICIPANT_STATUSES = ["applied", "approved", "rejected"]
+
+class QueryStats:
+    """Statements executed and rows fetched on the test connection"""
+    __slots__ = ("statements", "rows")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.statements = 0
+        self.rows = 0
+
+class CountingCursor:
+    """DBAPI cursor proxy that counts fetched rows"""
+
+    def __init__(self, cursor, stats: QueryStats):
+        object.__setattr__(self, "_cursor", cursor)
+        object.__setattr__(self, "_stats", stats)
+
+    def fetchone(self):
+        row = self._cursor.fetchone()
+        if row is not None:
+            self._stats.rows += 1
+        return row
+
+    def fetchmany(self, *args):
+        rows = self._cursor.fetchmany(*args)
+        self._stats.rows += len(rows)
+        return rows
+
+    def fetchall(self):
+        rows = self._cursor.fetchall()
+        self._stats.rows += len(rows)
+        return rows
+
+    def __iter__(self):
+        for row in self._cursor:
+            self._stats.rows += 1
+            yield row
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __setattr__(self, name, value):
+        setattr(self._cursor, name, value)
+
+class CountingConnection:
+    """DBAPI connection proxy handing out counting cursors"""
+
+    def __init__(self, connection: sqlite3.Connection, stats: QueryStats):
+        object.__setattr__(self, "_connection", connection)
+        object.__setattr__(self, "_stats", stats)
+
+    def cursor(self, *args, **kwargs):
+        return CountingCursor(self._connection.cursor(*args, **kwargs), self._stats)
+
+    def close(self):
+        # Owned by the fixture; StaticPool would otherwise close it on dispose
+        pass
+
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
+
+    def __setattr__(self, name, value):
+        setattr(self._connection, name, value)
+
+def _static_engine(connection):
+    return create_engine("sqlite://", creator=lambda: connection, poolclass=StaticPool)
+
+def _insert(session: Session, model, rows):
+    for start in range(0, len(rows), SEED_BATCH_SIZE):
+        session.execute(insert(model), rows[start:start + SEED_BATCH_SIZE])
+
+def hackathon_row(name: str, status: str, organizer_id: int, now: datetime) -> dict:
+    return {
+        "name": name, "description": f"{name} description", "theme": "AI",
+        "start_date": now + timedelta(days=30), "end_date": now + timedelta(days=32),
+        "application_open": now - timedelta(days=1), "application_close": now + timedelta(days=29),
+        "prize_pool": "$1000", "rules": "Be nice", "submission_requirements": "Repo",
+        "communication_channels": "Discord", "status": status, "organizer_id": organizer_id,
+        "created_at": now, "updated_at": now
+    }
+
+def seed(session: Session, size: int) -> dict:
+    """Seed users, one busy hackathon with ``size`` of each child and ``size`` other rows"""
+    now = datetime.utcnow().replace(microsecond=0)
+    password = get_password_hash("password")
+    _insert(session, User, [
+        {"email": "owner@example.com", "username": "owner", "hashed_password": password,
+         "full_name": "Owner", "role": "organizer", "is_active": True},
+        {"email": "admin@example.com", "username": "admin", "hashed_password": password,
+         "full_name": "Admin", "role": "superadmin", "is_active": True},
+    ])
+    owner_id, admin_id = 1, 2
+
+    # Hackathon 1 is the busy one; the rest pad the list and batch routes
+    _insert(session, Hackathon, [hackathon_row("Main Event", "upcoming", owner_id, now)] + [
+        hackathon_row(f"Event {index}", ["upcoming", "ongoing", "past"][index % 3], owner_id, now)
+        for index in range(size)
+    ])
+    hackathon_id = 1
+    spare_hackathon_id = 2
+
+    _insert(session, Sponsor, [
+        {"hackathon_id": hackathon_id, "name": name, "name_key": name.lower(), "position": position}
+        for position, name in enumerate(["Acme", "Globex", "Initech"])
+    ])
+    _insert(session, Team, [
+        {"hackathon_id": hackathon_id, "name": f"Team {index}", "status": "submitted", "created_at": now}
+        for index in range(size)
+    ])
+    participants = [
+        {
+            "hackathon_id": hackathon_id, "name": f"Participant {index}", "email": f"p{index}@example.com",
+            "university_company": f"University {index % 20}", "region": REGIONS[index % len(REGIONS)],
+            "skills": [SKILLS[index % len(SKILLS)], SKILLS[(index * 7 + 3) % len(SKILLS)]],
+            "status": PARTICIPANT_STATUSES[index % len(PARTICIPANT_STATUSES)],
+            "team_id": index + 1, "registration_date": now
+        }
+        for index in range(size)
+    ]
+    _insert(session, Participant, participants)
+    _insert(session, ParticipantSkill, [
+        {"hackathon_id": hackathon_id, "participant_id": index + 1, "skill": key}
+        for index, participant in enumerate(participants)
+        for key in skill_keys(participant["skills"])
+    ])
+    _insert(session, Submission, [
+        {
+            "hackathon_id": hackathon_id, "team_id": index + 1, "title": f"Project {index}",
+            "description": "A project", "status": "evaluated" if index % 2 else "submitted",
+            "score": float(index % 100) if index % 2 else None, "submitted_at": now
+        }
+        for index in range(size)
+    ])
+    _insert(session, MentorSession, [
+        {
+            "hackathon_id": hackathon_id, "mentor_name": f"Mentor {index}", "mentor_email": f"m{index}@example.com",
+            "session_topic": "Pitching", "session_date": now + timedelta(days=31)
+        }
+        for index in range(size)
+    ])
+    _insert(session, Judge, [
+        {"hackathon_id": hackathon_id, "name": f"Judge {index}", "email": f"j{index}@example.com",
+         "affiliation": f"University {index}", "created_at": now}
+        for index in range(5)
+    ])
+    _insert(session, JudgeAssignment, [
+        {"hackathon_id": hackathon_id, "judge_id": 1, "submission_id": index + 1, "assigned_at": now}
+        for index in range(min(size, 10))
+    ])
+
+    _insert(session, StoredFile, [
+        {"sha256": "a" * 64, "size": 3, "content_type": "video/mp4", "uploaded_by": owner_id, "created_at": now},
+        {"sha256": "b" * 64, "size": 3, "content_type": "image/png", "uploaded_by": owner_id, "created_at": now},
+    ])
+    for sha256 in ("a" * 64, "b" * 64):
+        path = os.path.join(os.environ["STORAGE_DIR"], "objects", sha256[:2], sha256[2:4], sha256)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as stored:
+            stored.write(b"abc")
+    _insert(session, SubmissionArtifact, [
+        {"hackathon_id": hackathon_id, "submission_id": 1, "file_id": 1, "filename": f"demo{index}.mp4",
+         "kind": "video", "created_at": now}
+        for index in range(3)
+    ])
+
+    # Registrations spread over the last days, at every granularity the rollups keep
+    rollups = []
+    for index in range(size):
+        moment = now - timedelta(minutes=index)
+        for granularity, bucket in (
+            ("minute", moment.replace(second=0)),
+            ("hour", moment.replace(minute=0, second=0)),
+            ("day", moment.replace(hour=0, minute=0, second=0)),
+        ):
+            rollups.append((granularity, bucket))
+    _insert(session, MetricRollup, [
+        {"metric": "registrations", "granularity": granularity, "bucket_start": bucket, "dimension": "",
+         "value": 1, "hackathon_id": hackathon_id, "organizer_id": owner_id}
+        for granularity, bucket in dict.fromkeys(rollups)
+    ])
+
+    payload, payload_size = encode_payload({"hackathon": {"id": 0}, "participants": [], "teams": [], "submissions": []})
+    _insert(session, ArchivedHackathon, [
+        {
+            "hackathon_id": 100000 + index, "organizer_id": owner_id, "name": f"Archived {index}", "status": "past",
+            "start_date": now - timedelta(days=400), "end_date": now - timedelta(days=398),
+            "payload": payload, "payload_size": payload_size, "archived_at": now
+        }
+        for index in range(size)
+    ])
+    _insert(session, ArchivedActivityLog, [
+        {"action": "login", "resource_type": "user", "resource_id": owner_id, "timestamp": now - timedelta(days=400),
+         "user_id": owner_id}
+        for _ in range(size)
+    ])
+    session.commit()
+
+    return {
+        "size": size,
+        "owner_id": owner_id,
+        "admin_id": admin_id,
+        "hackathon_id": hackathon_id,
+        "spare_hackathon_id": spare_hackathon_id,
+        "team_id": 1,
+        "participant_id": 1,
+        "submission_id": 1,
+        "judge_id": 1,
+        "artifact_id": 1,
+        "archived_hackathon_id": 100000,
+        "video_sha256": "a" * 64,
+        "image_sha256": "b" * 64,
+    }
+
+_templates = {}
+
+def template_database(size: int):
+    """Seeded database for a data size, built once per test session"""
+    if size not in _templates:
+        connection = sqlite3.connect(":memory:", check_same_thread=False)
+        engine = _static_engine(connection)
+        Base.metadata.create_all(engine)
+        with Session(engine) as session:
+            ids = seed(session, size)
+        _templates[size] = (connection, ids)
+    return _templates[size]
+
+class Harness:
+    """A fresh copy of a seeded database wired into the app"""
+
+    def __init__(self, size: int):
+        template, ids = template_database(size)
+        self.connection = sqlite3.connect(":memory:", check_same_thread=False)
+        template.backup(self.connection)
+        self.ids = dict(ids)
+        self.stats = QueryStats()
+        self.engine = _static_engine(CountingConnection(self.connection, self.stats))
+        event.listen(self.engine, "before_cursor_execute", self._count_statement)
+
+    def _count_statement(self, *args):
+        self.stats.statements += 1
+
+    def session(self) -> Session:
+        return SessionLocal()
+
+    def token(self, username: str = "owner") -> str:
+        return create_access_token(data={"sub": username})
+
+    def auth_headers(self, username: str = "owner") -> dict:
+        return {"Authorization": f"Bearer {self.token(username)}"}
+
+    def add_organizer(self, username: str, full_name: str = "Other Organizer") -> int:
+        """Another organizer (password "password"); returns the user id"""
+        with self.session() as session:
+            user = User(
+                email=f"{username}@example.com", username=username, full_name=full_name, role="organizer",
+                hashed_password=get_password_hash("password"), is_active=True
+            )
+            session.add(user)
+            session.commit()
+            return user.id
+
+    def add_hackathon(self, name: str, organizer_id: int, status: str = "upcoming", **fields) -> int:
+        """A hackathon without children; returns its id"""
+        row = {**hackathon_row(name, status, organizer_id, datetime.utcnow().replace(microsecond=0)), **fields}
+        with self.session() as session:
+            hackathon_id = session.execute(insert(Hackathon).values(**row).returning(Hackathon.id)).scalar_one()
+            session.commit()
+            return hackathon_id
+
+    def close(self):
+        self.engine.dispose()
+        self.connection.close()
+
+@asynccontextmanager
+async def _test_lifespan(app):
+    # The schema comes from the template; only the admission writer is needed
+    admission_queue.start()
+    yield
+    await admission_queue.stop()
+
+def _bind(harness: Harness):
+    SessionLocal.configure(bind=harness.engine)
+
+    def override_db():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_db
+    app.dependency_overrides[get_read_db] = override_db
+
+def _warm_up(test_client: TestClient):
+    """Run a login and a list once so lazy imports do not count against the first test"""
+    harness = Harness(SMALL_SIZE)
+    _bind(harness)
+    test_client.post("/api/auth/login", json={"email": "admin@example.com", "password": "password"})
+    test_client.get("/api/hackathons/", headers=harness.auth_headers())
+    harness.close()
+
+@pytest.fixture(scope="session")
+def client():
+    app.router.lifespan_context = _test_lifespan
+    bind = SessionLocal.kw["bind"]
+    with TestClient(app) as test_client:
+        _warm_up(test_client)
+        yield test_client
+    app.dependency_overrides.clear()
+    SessionLocal.configure(bind=bind)
+    shutil.rmtree(TEST_DIR, ignore_errors=True)
+
+@pytest.fixture
+def make_harness(client):
+    """Factory for harnesses at a given data size, each wired into the app"""
+    harnesses = []
+
+    def factory(size: int) -> Harness:
+        harness = Harness(size)
+        harnesses.append(harness)
+        _bind(harness)
+        return harness
+
+    yield factory
+
+    for harness in harnesses:
+        harness.close()
@@ -0,0 +1,102 @@
+"""
+Admission queue: the application window, case-insensitive deduplication of
+emails and a writer that always settles its tickets.
+"""
+import asyncio
+import time
+from datetime import datetime, timedelta
+from models.database import Participant, ParticipantSkill
+from utils import admission
+from utils.admission import AdmissionQueue, Application, write_applications
+from conftest import SMALL_SIZE
+
+def _application(harness, email, **fields):
+    return Application(
+        hackathon_id=harness.ids["hackathon_id"], organizer_id=harness.ids["owner_id"], name="Ada", email=email,
+        **fields
+    )
+
+def _apply(client, hackathon_id, email):
+    return client.post(f"/api/hackathons/{hackathon_id}/apply", json={"name": "Ada", "email": email})
+
+def _outcome(client, hackathon_id, ticket_id):
+    for _ in range(100):
+        ticket = client.get(f"/api/hackathons/{hackathon_id}/applications/{ticket_id}").json()
+        if ticket["status"] != "queued":
+            return ticket
+        time.sleep(0.02)
+    raise AssertionError("Application was not written")
+
+def test_batch_dedups_emails_case_insensitively_and_keeps_the_typed_address(make_harness):
+    harness = make_harness(SMALL_SIZE)
+    results = write_applications([
+        _application(harness, "Ada.Lovelace@Example.com", skills=["Python", " python", "Rust"]),
+        _application(harness, "ada.lovelace@example.com"),
+        _application(harness, "P0@EXAMPLE.com"),  # Seeded participant
+    ])
+    assert [outcome for outcome, _, _ in results] == ["accepted", "duplicate", "duplicate"]
+
+    with harness.session() as db:
+        participant = db.get(Participant, results[0][1])
+        assert participant.email == "Ada.Lovelace@Example.com"
+        assert sorted(skill for skill, in db.query(ParticipantSkill.skill).filter(
+            ParticipantSkill.participant_id == participant.id
+        )) == ["python", "rust"]
+
+    # A later batch (or another worker) still finds the stored address
+    assert write_applications([_application(harness, "ADA.LOVELACE@example.com")])[0][0] == "duplicate"
+
+def test_application_is_accepted_once(make_harness, client):
+    harness = make_harness(SMALL_SIZE)
+    hackathon_id = harness.ids["hackathon_id"]
+    first = _apply(client, hackathon_id, "new.applicant@example.com")
+    assert first.status_code == 202
+    accepted = _outcome(client, hackathon_id, first.json()["ticket_id"])
+    assert accepted["status"] == "accepted" and accepted["participant_id"]
+
+    again = _apply(client, hackathon_id, "New.Applicant@example.com")
+    assert _outcome(client, hackathon_id, again.json()["ticket_id"])["status"] == "duplicate"
+
+def test_applications_outside_the_window_are_refused(make_harness, client):
+    harness = make_harness(SMALL_SIZE)
+    now = datetime.utcnow()
+    closed = harness.add_hackathon("Closed", harness.ids["owner_id"], application_close=now - timedelta(days=1))
+    not_yet = harness.add_hackathon("Not Yet", harness.ids["owner_id"], application_open=now + timedelta(days=1))
+    past = harness.add_hackathon("Over", harness.ids["owner_id"], status="past")
+    for hackathon_id in (closed, not_yet, past):
+        assert _apply(client, hackathon_id, "late@example.com").status_code == 403
+    assert _apply(client, 999999, "late@example.com").status_code == 404
+
+def test_writer_settles_tickets_it_cannot_save(make_harness):
+    harness = make_harness(SMALL_SIZE)
+
+    async def scenario():
+        queue = AdmissionQueue()
+        queue.start()
+        queue.submit(_application(harness, "first@example.com"))
+
+        def broken_save(ticket):
+            raise RuntimeError("shared tier unavailable")
+
+        queue._tickets.save = broken_save
+        await asyncio.wait_for(queue._queue.join(), timeout=5)
+        await queue.stop()
+        return queue
+
+    queue = asyncio.run(scenario())
+    assert queue.accepted == 1 and queue._pending == {}
+
+def test_stop_does_not_hang_on_a_dead_writer(make_harness, monkeypatch):
+    harness = make_harness(SMALL_SIZE)
+    monkeypatch.setattr(admission, "ADMISSION_DRAIN_TIMEOUT_SECONDS", 0.1)
+
+    async def scenario():
+        queue = AdmissionQueue()
+        queue.start()
+        queue._writer.cancel()
+        await asyncio.sleep(0)
+        # Never written: join() alone would wait forever
+        queue.submit(_application(harness, "stranded@example.com"))
+        await asyncio.wait_for(queue.stop(), timeout=1)
+
+    asyncio.run(scenario())
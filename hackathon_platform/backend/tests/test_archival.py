@@ -0,0 +1,87 @@
+"""
+Archival round-trip: everything moved out of the live tables comes back,
+unchanged, from the archive.
+"""
+import json
+from datetime import datetime, timedelta
+from sqlalchemy import select
+from models.database import ActivityLog, ArchivedActivityLog, ArchivedHackathon, Hackathon
+from utils.archival import (
+    HACKATHON_CHILD_MODELS, _json_default, archive_activity_logs, archive_hackathons, decode_payload
+)
+from conftest import SMALL_SIZE
+
+def _as_json(rows):
+    return json.loads(json.dumps(rows, default=_json_default))
+
+def _end_main_event(harness, db):
+    hackathon_id = harness.ids["hackathon_id"]
+    db.query(Hackathon).filter(Hackathon.id == hackathon_id).update({
+        "status": "past", "end_date": datetime.utcnow() - timedelta(days=400)
+    })
+    db.commit()
+    return hackathon_id
+
+def test_archived_hackathon_keeps_every_child_row(make_harness):
+    harness = make_harness(SMALL_SIZE)
+    with harness.session() as db:
+        hackathon_id = _end_main_event(harness, db)
+        hackathon_row = dict(db.execute(select(Hackathon.__table__).where(Hackathon.id == hackathon_id)).mappings().one())
+        live = {
+            model.__tablename__: [
+                dict(row) for row in db.execute(
+                    select(model.__table__).where(model.hackathon_id == hackathon_id).order_by(model.id)
+                ).mappings()
+            ]
+            for model in HACKATHON_CHILD_MODELS
+        }
+        # Only past hackathons that ended before the cutoff move
+        assert archive_hackathons(db, datetime.utcnow() - timedelta(days=365), batch_size=1) == 1
+
+        for model in HACKATHON_CHILD_MODELS:
+            assert db.query(model).filter(model.hackathon_id == hackathon_id).count() == 0
+        assert db.get(Hackathon, hackathon_id) is None
+
+        archived = db.query(ArchivedHackathon).filter(ArchivedHackathon.hackathon_id == hackathon_id).one()
+        document = decode_payload(archived.payload)
+        assert document["hackathon"] == _as_json(hackathon_row)
+        for name, rows in live.items():
+            assert document[name] == _as_json(rows), name
+        assert archived.participant_count == len(live["participants"]) == SMALL_SIZE
+
+def test_archived_hackathon_is_served_read_only(make_harness, client):
+    harness = make_harness(SMALL_SIZE)
+    with harness.session() as db:
+        hackathon_id = _end_main_event(harness, db)
+        archive_hackathons(db, datetime.utcnow() - timedelta(days=365))
+
+    assert client.get(f"/api/hackathons/{hackathon_id}", headers=harness.auth_headers()).status_code == 404
+    response = client.get(f"/api/archive/hackathons/{hackathon_id}", headers=harness.auth_headers())
+    assert response.status_code == 200
+    assert response.json()["name"] == "Main Event"
+    assert len(response.json()["data"]["submissions"]) == SMALL_SIZE
+
+    harness.add_organizer("other")
+    assert client.get(
+        f"/api/archive/hackathons/{hackathon_id}", headers=harness.auth_headers("other")
+    ).status_code == 403
+
+def test_only_aged_activity_logs_move(make_harness):
+    harness = make_harness(SMALL_SIZE)
+    now = datetime.utcnow().replace(microsecond=0)
+    with harness.session() as db:
+        already_archived = db.query(ArchivedActivityLog).count()
+        for days in (400, 200, 1):
+            db.add(ActivityLog(
+                action="update", resource_type="hackathon", resource_id=days, details=f"{days} days ago",
+                timestamp=now - timedelta(days=days), ip_address="203.0.113.9", user_id=harness.ids["owner_id"]
+            ))
+        db.commit()
+
+        assert archive_activity_logs(db, now - timedelta(days=90), batch_size=1) == 2
+        assert [log.resource_id for log in db.query(ActivityLog)] == [1]
+        moved = db.query(ArchivedActivityLog).order_by(ArchivedActivityLog.id).all()[already_archived:]
+        assert [(log.resource_id, log.details, log.timestamp, log.ip_address) for log in moved] == [
+            (400, "400 days ago", now - timedelta(days=400), "203.0.113.9"),
+            (200, "200 days ago", now - timedelta(days=200), "203.0.113.9"),
+        ]
@@ -0,0 +1,53 @@
+"""
+Refresh token rotation and the revocation list behind it.
+"""
+from datetime import datetime, timedelta
+from models.database import RevokedToken
+from utils import revocation
+from utils.auth import create_refresh_token
+from utils.revocation import RevocationList
+from conftest import SMALL_SIZE
+
+def test_refresh_token_works_once(make_harness, client):
+    make_harness(SMALL_SIZE)
+    refresh_token = create_refresh_token(data={"sub": "owner"})
+    first = client.post("/api/auth/refresh", json={"refresh_token": refresh_token})
+    assert first.status_code == 200
+    rotated = first.json()["refresh_token"]
+    assert rotated != refresh_token
+
+    reused = client.post("/api/auth/refresh", json={"refresh_token": refresh_token})
+    assert reused.status_code == 401
+    assert reused.json()["detail"] == "Refresh token has already been used"
+    assert client.post("/api/auth/refresh", json={"refresh_token": rotated}).status_code == 200
+
+def test_access_token_is_not_a_refresh_token(make_harness, client):
+    harness = make_harness(SMALL_SIZE)
+    response = client.post("/api/auth/refresh", json={"refresh_token": harness.token()})
+    assert response.status_code == 401
+
+def test_logout_revokes_the_access_and_refresh_tokens(make_harness, client):
+    harness = make_harness(SMALL_SIZE)
+    headers = harness.auth_headers()
+    refresh_token = create_refresh_token(data={"sub": "owner"})
+    assert client.get("/api/hackathons/", headers=headers).status_code == 200
+    assert client.post("/api/auth/logout", json={"refresh_token": refresh_token}, headers=headers).status_code == 204
+    assert client.get("/api/hackathons/", headers=headers).status_code == 401
+    assert client.post("/api/auth/refresh", json={"refresh_token": refresh_token}).status_code == 401
+
+def test_revocations_committed_out_of_order_reach_other_workers(make_harness, monkeypatch):
+    harness = make_harness(SMALL_SIZE)
+    monkeypatch.setattr(revocation, "REVOCATION_SYNC_SECONDS", 0)
+    expires_at = datetime.utcnow() + timedelta(hours=1)
+    other_worker = RevocationList()
+    with harness.session() as db:
+        RevocationList().revoke(db, "first", "access", expires_at)
+        db.commit()
+        assert other_worker.is_revoked(db, "first")
+        # Stamped before the previous sync but committed after it, like a slow transaction
+        db.add(RevokedToken(
+            jti="late", token_type="access", expires_at=expires_at, revoked_at=datetime.utcnow() - timedelta(seconds=30)
+        ))
+        db.commit()
+        assert other_worker.is_revoked(db, "late")
+        assert not other_worker.is_revoked(db, "never-revoked")
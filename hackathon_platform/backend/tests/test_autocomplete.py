@@ -0,0 +1,86 @@
+"""
+Hackathon autocomplete: word-prefix matching, organizer scoping and reloads
+after changes that other code paths make.
+"""
+import pytest
+from models.database import User
+from utils.autocomplete import GENERATION_CACHE_KEY, PrefixIndex, autocomplete_index
+from utils.cache import cache
+from conftest import SMALL_SIZE
+
+@pytest.fixture
+def harness(make_harness):
+    harness = make_harness(SMALL_SIZE)
+    # The index is per process; make the first query load this harness's database
+    autocomplete_index.publish(adopt=False)
+    return harness
+
+def _suggest(client, harness, q, username="owner", **params):
+    response = client.get(
+        "/api/hackathons/autocomplete", params={"q": q, **params}, headers=harness.auth_headers(username)
+    )
+    assert response.status_code == 200
+    return response.json()["suggestions"]
+
+def test_every_word_starts_a_term():
+    index = PrefixIndex()
+    index.load([
+        (1, 10, "AI Hackathon", "Health", "Grace Hopper"),
+        (2, 10, "Hack the Planet", None, "Grace Hopper"),
+        (3, 20, "Data Jam", "Hackers welcome", "Alan Turing"),
+    ], generation="g")
+    # In term order: "hack the planet" < "hackathon" < "hackers welcome"
+    assert [hit["id"] for hit in index.search("HACK", 10)] == [2, 1, 3]
+    assert [hit["id"] for hit in index.search("  the   plan", 10)] == [2]
+    # Each hackathon once, however many of its terms match
+    assert [hit["id"] for hit in index.search("h", 10)] == [2, 1, 3]
+    assert [hit["id"] for hit in index.search("h", 2)] == [2, 1]
+    assert index.search("hack", 10, organizer_id=20) == [
+        {"id": 3, "name": "Data Jam", "theme": "Hackers welcome", "organizer_name": "Alan Turing"}
+    ]
+
+def test_put_and_remove_keep_both_arrays_in_step():
+    index = PrefixIndex()
+    index.load([(1, 10, "Old Name", None, "Grace")], generation="g")
+    assert index.put(1, 10, "New Name", None, "Grace")
+    assert not index.put(1, 10, "New Name", None, "Grace")
+    assert index.search("old", 10) == [] and index.search("old", 10, organizer_id=10) == []
+    assert [hit["id"] for hit in index.search("new", 10, organizer_id=10)] == [1]
+    assert index.remove([1]) and len(index) == 0
+    assert index.search("new", 10, organizer_id=10) == []
+
+def test_organizers_only_get_their_own_hackathons(harness, client):
+    other_id = harness.add_organizer("other", full_name="Other Person")
+    theirs = harness.add_hackathon("Event Horizon", other_id)
+    autocomplete_index.publish(adopt=False)
+
+    assert theirs not in [hit["id"] for hit in _suggest(client, harness, "event", limit=20)]
+    assert [hit["id"] for hit in _suggest(client, harness, "event", username="other")] == [theirs]
+    assert theirs in [hit["id"] for hit in _suggest(client, harness, "event horizon", username="admin")]
+
+def test_renamed_hackathons_are_suggested_under_the_new_name(harness, client):
+    renamed = client.put(
+        f"/api/hackathons/{harness.ids['hackathon_id']}", json={"name": "Quantum Sprint"}, headers=harness.auth_headers()
+    )
+    assert renamed.status_code == 200
+    assert [hit["name"] for hit in _suggest(client, harness, "quant")] == ["Quantum Sprint"]
+    assert _suggest(client, harness, "main event") == []
+
+def test_renaming_an_organizer_reloads_the_index(harness, client):
+    assert _suggest(client, harness, "owner")[0]["organizer_name"] == "Owner"
+    with harness.session() as db:
+        db.get(User, harness.ids["owner_id"]).full_name = "Renamed Organizer"
+        db.commit()
+    hits = _suggest(client, harness, "renamed organizer", limit=20)
+    assert len(hits) == SMALL_SIZE + 1
+    assert {hit["organizer_name"] for hit in hits} == {"Renamed Organizer"}
+    assert _suggest(client, harness, "owner") == []
+
+def test_rolled_back_renames_do_not_force_a_reload(harness, client):
+    _suggest(client, harness, "main")
+    generation = cache.get(GENERATION_CACHE_KEY)
+    with harness.session() as db:
+        db.get(User, harness.ids["owner_id"]).full_name = "Never Saved"
+        db.flush()
+        db.rollback()
+    assert cache.get(GENERATION_CACHE_KEY) == generation
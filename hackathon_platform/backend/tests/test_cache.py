@@ -0,0 +1,65 @@
+"""
+Two-tier cache: reads fall through to the shared tier, and invalidations
+reach the local tier of every worker.
+"""
+import time
+import pytest
+from utils import cache as cache_module
+from utils.cache import Cache, LRUCache, SQLiteSharedStore
+
+@pytest.fixture
+def workers(tmp_path, monkeypatch):
+    """Two caches over one shared file, as two uvicorn workers would have"""
+    monkeypatch.setattr(cache_module, "CACHE_INVALIDATION_INTERVAL", 0)
+    path = str(tmp_path / "cache.sqlite3")
+    return Cache(shared=SQLiteSharedStore(path)), Cache(shared=SQLiteSharedStore(path))
+
+def test_lru_evicts_least_recently_used_and_expired_entries():
+    lru = LRUCache(max_entries=2)
+    lru.set("a", 1, time.time() + 60)
+    lru.set("b", 2, time.time() + 60)
+    assert lru.get("a") == (True, 1)
+    lru.set("c", 3, time.time() + 60)
+    assert lru.get("b") == (False, None)
+    lru.set("d", 4, time.time() - 1)
+    assert lru.get("d") == (False, None)
+
+def test_values_written_by_one_worker_are_read_by_another(workers):
+    first, second = workers
+    first.set("hackathon:1", {"name": "Main Event"}, ttl=60)
+    assert second.get("hackathon:1") == {"name": "Main Event"}
+    # Now served from the second worker's own tier
+    assert second.local.get("hackathon:1") == (True, {"name": "Main Event"})
+
+def test_invalidation_evicts_local_copies_in_every_worker(workers):
+    first, second = workers
+    first.set("hackathons:list:1", [1], ttl=60)
+    first.set("hackathons:list:2", [2], ttl=60)
+    first.set("hackathon:1", {"id": 1}, ttl=60)
+    for key in ("hackathons:list:1", "hackathons:list:2", "hackathon:1"):
+        second.get(key)
+
+    first.invalidate("hackathons:list:*")
+    assert second.get("hackathons:list:1") is None
+    assert second.get("hackathons:list:2") is None
+    assert second.get("hackathon:1") == {"id": 1}
+
+def test_invalidations_are_picked_up_once_per_interval(workers, monkeypatch):
+    first, second = workers
+    first.set("hackathon:1", {"id": 1}, ttl=60)
+    second.get("hackathon:1")
+    monkeypatch.setattr(cache_module, "CACHE_INVALIDATION_INTERVAL", 3600)
+    second._last_sync = time.monotonic()
+    first.invalidate("hackathon:1")
+    # Stale for at most the interval, then evicted on the next sync
+    assert second.get("hackathon:1") == {"id": 1}
+    second._last_sync = 0.0
+    assert second.get("hackathon:1") is None
+
+def test_add_only_succeeds_for_absent_or_expired_keys(tmp_path):
+    store = SQLiteSharedStore(str(tmp_path / "cache.sqlite3"))
+    assert store.add("lease", "a", time.time() + 60)
+    assert not store.add("lease", "b", time.time() + 60)
+    assert store.get("lease")[0] == "a"
+    store.set("expired", "a", time.time() - 1)
+    assert store.add("expired", "b", time.time() + 60)
@@ -0,0 +1,90 @@
+"""
+Change event fan-out: organizer scoping, Last-Event-ID resume and delivery
+between workers through the shared message log.
+"""
+import asyncio
+import json
+from utils import events
+from utils.cache import SQLiteSharedStore
+from utils.events import EventHub
+
+def _data(message):
+    return json.loads(message.split("data: ", 1)[1])
+
+def _drain(subscription):
+    messages = []
+    while not subscription.queue.empty():
+        messages.append(subscription.queue.get_nowait())
+    return messages
+
+def test_organizers_only_receive_their_own_events():
+    async def scenario():
+        hub = EventHub()
+        own, _, _ = hub.subscribe(organizer_id=1)
+        everything, _, _ = hub.subscribe(organizer_id=None)
+        hub.publish("hackathon.updated", 1, {"hackathon_id": 10})
+        hub.publish("hackathon.updated", 2, {"hackathon_id": 20})
+        return _drain(own), _drain(everything)
+
+    own, everything = asyncio.run(scenario())
+    assert [_data(message)["hackathon_id"] for message in own] == [10]
+    assert [_data(message)["hackathon_id"] for message in everything] == [10, 20]
+
+def test_last_event_id_replays_missed_events():
+    async def scenario():
+        hub = EventHub()
+        first, _, _ = hub.subscribe(organizer_id=1)
+        for hackathon_id in (1, 2, 3):
+            hub.publish("hackathon.updated", 1, {"hackathon_id": hackathon_id})
+        seen = _drain(first)[0]
+        last_event_id = seen.split("\n", 1)[0][len("id: "):]
+        hub.unsubscribe(first)
+        return hub.subscribe(organizer_id=1, last_event_id=last_event_id)
+
+    resumed, replay, reset = asyncio.run(scenario())
+    assert not reset
+    assert [_data(message)["hackathon_id"] for message in replay] == [2, 3]
+    assert resumed.queue.empty()
+
+def test_unknown_or_expired_event_ids_ask_for_a_reset():
+    async def scenario():
+        hub = EventHub(history_size=2)
+        for hackathon_id in range(5):
+            hub.publish("hackathon.updated", 1, {"hackathon_id": hackathon_id})
+        _, _, foreign = hub.subscribe(organizer_id=1, last_event_id="otherboot-3")
+        _, _, expired = hub.subscribe(organizer_id=1, last_event_id=f"{events.BOOT_ID}-1")
+        return foreign, expired
+
+    assert asyncio.run(scenario()) == (True, True)
+
+def test_slow_subscribers_are_marked_overflowed(monkeypatch):
+    monkeypatch.setattr(events, "SUBSCRIBER_QUEUE_SIZE", 2)
+
+    async def scenario():
+        hub = EventHub()
+        subscription, _, _ = hub.subscribe(organizer_id=None)
+        for hackathon_id in range(3):
+            hub.publish("hackathon.updated", 1, {"hackathon_id": hackathon_id})
+        return subscription
+
+    assert asyncio.run(scenario()).overflowed
+
+def test_workers_deliver_each_others_events_through_the_shared_log(tmp_path):
+    store = SQLiteSharedStore(str(tmp_path / "cache.sqlite3"))
+
+    async def scenario():
+        # Polled by hand instead of by start()'s background loop
+        publisher, listener = EventHub(store=store), EventHub(store=store)
+        subscription, _, _ = listener.subscribe(organizer_id=1)
+        publisher.publish("hackathon.counts_changed", 1, {"hackathon_id": 7})
+        await listener.poll_once()
+        delivered = _drain(subscription)
+        # Ids come from the shared log, so a client can resume on the other worker
+        await publisher.poll_once()
+        _, replay, reset = publisher.subscribe(organizer_id=1, last_event_id="shared-0")
+        return delivered, replay, reset
+
+    delivered, replay, reset = asyncio.run(scenario())
+    assert [_data(message)["hackathon_id"] for message in delivered] == [7]
+    assert delivered[0].startswith("id: shared-")
+    assert not reset and replay == delivered
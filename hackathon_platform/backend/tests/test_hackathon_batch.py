@@ -0,0 +1,34 @@
+"""
+Batch lookup of hackathons: request order is kept and every id gets a status.
+"""
+from conftest import SMALL_SIZE
+
+def test_batch_keeps_order_and_reports_each_id(make_harness, client):
+    harness = make_harness(SMALL_SIZE)
+    other_id = harness.add_hackathon("Someone Else's", harness.add_organizer("other"))
+    ids = [harness.ids["spare_hackathon_id"], 999999, other_id, harness.ids["hackathon_id"]]
+
+    response = client.get(f"/api/hackathons/batch?ids={','.join(map(str, ids))}", headers=harness.auth_headers())
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [(item["id"], item["status"]) for item in results] == [
+        (ids[0], "ok"), (999999, "not_found"), (other_id, "forbidden"), (ids[3], "ok")
+    ]
+    assert results[2]["hackathon"] is None
+    assert results[3]["hackathon"]["participant_count"] == SMALL_SIZE
+    assert [sponsor["name"] for sponsor in results[3]["hackathon"]["sponsors_data"]] == ["Acme", "Globex", "Initech"]
+
+def test_superadmin_sees_every_organizers_hackathons(make_harness, client):
+    harness = make_harness(SMALL_SIZE)
+    other_id = harness.add_hackathon("Someone Else's", harness.add_organizer("other"))
+    response = client.post(
+        "/api/hackathons/batch", json={"ids": [other_id, other_id]}, headers=harness.auth_headers("admin")
+    )
+    assert [item["status"] for item in response.json()["results"]] == ["ok", "ok"]
+
+def test_batch_rejects_bad_id_lists(make_harness, client):
+    harness = make_harness(SMALL_SIZE)
+    assert client.get("/api/hackathons/batch?ids=1,x", headers=harness.auth_headers()).status_code == 400
+    too_many = ",".join(str(index) for index in range(1, 102))
+    assert client.get(f"/api/hackathons/batch?ids={too_many}", headers=harness.auth_headers()).status_code == 400
+    assert client.post("/api/hackathons/batch", json={"ids": []}, headers=harness.auth_headers()).status_code == 400
@@ -0,0 +1,43 @@
+"""
+Conditional GETs and compression of the hackathon list and detail routes.
+"""
+from conftest import SMALL_SIZE
+
+def test_hackathon_detail_answers_304_for_its_etag(make_harness, client):
+    harness = make_harness(SMALL_SIZE)
+    url = f"/api/hackathons/{harness.ids['hackathon_id']}"
+    first = client.get(url, headers=harness.auth_headers())
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+
+    repeat = client.get(url, headers={**harness.auth_headers(), "If-None-Match": etag})
+    assert repeat.status_code == 304
+    assert repeat.headers["etag"] == etag
+    assert repeat.content == b""
+
+    other = client.get(url, headers={**harness.auth_headers(), "If-None-Match": 'W/"other"'})
+    assert other.status_code == 200
+
+def test_list_etag_changes_when_a_hackathon_changes(make_harness, client):
+    harness = make_harness(SMALL_SIZE)
+    etag = client.get("/api/hackathons/", headers=harness.auth_headers()).headers["etag"]
+    assert client.get(
+        "/api/hackathons/", headers={**harness.auth_headers(), "If-None-Match": etag}
+    ).status_code == 304
+
+    updated = client.put(
+        f"/api/hackathons/{harness.ids['hackathon_id']}", json={"name": "Renamed Event"}, headers=harness.auth_headers()
+    )
+    assert updated.status_code == 200
+    changed = client.get("/api/hackathons/", headers={**harness.auth_headers(), "If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+
+def test_large_json_bodies_are_gzipped(make_harness, client):
+    harness = make_harness(SMALL_SIZE)
+    response = client.get("/api/hackathons/", headers={**harness.auth_headers(), "Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.json()["total"] == SMALL_SIZE + 1
+
+    small = client.get("/health", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers
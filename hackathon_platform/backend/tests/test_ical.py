@@ -0,0 +1,61 @@
+"""
+iCalendar output: text escaping, folding of long content lines and
+conditional GETs of the feeds.
+"""
+from conftest import SMALL_SIZE
+from models.database import Hackathon
+from utils.ical import MAX_LINE_OCTETS, _escape, _fold
+
+def _unfold(text: str) -> str:
+    return text.replace("\r\n ", "")
+
+def test_text_values_are_escaped():
+    assert _escape("a;b,c\\d") == "a\\;b\\,c\\\\d"
+    assert _escape("one\r\ntwo\nthree\rfour") == "one\\ntwo\\nthree\\nfour"
+
+def test_short_lines_are_not_folded():
+    line = "SUMMARY:" + "x" * (MAX_LINE_OCTETS - len("SUMMARY:"))
+    assert _fold(line) == line
+
+def test_long_lines_fold_at_75_octets():
+    line = "DESCRIPTION:" + "x" * 200
+    folded = _fold(line)
+    pieces = folded.split("\r\n")
+    assert len(pieces) > 1
+    assert all(len(piece.encode("utf-8")) <= MAX_LINE_OCTETS for piece in pieces)
+    assert all(piece.startswith(" ") for piece in pieces[1:])
+    assert _unfold(folded) == line
+
+def test_folding_never_splits_a_multibyte_character():
+    line = "SUMMARY:" + "é€😀" * 40
+    folded = _fold(line)
+    for piece in folded.split("\r\n"):
+        assert len(piece.encode("utf-8")) <= MAX_LINE_OCTETS
+        piece.encode("utf-8").decode("utf-8")
+    assert _unfold(folded) == line
+
+def test_feed_escapes_and_folds_hackathon_text(make_harness, client):
+    harness = make_harness(SMALL_SIZE)
+    hackathon_id = harness.ids["hackathon_id"]
+    with harness.session() as db:
+        hackathon = db.get(Hackathon, hackathon_id)
+        hackathon.name = "Build; Ship, Repeat"
+        hackathon.description = "Line one\nLine two, with a comma; " + "long " * 40
+        db.commit()
+
+    response = client.get(f"/api/calendars/hackathons/{hackathon_id}.ics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/calendar")
+    body = response.content.decode("utf-8")
+    assert body.endswith("\r\n")
+    assert all(len(line.encode("utf-8")) <= MAX_LINE_OCTETS for line in body.split("\r\n"))
+    unfolded = _unfold(body)
+    assert "SUMMARY:Build\\; Ship\\, Repeat\r\n" in unfolded
+    assert "DESCRIPTION:Line one\\nLine two\\, with a comma\\; long " in unfolded
+
+def test_calendar_feed_answers_304_for_its_etag(make_harness, client):
+    harness = make_harness(SMALL_SIZE)
+    url = f"/api/calendars/hackathons/{harness.ids['hackathon_id']}.ics"
+    first = client.get(url)
+    assert first.status_code == 200
+    assert client.get(url, headers={"If-None-Match": first.headers["etag"]}).status_code == 304
@@ -0,0 +1,56 @@
+"""
+``Idempotency-Key`` replays: a retry gets the stored response, a reused key
+with another body gets 422, and keys of different callers never collide.
+"""
+import uuid
+from conftest import SMALL_SIZE
+
+def _registration(name):
+    return {
+        "email": f"{name}@example.com", "username": name, "full_name": name.title(),
+        "password": "password", "role": "organizer"
+    }
+
+def test_retry_replays_the_stored_response(make_harness, client):
+    make_harness(SMALL_SIZE)
+    key = uuid.uuid4().hex
+    body = _registration(f"retry{key[:8]}")
+    first = client.post("/api/auth/register", json=body, headers={"Idempotency-Key": key})
+    assert first.status_code == 200
+    assert "idempotent-replayed" not in first.headers
+
+    retry = client.post("/api/auth/register", json=body, headers={"Idempotency-Key": key})
+    assert retry.status_code == 200
+    assert retry.headers["idempotent-replayed"] == "true"
+    assert retry.json() == first.json()
+
+def test_reused_key_with_another_body_is_422(make_harness, client):
+    make_harness(SMALL_SIZE)
+    key = uuid.uuid4().hex
+    assert client.post(
+        "/api/auth/register", json=_registration(f"first{key[:8]}"), headers={"Idempotency-Key": key}
+    ).status_code == 200
+    reused = client.post(
+        "/api/auth/register", json=_registration(f"second{key[:8]}"), headers={"Idempotency-Key": key}
+    )
+    assert reused.status_code == 422
+    assert "different request" in reused.json()["detail"]
+
+def test_keys_are_scoped_to_the_caller(make_harness, client):
+    make_harness(SMALL_SIZE)
+    key = uuid.uuid4().hex
+    assert client.post(
+        "/api/auth/register", json=_registration(f"alice{key[:8]}"),
+        headers={"Idempotency-Key": key, "Authorization": "Bearer alice"}
+    ).status_code == 200
+    other = client.post(
+        "/api/auth/register", json=_registration(f"bob{key[:8]}"),
+        headers={"Idempotency-Key": key, "Authorization": "Bearer bob"}
+    )
+    assert other.status_code == 200
+    assert "idempotent-replayed" not in other.headers
+
+def test_blank_key_is_rejected(make_harness, client):
+    make_harness(SMALL_SIZE)
+    response = client.post("/api/auth/register", json=_registration("blank"), headers={"Idempotency-Key": " "})
+    assert response.status_code == 400
@@ -0,0 +1,47 @@
+"""
+Review assignment: balanced loads, conflicts of interest and judge capacities.
+"""
+from collections import Counter
+import pytest
+from utils.judge_scheduler import SchedulingError, schedule_reviews
+
+def _loads(assignments):
+    return Counter(judge_id for judge_id, _ in assignments)
+
+def test_every_submission_gets_distinct_judges_and_loads_stay_balanced():
+    assignments = schedule_reviews(range(1, 8), [1, 2, 3, 4], reviews_per_submission=2)
+    assert len(assignments) == 14
+    per_submission = Counter(submission_id for _, submission_id in assignments)
+    assert set(per_submission.values()) == {2}
+    assert len(set(assignments)) == len(assignments)
+    loads = _loads(assignments)
+    assert max(loads.values()) - min(loads.values()) <= 1
+
+def test_existing_load_is_balanced_out():
+    assignments = schedule_reviews(range(1, 5), [1, 2], reviews_per_submission=1, existing_load={1: 4})
+    assert _loads(assignments) == {2: 4}
+
+def test_conflicted_judges_never_review_the_submission():
+    conflicts = {1: {1, 2}, 2: {3}}
+    assignments = schedule_reviews(range(1, 6), [1, 2, 3, 4], reviews_per_submission=2, conflicts=conflicts)
+    for judge_id, submission_id in assignments:
+        assert judge_id not in conflicts.get(submission_id, set())
+    assert sorted(judge_id for judge_id, submission_id in assignments if submission_id == 1) == [3, 4]
+
+def test_capacities_count_existing_load():
+    assignments = schedule_reviews(
+        range(1, 7), [1, 2, 3], reviews_per_submission=1,
+        capacities={1: 2, 2: None}, existing_load={1: 1}
+    )
+    loads = _loads(assignments)
+    assert loads[1] == 1
+    assert sum(loads.values()) == 6
+
+def test_impossible_schedules_are_rejected():
+    with pytest.raises(SchedulingError):
+        schedule_reviews([1], [1], reviews_per_submission=2)
+    with pytest.raises(SchedulingError):
+        schedule_reviews([1], [1, 2], reviews_per_submission=2, conflicts={1: {2}})
+    with pytest.raises(SchedulingError):
+        schedule_reviews(range(1, 4), [1, 2], reviews_per_submission=1, capacities={1: 1, 2: 1})
+    assert schedule_reviews([], [1], reviews_per_submission=1) == []
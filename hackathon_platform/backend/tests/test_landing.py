@@ -0,0 +1,62 @@
+"""
+Landing pages only ever link to http(s) URLs: the API refuses other schemes
+and the renderer drops them from rows stored before that check existed.
+"""
+import pytest
+from models.database import Hackathon
+from models.schemas import is_web_url
+from utils.landing import landing_payload, render_landing_html
+from conftest import SMALL_SIZE
+
+@pytest.mark.parametrize("url", ["https://example.com/logo.png", "http://example.com", "/static/logo.png"])
+def test_web_urls_are_accepted(url):
+    assert is_web_url(url)
+
+@pytest.mark.parametrize("url", [
+    "javascript:alert(1)", "JavaScript:alert(1)", "java\tscript:alert(1)", " javascript:alert(1)",
+    "data:text/html,<script>alert(1)</script>", "vbscript:msgbox", "//evil.example/x", "https:///no-host",
+    "/\\evil.example",
+])
+def test_other_schemes_are_rejected(url):
+    assert not is_web_url(url)
+
+def test_api_refuses_script_links(make_harness, client):
+    harness = make_harness(SMALL_SIZE)
+    url = f"/api/hackathons/{harness.ids['hackathon_id']}"
+    for body in (
+        {"landing_logo_url": "javascript:alert(1)"},
+        {"custom_landing_url": "data:text/html,hi"},
+        {"sponsors_data": [{"name": "Acme", "website": "javascript:alert(1)"}]},
+    ):
+        response = client.put(url, json=body, headers=harness.auth_headers())
+        assert response.status_code == 422, body
+
+    accepted = client.put(url, json={
+        "landing_logo_url": "https://example.com/logo.png",
+        "sponsors_data": [{"name": "Acme", "website": "https://acme.example"}],
+    }, headers=harness.auth_headers())
+    assert accepted.status_code == 200
+
+def test_renderer_drops_legacy_script_links(make_harness):
+    harness = make_harness(SMALL_SIZE)
+    with harness.session() as db:
+        data = landing_payload(db.get(Hackathon, harness.ids["hackathon_id"]))
+    data.update({
+        "name": "<script>alert(1)</script>",
+        "landing_logo_url": "javascript:alert(1)",
+        "has_sponsors": True,
+        "sponsors_data": [{
+            "name": "Acme", "tier": None, "logo_url": "data:image/svg+xml,<svg onload=alert(1)>",
+            "banner_url": None, "website": "javascript:alert(1)", "description": None,
+        }],
+    })
+    page = render_landing_html(data)
+    assert "javascript:" not in page and "data:" not in page
+    assert "<script>alert" not in page and "&lt;script&gt;" in page
+    assert '<li class="sponsor">Acme</li>' in page
+
+    # A custom landing page with a bad target falls back to the template instead of redirecting
+    data.update({"landing_page_type": "custom", "custom_landing_url": "javascript:alert(1)"})
+    assert "http-equiv" not in render_landing_html(data)
+    data["custom_landing_url"] = "https://landing.example"
+    assert 'url=https://landing.example' in render_landing_html(data)
@@ -0,0 +1,34 @@
+"""
+Ranking rules of the in-memory leaderboard: ties share a rank and are never
+split by a top-K cut-off.
+"""
+from utils.leaderboard import Leaderboard
+
+def _board(*scores):
+    board = Leaderboard(hackathon_id=1)
+    board.load([(team_id, f"Team {team_id}", score) for team_id, score in enumerate(scores, start=1)])
+    return board
+
+def test_ties_share_a_competition_rank():
+    board = _board(90, 80, 80, 70)
+    assert [(entry["team_id"], entry["rank"]) for entry in board.top(10)] == [(1, 1), (2, 2), (3, 2), (4, 4)]
+    assert board.rank_of(3)["rank"] == 2
+    assert board.rank_of(4)["rank"] == 4
+
+def test_top_k_includes_every_team_tied_at_the_cut_off():
+    board = _board(90, 80, 80, 80, 70)
+    assert [entry["team_id"] for entry in board.top(2)] == [1, 2, 3, 4]
+    assert [entry["team_id"] for entry in board.top(1)] == [1]
+
+def test_update_into_a_tie_reports_the_shared_rank():
+    board = _board(90, 80, 70)
+    event = board.update(3, 80)
+    assert event["rank"] == 2 and event["previous_rank"] == 3
+    assert board.rank_of(2)["rank"] == 2
+    assert board.update(3, 80) is None
+
+def test_removed_team_frees_its_rank():
+    board = _board(90, 90, 70)
+    board.update(1, None)
+    assert board.rank_of(1) is None
+    assert [(entry["team_id"], entry["rank"]) for entry in board.top(10)] == [(2, 1), (3, 2)]
@@ -0,0 +1,78 @@
+"""
+Data migrations, run against a scratch SQLite file at the revision before them.
+"""
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, text
+from utils.database import BACKEND_DIR, MIGRATIONS_DIR
+
+@pytest.fixture
+def scratch_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'scratch.db'}")
+    yield engine
+    engine.dispose()
+
+def _migrate(engine, revision):
+    config = Config(f"{BACKEND_DIR}/alembic.ini")
+    config.set_main_option("script_location", MIGRATIONS_DIR)
+    config.attributes["configure_logger"] = False
+    with engine.begin() as connection:
+        config.attributes["connection"] = connection
+        command.upgrade(config, revision)
+
+def _current(engine):
+    with engine.connect() as connection:
+        return connection.execute(text("SELECT version_num FROM alembic_version")).scalar()
+
+def _seed_hackathon(connection, **fields):
+    connection.execute(text(
+        "INSERT INTO users (id, email, username, hashed_password, full_name, role) "
+        "VALUES (1, 'owner@example.com', 'owner', 'x', 'Owner', 'organizer')"
+    ))
+    connection.execute(text(
+        "INSERT INTO hackathons (id, name, description, start_date, end_date, application_open, application_close, "
+        "prize_pool, rules, submission_requirements, communication_channels, organizer_id, sponsors_data) "
+        "VALUES (1, 'Main Event', 'd', '2026-01-01', '2026-01-02', '2025-12-01', '2025-12-31', '$1000', 'r', 's', "
+        "'c', 1, :sponsors_data)"
+    ), {"sponsors_data": fields.get("sponsors_data")})
+
+def test_unique_email_index_refuses_existing_duplicates(scratch_engine):
+    _migrate(scratch_engine, "0009")
+    with scratch_engine.begin() as connection:
+        _seed_hackathon(connection)
+        for participant_id, email in ((1, "Ada@example.com"), (2, "bob@example.com"), (3, "ada@EXAMPLE.com")):
+            connection.execute(text(
+                "INSERT INTO participants (id, hackathon_id, name, email, status) VALUES (:id, 1, 'n', :email, 'applied')"
+            ), {"id": participant_id, "email": email})
+
+    with pytest.raises(RuntimeError, match=r"hackathon 1, ada@example.com: participant ids 1, 3"):
+        _migrate(scratch_engine, "0010")
+    # Nothing was deleted; the duplicates are left for a person to resolve
+    assert _current(scratch_engine) == "0009"
+    with scratch_engine.connect() as connection:
+        assert connection.execute(text("SELECT COUNT(*) FROM participants")).scalar() == 3
+
+    with scratch_engine.begin() as connection:
+        connection.execute(text("DELETE FROM participants WHERE id = 3"))
+    _migrate(scratch_engine, "0010")
+    assert _current(scratch_engine) == "0010"
+
+def test_legacy_sponsors_data_is_copied_into_sponsor_rows(scratch_engine):
+    _migrate(scratch_engine, "0010")
+    with scratch_engine.begin() as connection:
+        _seed_hackathon(connection, sponsors_data=(
+            '[{"name": " Acme ", "tier": "gold", "website": "https://acme.example", "logo_url": "javascript:alert(1)"},'
+            ' {"tier": "silver"}, {"name": "Globex"}]'
+        ))
+    _migrate(scratch_engine, "0011")
+
+    with scratch_engine.connect() as connection:
+        rows = connection.execute(text(
+            "SELECT name, name_key, tier, website, logo_url, position FROM sponsors WHERE hackathon_id = 1 ORDER BY position"
+        )).all()
+    # Nameless items are dropped and only http(s) links survive
+    assert [tuple(row) for row in rows] == [
+        ("Acme", "acme", "gold", "https://acme.example", None, 0),
+        ("Globex", "globex", None, None, None, 1),
+    ]
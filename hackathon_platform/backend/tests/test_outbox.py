@@ -0,0 +1,73 @@
+"""
+Outbox retry schedule: exponential backoff, the attempt limit and reclaiming
+expired leases.
+"""
+from datetime import datetime, timedelta
+import pytest
+from models.database import OutboxMessage
+from utils import outbox
+from utils.outbox import (
+    OUTBOX_BACKOFF_SECONDS, OUTBOX_MAX_ATTEMPTS, OUTBOX_MAX_BACKOFF_SECONDS, backoff_delay, claim_batch, record_results
+)
+from conftest import SMALL_SIZE
+
+@pytest.fixture
+def no_jitter(monkeypatch):
+    monkeypatch.setattr(outbox.random, "uniform", lambda low, high: 1.0)
+
+def _queue_message(db, **fields):
+    message = OutboxMessage(kind="test", recipient="p@example.com", subject="Hi", body="Hello", **fields)
+    db.add(message)
+    db.commit()
+    return message.id
+
+def test_backoff_doubles_up_to_the_cap(no_jitter):
+    assert backoff_delay(1) == OUTBOX_BACKOFF_SECONDS
+    assert backoff_delay(2) == OUTBOX_BACKOFF_SECONDS * 2
+    assert backoff_delay(3) == OUTBOX_BACKOFF_SECONDS * 4
+    assert backoff_delay(30) == OUTBOX_MAX_BACKOFF_SECONDS
+
+def test_jitter_stays_within_twenty_percent():
+    for attempts in range(1, 6):
+        base = min(OUTBOX_MAX_BACKOFF_SECONDS, OUTBOX_BACKOFF_SECONDS * 2 ** (attempts - 1))
+        assert base * 0.8 <= backoff_delay(attempts) <= base * 1.2
+
+def test_failed_send_is_rescheduled_after_the_backoff(make_harness, no_jitter):
+    harness = make_harness(SMALL_SIZE)
+    with harness.session() as db:
+        message_id = _queue_message(db)
+        assert [message.id for message in claim_batch(db, "worker-1")] == [message_id]
+        before = datetime.utcnow()
+        record_results(db, "worker-1", [(message_id, "connection refused")])
+
+        message = db.get(OutboxMessage, message_id)
+        assert message.status == "pending"
+        assert message.attempts == 1
+        assert message.last_error == "connection refused"
+        delay = (message.next_attempt_at - before).total_seconds()
+        assert OUTBOX_BACKOFF_SECONDS - 1 <= delay <= OUTBOX_BACKOFF_SECONDS + 1
+        # Not due again until the backoff has passed
+        assert claim_batch(db, "worker-1") == []
+
+def test_message_fails_for_good_after_the_last_attempt(make_harness):
+    harness = make_harness(SMALL_SIZE)
+    with harness.session() as db:
+        message_id = _queue_message(db, attempts=OUTBOX_MAX_ATTEMPTS - 1)
+        claim_batch(db, "worker-1")
+        record_results(db, "worker-1", [(message_id, "mailbox unavailable")])
+        message = db.get(OutboxMessage, message_id)
+        assert message.status == "failed"
+        assert message.attempts == OUTBOX_MAX_ATTEMPTS
+
+def test_expired_lease_is_claimed_again(make_harness):
+    harness = make_harness(SMALL_SIZE)
+    with harness.session() as db:
+        message_id = _queue_message(
+            db, status="sending", claimed_by="dead-worker", claimed_until=datetime.utcnow() - timedelta(seconds=1)
+        )
+        assert [message.id for message in claim_batch(db, "worker-2")] == [message_id]
+        # The dead worker's late result no longer applies
+        record_results(db, "dead-worker", [(message_id, None)])
+        assert db.get(OutboxMessage, message_id).status == "sending"
+        record_results(db, "worker-2", [(message_id, None)])
+        assert db.get(OutboxMessage, message_id).status == "sent"
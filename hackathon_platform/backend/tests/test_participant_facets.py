@@ -0,0 +1,69 @@
+"""
+Participant listing: facet counts follow the filters and skill filters go
+through the inverted index.
+"""
+from collections import Counter
+from models.database import Participant, ParticipantSkill
+from utils.skill_index import normalize_skill, rebuild_skill_index, skill_keys
+from conftest import SMALL_SIZE
+
+def _participants(harness):
+    with harness.session() as db:
+        return db.query(Participant).filter(Participant.hackathon_id == harness.ids["hackathon_id"]).all()
+
+def _facet(response, name):
+    return {facet["value"]: facet["count"] for facet in response.json()["facets"][name]}
+
+def _list(client, harness, **params):
+    return client.get(
+        f"/api/hackathons/{harness.ids['hackathon_id']}/participants", params=params, headers=harness.auth_headers()
+    )
+
+def test_skill_keys_are_normalized_and_distinct():
+    assert normalize_skill("  Machine   Learning ") == "machine learning"
+    assert normalize_skill("") is None and normalize_skill(None) is None
+    assert skill_keys(["Python", "python ", "Go", 3]) == ["python", "go"]
+
+def test_facets_count_every_participant(make_harness, client):
+    harness = make_harness(SMALL_SIZE)
+    participants = _participants(harness)
+    response = _list(client, harness, facet_limit=50)
+    assert response.json()["total"] == len(participants)
+    assert _facet(response, "status") == Counter(participant.status for participant in participants)
+    assert _facet(response, "region") == Counter(participant.region for participant in participants)
+    assert _facet(response, "skills") == Counter(
+        key for participant in participants for key in skill_keys(participant.skills)
+    )
+
+def test_skill_filters_require_every_skill_and_narrow_the_facets(make_harness, client):
+    harness = make_harness(SMALL_SIZE)
+    participants = _participants(harness)
+    wanted = skill_keys(participants[0].skills)
+    matching = [participant for participant in participants if set(wanted) <= set(skill_keys(participant.skills))]
+
+    # Matched like the index stores them: case and spacing do not matter
+    response = _list(client, harness, skill=[wanted[0].upper(), f"  {wanted[1]} "])
+    assert {participant["id"] for participant in response.json()["participants"]} == {
+        participant.id for participant in matching
+    }
+    assert _facet(response, "status") == Counter(participant.status for participant in matching)
+    assert _facet(response, "skills")[wanted[0]] == len(matching)
+
+def test_facet_limit_keeps_the_largest_values(make_harness, client):
+    harness = make_harness(SMALL_SIZE)
+    all_regions = _facet(_list(client, harness), "region")
+    top = _list(client, harness, facet_limit=2).json()["facets"]["region"]
+    assert len(top) == 2
+    assert [facet["count"] for facet in top] == sorted(all_regions.values(), reverse=True)[:2]
+
+def test_rebuild_reproduces_the_index(make_harness):
+    harness = make_harness(SMALL_SIZE)
+    with harness.session() as db:
+        def index_rows():
+            return sorted(db.query(ParticipantSkill.participant_id, ParticipantSkill.skill).filter(
+                ParticipantSkill.hackathon_id == harness.ids["hackathon_id"]
+            ))
+        before = index_rows()
+        assert rebuild_skill_index(db, harness.ids["hackathon_id"], batch_size=3) == len(before)
+        db.commit()
+        assert index_rows() == before
@@ -0,0 +1,53 @@
+"""
+Login throttling (429 with Retry-After) and the client address behind proxies.
+"""
+import pytest
+from starlette.requests import Request
+from utils import rate_limit
+from utils.rate_limit import TokenBucketLimiter
+from conftest import SMALL_SIZE
+
+@pytest.fixture
+def fresh_limiters(monkeypatch):
+    """Small private buckets, so throttling here does not leak into other tests"""
+    monkeypatch.setattr(rate_limit, "login_ip_limiter", TokenBucketLimiter(100, 1))
+    monkeypatch.setattr(rate_limit, "login_account_limiter", TokenBucketLimiter(2, 1 / 60))
+
+def _login(client, password, email="owner@example.com"):
+    return client.post("/api/auth/login", json={"email": email, "password": password})
+
+def test_failed_logins_are_throttled_with_retry_after(make_harness, client, fresh_limiters):
+    make_harness(SMALL_SIZE)
+    assert _login(client, "wrong").status_code == 401
+    assert _login(client, "wrong").status_code == 401
+    throttled = _login(client, "password")
+    assert throttled.status_code == 429
+    assert 1 <= int(throttled.headers["retry-after"]) <= 60
+    # Other accounts behind the same address are not affected
+    assert _login(client, "password", email="admin@example.com").status_code == 200
+
+def test_successful_logins_do_not_use_up_the_account(make_harness, client, fresh_limiters):
+    make_harness(SMALL_SIZE)
+    for _ in range(4):
+        assert _login(client, "password").status_code == 200
+
+def test_ip_bucket_throttles_across_accounts(make_harness, client, monkeypatch):
+    make_harness(SMALL_SIZE)
+    monkeypatch.setattr(rate_limit, "login_ip_limiter", TokenBucketLimiter(1, 1 / 60))
+    monkeypatch.setattr(rate_limit, "login_account_limiter", TokenBucketLimiter(10, 1))
+    assert _login(client, "password").status_code == 200
+    response = _login(client, "password", email="admin@example.com")
+    assert response.status_code == 429
+    assert "retry-after" in response.headers
+
+def _request(peer, forwarded=None):
+    headers = [(b"x-forwarded-for", forwarded.encode())] if forwarded else []
+    return Request({"type": "http", "client": (peer, 1234), "headers": headers})
+
+def test_forwarded_address_is_only_trusted_from_configured_proxies(monkeypatch):
+    monkeypatch.setattr(rate_limit, "TRUSTED_PROXIES", [rate_limit.ipaddress.ip_network("10.0.0.0/8")])
+    assert rate_limit.client_address(_request("203.0.113.9", "198.51.100.1")) == "203.0.113.9"
+    assert rate_limit.client_address(_request("10.0.0.2", "198.51.100.1, 10.0.0.7")) == "198.51.100.1"
+    # A client cannot pick its address by prepending to the header
+    assert rate_limit.client_address(_request("10.0.0.2", "1.2.3.4, 198.51.100.1")) == "198.51.100.1"
+    assert rate_limit.client_address(_request("10.0.0.2")) == "10.0.0.2"
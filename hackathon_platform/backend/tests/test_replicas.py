@@ -0,0 +1,100 @@
+"""
+Read routing: healthy replicas take reads, lagging or unreachable ones are
+skipped, and callers that just wrote stay on the primary.
+"""
+import asyncio
+import itertools
+import time
+from datetime import timedelta
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from starlette.requests import Request
+from models.database import Base, Hackathon
+from utils import replicas
+from utils.cache import cache
+from utils.database import SessionLocal
+from conftest import SMALL_SIZE, hackathon_row
+
+REPLICA_A, REPLICA_B = sessionmaker(), sessionmaker()
+
+@pytest.fixture
+def two_replicas(monkeypatch):
+    """Two fake replicas whose lag each test sets in the returned dict"""
+    lags = {0: 0.0, 1: 0.0}
+    monkeypatch.setattr(replicas, "ReplicaSessionLocals", [REPLICA_A, REPLICA_B])
+    monkeypatch.setattr(replicas, "_replica_health", [replicas.ReplicaHealth(0), replicas.ReplicaHealth(1)])
+    monkeypatch.setattr(replicas, "_round_robin", itertools.cycle(range(2)))
+    monkeypatch.setattr(replicas, "measure_replica_lag", lambda index: lags[index])
+    return lags
+
+def _request(headers=None, cookies=None):
+    raw = [(name.lower().encode(), value.encode()) for name, value in (headers or {}).items()]
+    if cookies:
+        raw.append((b"cookie", "; ".join(f"{name}={value}" for name, value in cookies.items()).encode()))
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": raw})
+
+def test_reads_rotate_over_healthy_replicas(two_replicas):
+    assert {replicas.choose_session_factory() for _ in range(4)} == {REPLICA_A, REPLICA_B}
+
+def test_lagging_and_unreachable_replicas_are_skipped(two_replicas):
+    two_replicas[0] = replicas.REPLICA_MAX_LAG_SECONDS + 1
+    assert {replicas.choose_session_factory() for _ in range(4)} == {REPLICA_B}
+    for health in replicas._replica_health:
+        health.checked_at = 0.0
+    two_replicas[1] = None
+    assert replicas.choose_session_factory() is SessionLocal
+
+def test_sticky_reads_go_to_the_primary(two_replicas):
+    assert replicas.choose_session_factory(sticky=True) is SessionLocal
+
+def test_cookie_pins_until_it_expires():
+    assert replicas.is_sticky(_request(cookies={"primary_until": str(time.time() + 5)}))
+    assert not replicas.is_sticky(_request(cookies={"primary_until": str(time.time() - 1)}))
+    assert not replicas.is_sticky(_request(cookies={"primary_until": "junk"}))
+
+def test_writes_pin_bearer_clients_without_cookies(make_harness, two_replicas):
+    harness = make_harness(SMALL_SIZE)
+
+    async def downstream(scope, receive, send):
+        await send({"type": "http.response.start", "status": 201, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    authorization = harness.auth_headers()["Authorization"]
+    assert not replicas.is_sticky(_request(headers={"Authorization": authorization}))
+    scope = {"type": "http", "method": "POST", "path": "/api/hackathons/", "headers": [
+        (b"authorization", authorization.encode())
+    ]}
+    asyncio.run(replicas.ReadYourWritesMiddleware(downstream)(scope, receive, send))
+    try:
+        assert any(name == b"set-cookie" and value.startswith(b"primary_until=") for name, value in sent[0]["headers"])
+        # Same user, new request, no cookie: still pinned by the token subject
+        assert replicas.is_sticky(_request(headers={"Authorization": authorization}))
+        assert not replicas.is_sticky(_request(headers={"Authorization": harness.auth_headers("admin")["Authorization"]}))
+    finally:
+        cache.invalidate("primary_until:*")
+
+def test_generic_lag_probe_compares_newest_hackathon_change(make_harness, monkeypatch):
+    harness = make_harness(SMALL_SIZE)
+    with harness.session() as db:
+        primary_latest = max(updated_at for updated_at, in db.query(Hackathon.updated_at))
+    replica_engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(replica_engine)
+    monkeypatch.setattr(replicas, "replica_engines", [replica_engine])
+    monkeypatch.setattr(replicas, "ReplicaSessionLocals", [sessionmaker(bind=replica_engine)])
+
+    assert replicas.measure_replica_lag(0) == float("inf")
+    with replicas.ReplicaSessionLocals[0]() as replica:
+        row = hackathon_row("Copied", "upcoming", harness.ids["owner_id"], primary_latest)
+        replica.execute(Hackathon.__table__.insert(), [{**row, "updated_at": primary_latest - timedelta(seconds=30)}])
+        replica.commit()
+    assert replicas.measure_replica_lag(0) == 30.0
@@ -0,0 +1,97 @@
+"""
+Dashboard rollups: bucket arithmetic, series read back from the buckets and
+the backfill of days recorded before rollups existed.
+"""
+from datetime import datetime, timedelta
+import backfill_rollups
+from models.database import Hackathon, MetricRollup, Participant
+from utils.rollups import bucket_range, bucket_start, load_series, record_events
+from conftest import SMALL_SIZE
+
+def test_bucket_starts():
+    moment = datetime(2026, 3, 12, 14, 35, 20)  # A Thursday
+    assert bucket_start(moment, "minute") == datetime(2026, 3, 12, 14, 35)
+    assert bucket_start(moment, "hour") == datetime(2026, 3, 12, 14)
+    assert bucket_start(moment, "week") == datetime(2026, 3, 9)
+    assert bucket_start(moment, "month") == datetime(2026, 3, 1)
+    assert bucket_range(datetime(2026, 11, 20), datetime(2027, 2, 1), "month") == [
+        datetime(2026, 11, 1), datetime(2026, 12, 1), datetime(2027, 1, 1), datetime(2027, 2, 1)
+    ]
+
+def test_series_are_summed_from_stored_buckets(make_harness):
+    harness = make_harness(SMALL_SIZE)
+    monday = datetime(2025, 6, 2, 9, 30)
+    with harness.session() as db:
+        record_events(db, "submissions", [
+            (monday, 1, 1, ""), (monday + timedelta(minutes=10), 1, 1, ""),
+            (monday + timedelta(days=2), 1, 1, ""), (monday + timedelta(days=7), 2, 1, ""),
+            (monday, 3, 99, ""),
+        ])
+        db.commit()
+        end = monday + timedelta(days=13)
+
+        hours = load_series(db, "submissions", "hour", monday, end, organizer_id=1)[""]
+        assert hours[datetime(2025, 6, 2, 9)] == 2
+        # Week buckets are derived from the day rows
+        weeks = load_series(db, "submissions", "week", monday, end, organizer_id=1)[""]
+        assert weeks == {datetime(2025, 6, 2): 3, datetime(2025, 6, 9): 1}
+        assert load_series(db, "submissions", "week", monday, end, hackathon_id=2)[""] == {datetime(2025, 6, 9): 1}
+        assert sum(load_series(db, "submissions", "day", monday, end)[""].values()) == 5
+
+def test_timeseries_endpoint_breaks_down_by_dimension(make_harness, client):
+    harness = make_harness(SMALL_SIZE)
+    day = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=3)
+    with harness.session() as db:
+        record_events(db, "status_changes", [
+            (day, 1, harness.ids["owner_id"], "ongoing"), (day, 2, harness.ids["owner_id"], "ongoing"),
+            (day, 3, harness.ids["owner_id"], "past"),
+        ])
+        db.commit()
+    params = {"metric": "status_changes", "granularity": "day", "start_date": day.isoformat()}
+
+    total = client.get("/api/dashboard/timeseries", params=params, headers=harness.auth_headers()).json()
+    assert total["labels"][0] == day.isoformat()
+    assert total["datasets"] == [{"label": "status_changes", "data": [3, 0, 0, 0]}]
+
+    split = client.get(
+        "/api/dashboard/timeseries", params={**params, "breakdown": True}, headers=harness.auth_headers()
+    ).json()
+    assert {dataset["label"]: dataset["data"][0] for dataset in split["datasets"]} == {"ongoing": 2, "past": 1}
+
+def test_backfill_counts_uncovered_days_once(make_harness):
+    harness = make_harness(SMALL_SIZE)
+    hackathon_id = harness.ids["hackathon_id"]
+    old_day = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=40)
+    with harness.session() as db:
+        db.add(Participant(
+            hackathon_id=hackathon_id, name="Early Bird", email="early@example.com",
+            registration_date=old_day + timedelta(hours=9)
+        ))
+        db.commit()
+        # The seeded days already have live registration rollups
+        live_total = sum(
+            value for value, in db.query(MetricRollup.value).filter(
+                MetricRollup.metric == "registrations", MetricRollup.granularity == "day"
+            )
+        )
+        statuses = [status for status, in db.query(Hackathon.status)]
+
+    backfill_rollups.backfill_rollups()
+    backfill_rollups.backfill_rollups()
+
+    with harness.session() as db:
+        def day_values(metric):
+            rows = db.query(MetricRollup.bucket_start, MetricRollup.dimension, MetricRollup.value).filter(
+                MetricRollup.metric == metric, MetricRollup.granularity == "day"
+            )
+            return [(start, dimension, value) for start, dimension, value in rows]
+
+        registrations = day_values("registrations")
+        assert (old_day, "", 1) in registrations
+        assert sum(value for _, _, value in registrations) == live_total + 1
+        # Creations come from Hackathon.created_at, broken down by the current status
+        by_status = {}
+        for _, dimension, value in day_values("hackathons"):
+            by_status[dimension] = by_status.get(dimension, 0) + value
+        assert by_status == {status: statuses.count(status) for status in set(statuses)}
+        assert day_values("status_changes") == []
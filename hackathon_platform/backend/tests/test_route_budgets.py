@@ -0,0 +1,417 @@
+"""
+Performance contracts for every API route.
+
+Each route is called once against a database seeded with SMALL_SIZE and once
+with LARGE_SIZE children per hackathon (see conftest.py). Both calls must stay
+within the route's budget of SQL statements, rows fetched and peak Python
+allocations, and the statement count must be the same at both sizes, so an
+N+1 query or a per-row delete fails here instead of under load.
+
+Caches are cleared before every call, so budgets cover the cold path. Routes
+that by design read every child (cold leaderboard build, judge scheduling)
+declare a per-child allowance for rows and allocations; their statement count
+is still fixed.
+"""
+import time
+import tracemalloc
+import pytest
+from main import app
+from utils.auth import create_refresh_token
+from utils.cache import cache
+from utils.leaderboard import discard_leaderboard
+from utils.revocation import revocation_list
+from conftest import SMALL_SIZE, LARGE_SIZE
+
+class Budget:
+    """Upper bounds for one request; ``*_per_child`` scale with the seeded size"""
+    __slots__ = ("statements", "rows", "kib", "rows_per_child", "kib_per_child")
+
+    def __init__(self, statements: int, rows: int, kib: int, rows_per_child: float = 0, kib_per_child: float = 0):
+        self.statements = statements
+        self.rows = rows
+        self.kib = kib
+        self.rows_per_child = rows_per_child
+        self.kib_per_child = kib_per_child
+
+class Measurement:
+    __slots__ = ("status_code", "statements", "rows", "kib")
+
+    def __init__(self, status_code: int, statements: int, rows: int, kib: float):
+        self.status_code = status_code
+        self.statements = statements
+        self.rows = rows
+        self.kib = kib
+
+    def __repr__(self):
+        return f"<{self.status_code}: {self.statements} statements, {self.rows} rows, {self.kib:.0f} KiB>"
+
+class RouteCase:
+    """How to call a route and what it may cost.
+
+    ``request(harness, client, context)`` returns keyword arguments for
+    ``client.request``; ``setup`` runs unmeasured before it and may add to
+    the context, ``teardown`` runs unmeasured after it.
+    """
+    __slots__ = ("method", "path", "request", "budget", "status_code", "setup", "teardown")
+
+    def __init__(self, method, path, request, budget, status_code=200, setup=None, teardown=None):
+        self.method = method
+        self.path = path
+        self.request = request
+        self.budget = budget
+        self.status_code = status_code
+        self.setup = setup
+        self.teardown = teardown
+
+    @property
+    def id(self) -> str:
+        return f"{self.method} {self.path}"
+
+# Routes that never finish (Server-Sent Events streams)
+UNBOUNDED_ROUTES = {
+    ("GET", "/api/events/stream"),
+    ("GET", "/api/hackathons/{hackathon_id}/leaderboard/stream"),
+}
+
+HACKATHON_BODY = {
+    "name": "New Event",
+    "description": "Description",
+    "start_date": "2030-01-01T00:00:00",
+    "end_date": "2030-01-02T00:00:00",
+    "prize_pool_details": "$500",
+    "rules": "Rules",
+    "has_sponsors": True,
+    "sponsors_data": [{"name": "Acme"}, {"name": "Globex"}],
+}
+
+def _authed(harness, **kwargs):
+    kwargs.setdefault("headers", {}).update(harness.auth_headers())
+    return kwargs
+
+def _hackathon_url(harness, suffix=""):
+    return f"/api/hackathons/{harness.ids['hackathon_id']}{suffix}"
+
+def _submission_url(harness, suffix=""):
+    return _hackathon_url(harness, f"/submissions/{harness.ids['submission_id']}{suffix}")
+
+def _start_upload(harness, client, context):
+    response = client.post("/api/uploads", headers=harness.auth_headers(), json={"filename": "demo.mp4", "total_size": 3})
+    context["upload_id"] = response.json()["upload_id"]
+
+def _start_and_fill_upload(harness, client, context):
+    _start_upload(harness, client, context)
+    client.patch(
+        f"/api/uploads/{context['upload_id']}",
+        headers={**harness.auth_headers(), "Upload-Offset": "0"},
+        content=b"xyz"
+    )
+
+def _wait_for_ticket(client, hackathon_id, ticket_id):
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        ticket = client.get(f"/api/hackathons/{hackathon_id}/applications/{ticket_id}").json()
+        if ticket["status"] != "queued":
+            return ticket
+        time.sleep(0.01)
+    raise AssertionError("Application was not written")
+
+def _apply(harness, client, context):
+    response = client.post(_hackathon_url(harness, "/apply"), json={"name": "Ada", "email": "ada@example.com"})
+    context["ticket_id"] = response.json()["ticket_id"]
+    _wait_for_ticket(client, harness.ids["hackathon_id"], context["ticket_id"])
+
+def _drain_application(harness, client, context, response):
+    _wait_for_ticket(client, harness.ids["hackathon_id"], response.json()["ticket_id"])
+
+ROUTE_CASES = [
+    # auth
+    RouteCase(
+        "POST", "/api/auth/login",
+        lambda h, c, ctx: {"json": {"email": "owner@example.com", "password": "password"}},
+        Budget(statements=3, rows=5, kib=576)
+    ),
+    RouteCase(
+        "POST", "/api/auth/refresh",
+        lambda h, c, ctx: {"json": {"refresh_token": create_refresh_token(data={"sub": "owner"})}},
+        Budget(statements=3, rows=5, kib=704)
+    ),
+    RouteCase(
+        "POST", "/api/auth/logout",
+        lambda h, c, ctx: _authed(h, json={"refresh_token": create_refresh_token(data={"sub": "owner"})}),
+        Budget(statements=3, rows=6, kib=576),
+        status_code=204
+    ),
+    RouteCase(
+        "POST", "/api/auth/register",
+        lambda h, c, ctx: {"json": {
+            "email": "new@example.com", "username": "new", "password": "password",
+            "full_name": "New User", "role": "organizer"
+        }},
+        Budget(statements=3, rows=4, kib=640)
+    ),
+    RouteCase(
+        "GET", "/api/auth/login/metrics",
+        lambda h, c, ctx: {"headers": h.auth_headers("admin")},
+        Budget(statements=1, rows=4, kib=576)
+    ),
+    # hackathons
+    RouteCase(
+        "GET", "/api/hackathons/",
+        lambda h, c, ctx: _authed(h, params={"size": 20}),
+        Budget(statements=7, rows=37, kib=1344)
+    ),
+    RouteCase(
+        "GET", "/api/hackathons/batch",
+        lambda h, c, ctx: _authed(h, params={"ids": ",".join(str(index) for index in range(1, 11))}),
+        Budget(statements=6, rows=23, kib=1152)
+    ),
+    RouteCase(
+        "POST", "/api/hackathons/batch",
+        lambda h, c, ctx: _authed(h, json={"ids": list(range(1, 12))}),
+        Budget(statements=6, rows=24, kib=1088)
+    ),
+    RouteCase(
+        "GET", "/api/hackathons/autocomplete",
+        lambda h, c, ctx: _authed(h, params={"q": "eve", "limit": 8}),
+        Budget(statements=2, rows=16, kib=640, rows_per_child=1, kib_per_child=1.6)
+    ),
+    RouteCase(
+        "GET", "/api/hackathons/{hackathon_id}",
+        lambda h, c, ctx: _authed(h, url=_hackathon_url(h)),
+        Budget(statements=7, rows=13, kib=896)
+    ),
+    RouteCase(
+        "POST", "/api/hackathons/",
+        lambda h, c, ctx: _authed(h, json=HACKATHON_BODY),
+        Budget(statements=10, rows=10, kib=960)
+    ),
+    RouteCase(
+        "PUT", "/api/hackathons/{hackathon_id}",
+        lambda h, c, ctx: _authed(h, url=_hackathon_url(h), json={"description": "Updated", "status": "ongoing"}),
+        Budget(statements=11, rows=14, kib=1024)
+    ),
+    RouteCase(
+        "PUT", "/api/hackathons/{hackathon_id}/logo",
+        lambda h, c, ctx: _authed(h, url=_hackathon_url(h, "/logo"), json={"file_sha256": h.ids["image_sha256"]}),
+        Budget(statements=10, rows=15, kib=1024)
+    ),
+    RouteCase(
+        "DELETE", "/api/hackathons/{hackathon_id}",
+        lambda h, c, ctx: _authed(h, url=_hackathon_url(h)),
+        Budget(statements=12, rows=5, kib=832)
+    ),
+    RouteCase(
+        "GET", "/api/hackathons/{hackathon_id}/landing",
+        lambda h, c, ctx: {"url": _hackathon_url(h, "/landing")},
+        Budget(statements=2, rows=7, kib=640)
+    ),
+    # submissions
+    RouteCase(
+        "PUT", "/api/hackathons/{hackathon_id}/submissions/{submission_id}/score",
+        lambda h, c, ctx: _authed(h, url=_submission_url(h, "/score"), json={"score": 90}),
+        Budget(statements=5, rows=7, kib=832)
+    ),
+    RouteCase(
+        "POST", "/api/hackathons/{hackathon_id}/submissions/{submission_id}/artifacts",
+        lambda h, c, ctx: _authed(h, url=_submission_url(h, "/artifacts"), json={
+            "file_sha256": h.ids["video_sha256"], "filename": "final.mp4", "kind": "video"
+        }),
+        Budget(statements=7, rows=9, kib=896)
+    ),
+    RouteCase(
+        "GET", "/api/hackathons/{hackathon_id}/submissions/{submission_id}/artifacts",
+        lambda h, c, ctx: _authed(h, url=_submission_url(h, "/artifacts")),
+        Budget(statements=3, rows=8, kib=832)
+    ),
+    RouteCase(
+        "DELETE", "/api/hackathons/{hackathon_id}/submissions/{submission_id}/artifacts/{artifact_id}",
+        lambda h, c, ctx: _authed(h, url=_submission_url(h, f"/artifacts/{h.ids['artifact_id']}")),
+        Budget(statements=3, rows=5, kib=704)
+    ),
+    RouteCase(
+        "GET", "/api/hackathons/{hackathon_id}/leaderboard",
+        lambda h, c, ctx: _authed(h, url=_hackathon_url(h, "/leaderboard")),
+        Budget(statements=3, rows=13, kib=704, rows_per_child=0.5, kib_per_child=0.5)
+    ),
+    RouteCase(
+        "GET", "/api/hackathons/{hackathon_id}/leaderboard/teams/{team_id}",
+        lambda h, c, ctx: _authed(h, url=_hackathon_url(h, f"/leaderboard/teams/{h.ids['team_id'] + 1}")),
+        Budget(statements=3, rows=13, kib=704, rows_per_child=0.5, kib_per_child=0.5)
+    ),
+    # judging
+    RouteCase(
+        "POST", "/api/hackathons/{hackathon_id}/judges",
+        lambda h, c, ctx: _authed(h, url=_hackathon_url(h, "/judges"), json={"name": "Grace", "email": "grace@example.com"}),
+        Budget(statements=4, rows=6, kib=768)
+    ),
+    RouteCase(
+        "GET", "/api/hackathons/{hackathon_id}/judges",
+        lambda h, c, ctx: _authed(h, url=_hackathon_url(h, "/judges")),
+        Budget(statements=3, rows=10, kib=704)
+    ),
+    RouteCase(
+        "POST", "/api/hackathons/{hackathon_id}/judging/assignments",
+        lambda h, c, ctx: _authed(h, url=_hackathon_url(h, "/judging/assignments"), json={"reviews_per_submission": 2}),
+        Budget(statements=13, rows=34, kib=960, rows_per_child=1.5, kib_per_child=2.6)
+    ),
+    RouteCase(
+        "GET", "/api/hackathons/{hackathon_id}/judges/{judge_id}/assignments",
+        lambda h, c, ctx: _authed(h, url=_hackathon_url(h, f"/judges/{h.ids['judge_id']}/assignments")),
+        Budget(statements=3, rows=17, kib=704)
+    ),
+    # participants
+    RouteCase(
+        "GET", "/api/hackathons/{hackathon_id}/participants",
+        lambda h, c, ctx: _authed(h, url=_hackathon_url(h, "/participants"), params={"size": 20, "skill": "python"}),
+        Budget(statements=5, rows=48, kib=960)
+    ),
+    RouteCase(
+        "PATCH", "/api/hackathons/{hackathon_id}/participants/{participant_id}",
+        lambda h, c, ctx: _authed(h, url=_hackathon_url(h, f"/participants/{h.ids['participant_id']}"), json={"status": "approved"}),
+        Budget(statements=6, rows=7, kib=832)
+    ),
+    # dashboard
+    RouteCase(
+        "GET", "/api/dashboard/timeseries",
+        lambda h, c, ctx: _authed(h, params={"metric": "registrations", "granularity": "day"}),
+        Budget(statements=2, rows=13, kib=640)
+    ),
+    # archive
+    RouteCase(
+        "GET", "/api/archive/hackathons",
+        lambda h, c, ctx: _authed(h, params={"size": 20}),
+        Budget(statements=3, rows=29, kib=832)
+    ),
+    RouteCase(
+        "GET", "/api/archive/hackathons/{hackathon_id}",
+        lambda h, c, ctx: _authed(h, url=f"/api/archive/hackathons/{h.ids['archived_hackathon_id']}"),
+        Budget(statements=2, rows=5, kib=640)
+    ),
+    RouteCase(
+        "GET", "/api/archive/activity-logs",
+        lambda h, c, ctx: _authed(h, params={"size": 20}),
+        Budget(statements=3, rows=29, kib=768)
+    ),
+    # applications
+    RouteCase(
+        "POST", "/api/hackathons/{hackathon_id}/apply",
+        lambda h, c, ctx: {"url": _hackathon_url(h, "/apply"), "json": {"name": "Lin", "email": "lin@example.com"}},
+        Budget(statements=1, rows=4, kib=576),
+        status_code=202,
+        teardown=_drain_application
+    ),
+    RouteCase(
+        "GET", "/api/hackathons/{hackathon_id}/applications/{ticket_id}",
+        lambda h, c, ctx: {"url": _hackathon_url(h, f"/applications/{ctx['ticket_id']}")},
+        Budget(statements=0, rows=2, kib=512),
+        setup=_apply
+    ),
+    # uploads
+    RouteCase(
+        "POST", "/api/files",
+        lambda h, c, ctx: _authed(h, headers={"Content-Type": "text/plain"}, content=b"hello world" * 1000),
+        Budget(statements=4, rows=5, kib=640),
+        status_code=201
+    ),
+    RouteCase(
+        "GET", "/api/files/{sha256}",
+        lambda h, c, ctx: {"url": f"/api/files/{h.ids['video_sha256']}", "headers": {"Range": "bytes=0-1"}},
+        Budget(statements=1, rows=4, kib=128),
+        status_code=206
+    ),
+    RouteCase(
+        "POST", "/api/uploads",
+        lambda h, c, ctx: _authed(h, json={"filename": "demo.mp4", "total_size": 3}),
+        Budget(statements=3, rows=5, kib=704),
+        status_code=201
+    ),
+    RouteCase(
+        "GET", "/api/uploads/{upload_id}",
+        lambda h, c, ctx: _authed(h, url=f"/api/uploads/{ctx['upload_id']}"),
+        Budget(statements=2, rows=4, kib=576),
+        setup=_start_upload
+    ),
+    RouteCase(
+        "PATCH", "/api/uploads/{upload_id}",
+        lambda h, c, ctx: _authed(h, url=f"/api/uploads/{ctx['upload_id']}", headers={"Upload-Offset": "0"}, content=b"xyz"),
+        Budget(statements=7, rows=6, kib=576),
+        setup=_start_upload
+    ),
+    RouteCase(
+        "POST", "/api/uploads/{upload_id}/complete",
+        lambda h, c, ctx: _authed(h, url=f"/api/uploads/{ctx['upload_id']}/complete"),
+        Budget(statements=11, rows=8, kib=640),
+        setup=_start_and_fill_upload
+    ),
+    # calendars
+    RouteCase(
+        "GET", "/api/calendars/hackathons/{hackathon_id}.ics",
+        lambda h, c, ctx: {"url": f"/api/calendars/hackathons/{h.ids['hackathon_id']}.ics"},
+        Budget(statements=3, rows=16, kib=768, rows_per_child=1, kib_per_child=2.4)
+    ),
+    RouteCase(
+        "GET", "/api/calendars/organizers/{organizer_id}.ics",
+        lambda h, c, ctx: {"url": c.get("/api/calendars/subscription", headers=h.auth_headers()).json()["organizer_feed_url"]},
+        Budget(statements=3, rows=28, kib=704, rows_per_child=2, kib_per_child=7.2)
+    ),
+    RouteCase(
+        "GET", "/api/calendars/subscription",
+        lambda h, c, ctx: _authed(h),
+        Budget(statements=1, rows=4, kib=576)
+    ),
+]
+
+def measure(harness, client, case: RouteCase, context: dict) -> Measurement:
+    """Run one request cold and record what it cost"""
+    request = {"method": case.method, "url": case.path}
+    request.update(case.request(harness, client, context))
+
+    cache.local.clear()
+    discard_leaderboard(harness.ids["hackathon_id"])
+    with harness.session() as db:
+        # Loads the revocation list if this process has not yet
+        revocation_list.is_revoked(db, "warm-up")
+
+    harness.stats.reset()
+    tracemalloc.start()
+    try:
+        response = client.request(**request)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    statements, rows = harness.stats.statements, harness.stats.rows
+
+    assert response.status_code == case.status_code, response.text
+    if case.teardown is not None:
+        case.teardown(harness, client, context, response)
+    return Measurement(response.status_code, statements, rows, peak / 1024)
+
+def test_every_route_has_a_budget():
+    routes = {
+        (method, route.path)
+        for route in app.routes
+        if route.path.startswith("/api/")
+        for method in getattr(route, "methods", ()) if method != "HEAD"
+    }
+    covered = {(case.method, case.path) for case in ROUTE_CASES} | UNBOUNDED_ROUTES
+    assert routes - covered == set(), "Add a RouteCase (and budget) for new routes"
+    assert covered - routes == set(), "Budgets for routes that no longer exist"
+
+@pytest.mark.parametrize("case", ROUTE_CASES, ids=lambda case: case.id)
+def test_route_stays_within_budget(client, make_harness, case):
+    measurements = {}
+    for size in (SMALL_SIZE, LARGE_SIZE):
+        harness = make_harness(size)
+        context = {}
+        if case.setup is not None:
+            case.setup(harness, client, context)
+        measured = measure(harness, client, case, context)
+        measurements[size] = measured
+
+        budget = case.budget
+        assert measured.statements <= budget.statements, f"{size} children: {measured!r}"
+        assert measured.rows <= budget.rows + budget.rows_per_child * size, f"{size} children: {measured!r}"
+        assert measured.kib <= budget.kib + budget.kib_per_child * size, f"{size} children: {measured!r}"
+
+    small, large = measurements[SMALL_SIZE], measurements[LARGE_SIZE]
+    assert large.statements == small.statements, f"Statement count depends on data size: {small!r} vs {large!r}"
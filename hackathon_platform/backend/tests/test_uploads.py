@@ -0,0 +1,122 @@
+"""
+Stored files and resumable uploads: conditional and ranged downloads, safe
+content dispositions, upload claims and pruning of abandoned sessions.
+"""
+import hashlib
+import os
+from datetime import datetime, timedelta
+from models.database import UploadSession
+from utils import storage
+from utils.storage import partial_path, prune_stale_uploads
+from conftest import SMALL_SIZE
+
+def test_stored_file_answers_304_for_its_hash(make_harness, client):
+    harness = make_harness(SMALL_SIZE)
+    sha256 = harness.ids["image_sha256"]
+    response = client.get(f"/api/files/{sha256}", headers={"If-None-Match": f'"{sha256}"'})
+    assert response.status_code == 304
+    assert response.headers["x-content-type-options"] == "nosniff"
+
+def test_byte_range_is_served_with_206(make_harness, client):
+    harness = make_harness(SMALL_SIZE)
+    url = f"/api/files/{harness.ids['video_sha256']}"
+    response = client.get(url, headers={"Range": "bytes=1-"})
+    assert response.status_code == 206
+    assert response.content == b"bc"
+    assert response.headers["content-range"] == "bytes 1-2/3"
+    assert response.headers["content-length"] == "2"
+
+    suffix = client.get(url, headers={"Range": "bytes=-1"})
+    assert suffix.status_code == 206 and suffix.content == b"c"
+
+def test_unsatisfiable_range_is_416(make_harness, client):
+    harness = make_harness(SMALL_SIZE)
+    response = client.get(f"/api/files/{harness.ids['video_sha256']}", headers={"Range": "bytes=5-9"})
+    assert response.status_code == 416
+    assert response.headers["content-range"] == "bytes */3"
+
+def test_stale_if_range_gets_the_whole_file(make_harness, client):
+    harness = make_harness(SMALL_SIZE)
+    response = client.get(
+        f"/api/files/{harness.ids['video_sha256']}", headers={"Range": "bytes=1-", "If-Range": '"stale"'}
+    )
+    assert response.status_code == 200
+    assert response.content == b"abc"
+
+def test_only_images_and_pdfs_are_shown_inline(make_harness, client):
+    harness = make_harness(SMALL_SIZE)
+    video = client.get(f"/api/files/{harness.ids['video_sha256']}")
+    assert video.headers["content-disposition"] == "attachment"
+    assert video.headers["content-security-policy"] == "sandbox"
+    image = client.get(f"/api/files/{harness.ids['image_sha256']}?filename=logo.png")
+    assert image.headers["content-disposition"].startswith("inline")
+
+def _start_upload(client, harness, **fields):
+    response = client.post("/api/uploads", json=fields, headers=harness.auth_headers())
+    assert response.status_code == 201
+    return response.json()["upload_id"]
+
+def _append(client, harness, upload_id, offset, body):
+    return client.patch(
+        f"/api/uploads/{upload_id}", content=body, headers={**harness.auth_headers(), "Upload-Offset": str(offset)}
+    )
+
+def test_resumable_upload_round_trip(make_harness, client):
+    harness = make_harness(SMALL_SIZE)
+    content = b"hello resumable world"
+    upload_id = _start_upload(
+        client, harness, filename="notes.txt", content_type="text/plain",
+        total_size=len(content), sha256=hashlib.sha256(content).hexdigest()
+    )
+    assert _append(client, harness, upload_id, 0, content[:6]).json()["received_size"] == 6
+    # A retried chunk at a stale offset is refused instead of being written twice
+    assert _append(client, harness, upload_id, 0, content[:6]).status_code == 409
+    assert _append(client, harness, upload_id, 6, content[6:]).status_code == 200
+
+    completed = client.post(f"/api/uploads/{upload_id}/complete", headers=harness.auth_headers()).json()
+    assert completed["status"] == "completed"
+    assert completed["file"]["sha256"] == hashlib.sha256(content).hexdigest()
+    assert client.get(completed["file"]["url"]).content == content
+
+def test_claimed_upload_refuses_other_writers_until_the_lease_expires(make_harness, client):
+    harness = make_harness(SMALL_SIZE)
+    upload_id = _start_upload(client, harness)
+    with harness.session() as db:
+        db.query(UploadSession).filter(UploadSession.id == upload_id).update({"status": "appending"})
+        db.commit()
+    assert _append(client, harness, upload_id, 0, b"abc").status_code == 409
+
+    # The claiming worker died; its lease runs out
+    with harness.session() as db:
+        db.query(UploadSession).filter(UploadSession.id == upload_id).update({
+            "updated_at": datetime.utcnow() - timedelta(seconds=storage.UPLOAD_CLAIM_LEASE_SECONDS + 1)
+        })
+        db.commit()
+    assert _append(client, harness, upload_id, 0, b"abc").json()["status"] == "open"
+
+def test_prune_removes_only_abandoned_unfinished_sessions(make_harness):
+    harness = make_harness(SMALL_SIZE)
+    abandoned = datetime.utcnow() - timedelta(hours=storage.UPLOAD_SESSION_TTL_HOURS + 1)
+    sessions = {
+        "stale-open": ("open", abandoned),
+        "stale-claim": ("completing", abandoned),
+        "stale-completed": ("completed", abandoned),
+        "fresh-open": ("open", datetime.utcnow()),
+    }
+    os.makedirs(storage.PARTIAL_DIR, exist_ok=True)
+    with harness.session() as db:
+        for upload_id, (upload_status, updated_at) in sessions.items():
+            db.add(UploadSession(
+                id=upload_id, status=upload_status, updated_at=updated_at, owner_id=harness.ids["owner_id"]
+            ))
+            with open(partial_path(upload_id), "wb") as partial:
+                partial.write(b"x")
+        db.commit()
+
+        assert prune_stale_uploads(db) == 2
+        assert sorted(upload_id for upload_id, in db.query(UploadSession.id).filter(
+            UploadSession.id.in_(sessions)
+        )) == ["fresh-open", "stale-completed"]
+    assert not os.path.exists(partial_path("stale-open"))
+    assert not os.path.exists(partial_path("stale-claim"))
+    assert os.path.exists(partial_path("fresh-open"))
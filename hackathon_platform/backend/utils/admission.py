@@ -0,0 +1,321 @@
+"""
+Admission queue for public hackathon applications.
+
+The apply endpoint only validates and enqueues, answering 202 with a ticket.
+One writer coroutine per worker drains the queue and inserts applications in
+batches (one transaction per batch instead of one per applicant), dropping
+duplicates of an email within the batch and against existing participants.
+Applicants poll their ticket for the outcome. Tickets live in the shared
+cache tier, so any worker can answer a poll; without one they are kept in a
+bounded map of this process. A unique index on ``(hackathon_id, lower(email))``
+settles applications for the same email written by different workers.
+"""
+import asyncio
+import json
+import os
+import time
+import uuid
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import func, insert
+from sqlalchemy.exc import IntegrityError
+from utils.cache import LRUCache, SharedStore, cache
+from utils.database import SessionLocal
+from utils.events import hub, counts_event
+from utils.rollups import record_events
+from utils.skill_index import index_participants
+from models.database import Participant
+
+ADMISSION_QUEUE_SIZE = int(os.getenv("ADMISSION_QUEUE_SIZE", "50000"))
+ADMISSION_BATCH_SIZE = int(os.getenv("ADMISSION_BATCH_SIZE", "500"))
+# How long the writer waits for a batch to fill once the first application arrived
+ADMISSION_BATCH_WAIT_SECONDS = float(os.getenv("ADMISSION_BATCH_WAIT_SECONDS", "0.05"))
+ADMISSION_TICKET_TTL_SECONDS = float(os.getenv("ADMISSION_TICKET_TTL_SECONDS", "3600"))
+ADMISSION_MAX_TICKETS = int(os.getenv("ADMISSION_MAX_TICKETS", "200000"))
+# How long shutdown waits for the writer to drain the queue before giving up on what is left
+ADMISSION_DRAIN_TIMEOUT_SECONDS = float(os.getenv("ADMISSION_DRAIN_TIMEOUT_SECONDS", "30"))
+
+class AdmissionQueueFull(Exception):
+    pass
+
+class Application:
+    """One validated application waiting to be written"""
+
+    __slots__ = ("hackathon_id", "organizer_id", "name", "email", "university_company", "region", "skills")
+
+    def __init__(
+        self,
+        hackathon_id: int,
+        organizer_id: int,
+        name: str,
+        email: str,
+        university_company: Optional[str] = None,
+        region: Optional[str] = None,
+        skills: Optional[List[str]] = None
+    ):
+        self.hackathon_id = hackathon_id
+        self.organizer_id = organizer_id
+        self.name = name
+        self.email = email
+        self.university_company = university_company
+        self.region = region
+        self.skills = skills or []
+
+class Ticket:
+    """Handle an applicant polls for the outcome of their application"""
+
+    __slots__ = ("id", "hackathon_id", "email", "status", "participant_id", "detail")
+
+    def __init__(self, hackathon_id: int, email: str, ticket_id: Optional[str] = None):
+        self.id = ticket_id or uuid.uuid4().hex
+        self.hackathon_id = hackathon_id
+        self.email = email
+        self.status = "queued"  # 'queued', 'accepted', 'duplicate', 'failed'
+        self.participant_id: Optional[int] = None
+        self.detail: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Ticket":
+        ticket = cls(data["hackathon_id"], data["email"], data["id"])
+        ticket.status = data["status"]
+        ticket.participant_id = data["participant_id"]
+        ticket.detail = data["detail"]
+        return ticket
+
+class TicketStore:
+    """Tickets by id for ``ADMISSION_TICKET_TTL_SECONDS``, in the shared tier when there is one"""
+
+    def __init__(self, shared: Optional[SharedStore] = None, max_tickets: int = ADMISSION_MAX_TICKETS):
+        self.shared = shared
+        self._local = LRUCache(max_tickets)
+
+    def save(self, ticket: Ticket):
+        expires_at = time.time() + ADMISSION_TICKET_TTL_SECONDS
+        if self.shared is None:
+            self._local.set(ticket.id, ticket, expires_at)
+        else:
+            # Written straight to the shared tier: a local copy would hide the outcome from polls
+            self.shared.set(f"admission:ticket:{ticket.id}", json.dumps(ticket.to_dict()), expires_at)
+
+    def get(self, ticket_id: str) -> Optional[Ticket]:
+        if self.shared is None:
+            return self._local.get(ticket_id)[1]
+        row = self.shared.get(f"admission:ticket:{ticket_id}")
+        return Ticket.from_dict(json.loads(row[0])) if row is not None else None
+
+def email_key(email: str) -> str:
+    return email.strip().lower()
+
+class AdmissionQueue:
+    """Bounded queue of applications with a single batching writer"""
+
+    def __init__(self, maxsize: int = ADMISSION_QUEUE_SIZE):
+        self.maxsize = maxsize
+        self._queue: Optional[asyncio.Queue] = None
+        self._tickets = TicketStore(cache.shared)
+        # (hackathon_id, email) of queued applications, so resubmits share a ticket
+        self._pending: Dict[Tuple[int, str], Ticket] = {}
+        self._writer: Optional[asyncio.Task] = None
+        self.batches = 0
+        self.accepted = 0
+        self.duplicates = 0
+        self.failed = 0
+        self.write_seconds = 0.0
+
+    @property
+    def depth(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def start(self):
+        """Start the writer on the running event loop (called from the lifespan)"""
+        self._queue = asyncio.Queue(maxsize=self.maxsize)
+        self._writer = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Write out what is still queued (bounded by ADMISSION_DRAIN_TIMEOUT_SECONDS), then stop the writer"""
+        if self._writer is None:
+            return
+        if not self._writer.done():
+            # join() would never return once the writer is gone, so wait for either
+            drained = asyncio.ensure_future(self._queue.join())
+            await asyncio.wait({drained, self._writer}, timeout=ADMISSION_DRAIN_TIMEOUT_SECONDS, return_when=asyncio.FIRST_COMPLETED)
+            drained.cancel()
+        self._writer.cancel()
+        try:
+            await self._writer
+        except asyncio.CancelledError:
+            pass
+        self._writer = None
+
+    def submit(self, application: Application) -> Ticket:
+        """Enqueue an application without waiting; raises AdmissionQueueFull"""
+        if self._queue is None:
+            raise RuntimeError("Admission queue is not running")
+        pending_key = (application.hackathon_id, email_key(application.email))
+        ticket = self._pending.get(pending_key)
+        if ticket is not None:
+            return ticket
+        
+        ticket = Ticket(application.hackathon_id, pending_key[1])
+        try:
+            self._queue.put_nowait((ticket, application))
+        except asyncio.QueueFull:
+            raise AdmissionQueueFull()
+        self._pending[pending_key] = ticket
+        self._tickets.save(ticket)
+        return ticket
+
+    def get_ticket(self, ticket_id: str) -> Optional[Ticket]:
+        return self._tickets.get(ticket_id)
+
+    def metrics(self) -> dict:
+        return {
+            "queued": self.depth,
+            "batches": self.batches,
+            "accepted": self.accepted,
+            "duplicates": self.duplicates,
+            "failed": self.failed,
+            "write_seconds": round(self.write_seconds, 3),
+        }
+
+    async def _next_batch(self) -> List[Tuple[Ticket, Application]]:
+        batch = [await self._queue.get()]
+        deadline = time.monotonic() + ADMISSION_BATCH_WAIT_SECONDS
+        while len(batch) < ADMISSION_BATCH_SIZE:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self):
+        while True:
+            batch = await self._next_batch()
+            started = time.perf_counter()
+            try:
+                # The blocking database work runs off the event loop
+                results = await asyncio.to_thread(write_applications, [application for _, application in batch])
+            except Exception as e:
+                results = [("failed", None, f"Failed to store application: {str(e)}")] * len(batch)
+            self.write_seconds += time.perf_counter() - started
+            
+            for (ticket, application), (outcome, participant_id, detail) in zip(batch, results):
+                ticket.status = outcome
+                ticket.participant_id = participant_id
+                ticket.detail = detail
+                try:
+                    self._tickets.save(ticket)
+                except Exception:
+                    # The application is settled either way; an unsaved ticket must not stall the writer
+                    pass
+                finally:
+                    self._pending.pop((application.hackathon_id, ticket.email), None)
+                    self._queue.task_done()
+                if outcome == "accepted":
+                    self.accepted += 1
+                elif outcome == "duplicate":
+                    self.duplicates += 1
+                else:
+                    self.failed += 1
+            self.batches += 1
+
+def _insert_ignoring_duplicates(db, rows: List[dict]) -> Dict[Tuple[int, str], int]:
+    """Insert participant rows, skipping emails another writer already stored; returns ids by (hackathon_id, email key)"""
+    if not rows:
+        return {}
+    table = Participant.__table__
+    dialect = db.get_bind().dialect.name
+    if dialect in ("sqlite", "postgresql"):
+        if dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        statement = dialect_insert(table).on_conflict_do_nothing().returning(
+            table.c.id, table.c.hackathon_id, table.c.email
+        )
+        return {
+            (hackathon_id, email_key(email)): participant_id
+            for participant_id, hackathon_id, email in db.execute(statement, rows)
+        }
+    
+    # Portable fallback: one savepoint per row, so a duplicate only skips that row
+    inserted = {}
+    for row in rows:
+        try:
+            with db.begin_nested():
+                inserted[(row["hackathon_id"], email_key(row["email"]))] = db.execute(insert(table), [row]).inserted_primary_key[0]
+        except IntegrityError:
+            pass
+    return inserted
+
+def write_applications(applications: List[Application]) -> List[Tuple[str, Optional[int], Optional[str]]]:
+    """Insert a batch in one transaction; returns (outcome, participant_id, detail) per application"""
+    duplicate = ("duplicate", None, "An application with this email already exists")
+    results: List[Tuple[str, Optional[int], Optional[str]]] = [duplicate] * len(applications)
+    by_hackathon = defaultdict(list)
+    for index, application in enumerate(applications):
+        by_hackathon[application.hackathon_id].append(index)
+    
+    db = SessionLocal()
+    try:
+        registered_at = datetime.utcnow()
+        candidates: Dict[Tuple[int, str], int] = {}
+        for hackathon_id, indexes in by_hackathon.items():
+            keys = {email_key(applications[index].email) for index in indexes}
+            # Most duplicates are resubmits of stored applications; the unique index catches the rest
+            existing = {
+                row[0] for row in db.query(func.lower(Participant.email))
+                .filter(Participant.hackathon_id == hackathon_id, func.lower(Participant.email).in_(keys))
+            }
+            for index in indexes:
+                key = (hackathon_id, email_key(applications[index].email))
+                if key[1] not in existing and key not in candidates:
+                    candidates[key] = index
+        
+        inserted = _insert_ignoring_duplicates(db, [
+            {
+                "name": applications[index].name,
+                "email": applications[index].email,
+                "university_company": applications[index].university_company,
+                "region": applications[index].region,
+                "skills": applications[index].skills,
+                "registration_date": registered_at,
+                "status": "applied",
+                "hackathon_id": hackathon_id
+            }
+            for (hackathon_id, _), index in candidates.items()
+        ])
+        created = [(candidates[key], participant_id, key[0]) for key, participant_id in inserted.items()]
+        index_participants(db, [
+            (participant_id, hackathon_id, applications[index].skills) for index, participant_id, hackathon_id in created
+        ])
+        record_events(db, "registrations", [
+            (registered_at, hackathon_id, applications[index].organizer_id, "") for index, _, hackathon_id in created
+        ])
+        db.commit()
+        
+        new_counts = defaultdict(int)
+        for index, participant_id, hackathon_id in created:
+            results[index] = ("accepted", participant_id, None)
+            new_counts[(hackathon_id, applications[index].organizer_id)] += 1
+        for (hackathon_id, organizer_id), count in new_counts.items():
+            hub.publish(*counts_event(hackathon_id, organizer_id, {"participant_count": count}))
+        
+        return results
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+admission_queue = AdmissionQueue()
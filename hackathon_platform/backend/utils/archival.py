@@ -0,0 +1,154 @@
+"""
+Moves cold data out of the hot tables in batches.
+
+Past hackathons whose end date is older than a cutoff are copied, with every
+child row, into one ``archived_hackathons`` row holding a zlib-compressed JSON
+document, then deleted from the live tables in the same transaction. Aged
+activity logs are moved to ``archived_activity_logs`` with INSERT ... SELECT.
+Run it with ``archive_data.py``; archived data is served read-only by
+``routers/archive.py``.
+"""
+import json
+import os
+import zlib
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, List, Tuple
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+from models.database import (
+    Hackathon, Sponsor, Participant, ParticipantSkill, Team, Submission, SubmissionArtifact, MentorSession,
+    Judge, JudgeAssignment, ActivityLog, ArchivedHackathon, ArchivedActivityLog
+)
+from utils.cache import cache
+from utils.leaderboard import discard_leaderboard
+from utils.landing import remove_landing
+from utils.autocomplete import unindex_hackathons
+
+ARCHIVE_BATCH_SIZE = int(os.getenv("ARCHIVE_BATCH_SIZE", "50"))
+ACTIVITY_LOG_BATCH_SIZE = int(os.getenv("ACTIVITY_LOG_BATCH_SIZE", "5000"))
+
+# Every table hanging off a hackathon, in an order that is safe to delete in
+HACKATHON_CHILD_MODELS = [
+    JudgeAssignment,
+    Judge,
+    ParticipantSkill,
+    SubmissionArtifact,
+    Submission,
+    Participant,
+    Team,
+    MentorSession,
+    Sponsor,
+]
+
+ACTIVITY_LOG_COLUMNS = ["action", "resource_type", "resource_id", "details", "timestamp", "ip_address", "user_id"]
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def encode_payload(document: Dict[str, Any]) -> Tuple[bytes, int]:
+    """Compressed JSON of an archive document and its uncompressed size"""
+    raw = json.dumps(document, default=_json_default, separators=(",", ":")).encode("utf-8")
+    return zlib.compress(raw, 9), len(raw)
+
+def decode_payload(payload: bytes) -> Dict[str, Any]:
+    return json.loads(zlib.decompress(payload))
+
+def _rows_by_hackathon(db: Session, model, hackathon_ids: List[int]) -> Dict[int, List[dict]]:
+    table = model.__table__
+    grouped = defaultdict(list)
+    rows = db.execute(
+        select(table).where(table.c.hackathon_id.in_(hackathon_ids)).order_by(table.c.id)
+    ).mappings()
+    for row in rows:
+        grouped[row["hackathon_id"]].append(dict(row))
+    return grouped
+
+def archive_hackathons(db: Session, ended_before: datetime, batch_size: int = ARCHIVE_BATCH_SIZE) -> int:
+    """Archive past hackathons that ended before the cutoff; commits per batch"""
+    table = Hackathon.__table__
+    archived = 0
+    
+    while True:
+        hackathons = db.execute(
+            select(table)
+            .where(table.c.status == "past", table.c.end_date < ended_before)
+            .order_by(table.c.id)
+            .limit(batch_size)
+        ).mappings().all()
+        if not hackathons:
+            break
+        hackathon_ids = [hackathon["id"] for hackathon in hackathons]
+        
+        # One query per child table for the whole batch
+        children = {
+            model.__tablename__: _rows_by_hackathon(db, model, hackathon_ids)
+            for model in HACKATHON_CHILD_MODELS
+        }
+        
+        now = datetime.utcnow()
+        rows = []
+        for hackathon in hackathons:
+            document = {"hackathon": dict(hackathon)}
+            for name, grouped in children.items():
+                document[name] = grouped.get(hackathon["id"], [])
+            payload, payload_size = encode_payload(document)
+            rows.append({
+                "hackathon_id": hackathon["id"],
+                "organizer_id": hackathon["organizer_id"],
+                "name": hackathon["name"],
+                "status": hackathon["status"],
+                "start_date": hackathon["start_date"],
+                "end_date": hackathon["end_date"],
+                "participant_count": len(document["participants"]),
+                "team_count": len(document["teams"]),
+                "submission_count": len(document["submissions"]),
+                "payload": payload,
+                "payload_size": payload_size,
+                "archived_at": now
+            })
+        db.execute(insert(ArchivedHackathon), rows)
+        
+        for model in HACKATHON_CHILD_MODELS:
+            db.query(model).filter(model.hackathon_id.in_(hackathon_ids)).delete(synchronize_session=False)
+        db.query(Hackathon).filter(Hackathon.id.in_(hackathon_ids)).delete(synchronize_session=False)
+        db.commit()
+        
+        for hackathon_id in hackathon_ids:
+            discard_leaderboard(hackathon_id)
+            cache.invalidate(f"landing:{hackathon_id}")
+            cache.invalidate(f"application_window:{hackathon_id}")
+            remove_landing(hackathon_id)
+        unindex_hackathons(hackathon_ids)
+        archived += len(hackathon_ids)
+    
+    return archived
+
+def archive_activity_logs(db: Session, older_than: datetime, batch_size: int = ACTIVITY_LOG_BATCH_SIZE) -> int:
+    """Move activity logs older than the cutoff to the archive table; commits per batch"""
+    live = ActivityLog.__table__
+    moved = 0
+    
+    while True:
+        log_ids = [
+            row[0] for row in db.query(ActivityLog.id)
+            .filter(ActivityLog.timestamp < older_than)
+            .order_by(ActivityLog.id)
+            .limit(batch_size)
+        ]
+        if not log_ids:
+            break
+        
+        db.execute(ArchivedActivityLog.__table__.insert().from_select(
+            ACTIVITY_LOG_COLUMNS,
+            select(*[live.c[column] for column in ACTIVITY_LOG_COLUMNS])
+            .where(live.c.id.in_(log_ids))
+            .order_by(live.c.id)
+        ))
+        db.query(ActivityLog).filter(ActivityLog.id.in_(log_ids)).delete(synchronize_session=False)
+        db.commit()
+        moved += len(log_ids)
+    
+    return moved
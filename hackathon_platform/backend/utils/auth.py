@@ -1,3 +1,4 @@
+import uuid
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import JWTError, jwt
@@ -8,7 +9,8 @@ from sqlalchemy.orm import Session
 import os
 from dotenv import load_dotenv
 from utils.database import get_db
-from models.database import User
+from models.database import User, Hackathon
+from utils.revocation import revocation_list
 
 load_dotenv()
 
@@ -16,6 +18,7 @@ load_dotenv()
 SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-here")
 ALGORITHM = os.getenv("ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
+REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "14"))
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 security = HTTPBearer()
@@ -36,20 +39,41 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     else:
         expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     
-    to_encode.update({"exp": expire})
+    # Every token gets a unique id so it can be revoked individually
+    to_encode.update({"exp": expire, "jti": uuid.uuid4().hex, "type": "access"})
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
-def verify_token(token: str) -> Optional[str]:
-    """Verify JWT token and return username"""
+def create_refresh_token(data: dict, expires_delta: Optional[timedelta] = None):
+    """Create long-lived JWT refresh token"""
+    to_encode = data.copy()
+    expire = datetime.utcnow() + (expires_delta or timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS))
+    to_encode.update({"exp": expire, "jti": uuid.uuid4().hex, "type": "refresh"})
+    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+
+def decode_token(token: str, token_type: str = "access") -> Optional[dict]:
+    """Verify JWT token and return its payload if it has the expected type"""
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        username: str = payload.get("sub")
-        if username is None:
-            return None
-        return username
     except JWTError:
         return None
+    if payload.get("sub") is None:
+        return None
+    # Tokens issued before typed tokens existed are access tokens
+    if payload.get("type", "access") != token_type:
+        return None
+    return payload
+
+def verify_token(token: str) -> Optional[str]:
+    """Verify JWT token and return username"""
+    payload = decode_token(token)
+    if payload is None:
+        return None
+    return payload["sub"]
+
+def token_expiry(payload: dict) -> datetime:
+    """Expiry of a decoded token as a naive UTC datetime"""
+    return datetime.utcfromtimestamp(payload["exp"])
 
 def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
     """Authenticate user with email and password"""
@@ -71,15 +95,16 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
     
-    try:
-        token = credentials.credentials
-        username = verify_token(token)
-        if username is None:
-            raise credentials_exception
-    except JWTError:
+    payload = decode_token(credentials.credentials)
+    if payload is None:
+        raise credentials_exception
+    
+    # Revoked tokens (logout, rotation) are rejected; the check is in memory unless the bloom filter hits
+    jti = payload.get("jti")
+    if jti is not None and revocation_list.is_revoked(db, jti):
         raise credentials_exception
     
-    user = db.query(User).filter(User.username == username).first()
+    user = db.query(User).filter(User.username == payload["sub"]).first()
     if user is None:
         raise credentials_exception
     
@@ -93,3 +118,22 @@ async def get_current_active_user(current_user: User = Depends(get_current_user)
             detail="Inactive user"
         )
     return current_user
+
+def get_hackathon_for_user(db: Session, hackathon_id: int, current_user: User) -> Hackathon:
+    """Load a hackathon, enforcing that organizers can only access their own"""
+    hackathon = db.query(Hackathon).filter(Hackathon.id == hackathon_id).first()
+    
+    if not hackathon:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Hackathon not found"
+        )
+    
+    # Check access permissions
+    if current_user.role == "organizer" and hackathon.organizer_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied"
+        )
+    
+    return hackathon
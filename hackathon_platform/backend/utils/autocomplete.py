@@ -0,0 +1,217 @@
+"""
+In-memory prefix index for hackathon search-as-you-type.
+
+Every worker keeps the hackathon names, themes and organizer names in sorted
+arrays of ``(term, hackathon_id)`` keys. A query is one binary search for the
+first key starting with the prefix plus a scan of at most a few keys per
+result, so top-K does not depend on the number of hackathons. Every word of
+a field starts a term, so "hack" finds "AI Hackathon". Next to the global
+array there is one per organizer, so scoped queries never scan over other
+organizers' hackathons.
+
+Writes update the local index and publish a new generation through the
+shared cache. Other workers see it within CACHE_INVALIDATION_INTERVAL and
+reload from the database on their next query. Renaming a user through the
+ORM publishes a generation on commit, since organizer names are indexed too.
+"""
+import os
+import threading
+import time
+import uuid
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+from models.database import Hackathon, User
+from utils.cache import cache
+
+GENERATION_CACHE_KEY = "autocomplete:generation"
+# The generation outlives any write burst; on expiry every worker reloads once
+GENERATION_CACHE_TTL = 24 * 3600
+# Terms and queries are cut to this many characters to bound the index size
+MAX_TERM_LENGTH = 64
+# Reload at least this often, in case a change crossed an unsynced local write
+AUTOCOMPLETE_MAX_AGE_SECONDS = float(os.getenv("AUTOCOMPLETE_MAX_AGE_SECONDS", "300"))
+
+def normalize_term(text: Optional[str]) -> str:
+    """Case- and whitespace-insensitive form used for keys and queries"""
+    if not text:
+        return ""
+    return " ".join(text.casefold().split())[:MAX_TERM_LENGTH]
+
+def _word_starts(text: Optional[str]) -> List[str]:
+    words = normalize_term(text).split(" ")
+    return [" ".join(words[index:])[:MAX_TERM_LENGTH] for index in range(len(words)) if words[index]]
+
+def _index_terms(name: str, theme: Optional[str], organizer_name: Optional[str]) -> List[str]:
+    return sorted(set(_word_starts(name) + _word_starts(theme) + _word_starts(organizer_name)))
+
+def _announce_generation() -> str:
+    generation = uuid.uuid4().hex
+    cache.invalidate(GENERATION_CACHE_KEY)
+    cache.set(GENERATION_CACHE_KEY, generation, GENERATION_CACHE_TTL)
+    return generation
+
+class PrefixIndex:
+    """Sorted ``(term, hackathon_id)`` keys over hackathon names, themes and organizers"""
+
+    def __init__(self):
+        # hackathon id -> (organizer id, name, theme, organizer name)
+        self._entries: Dict[int, Tuple[int, str, Optional[str], Optional[str]]] = {}
+        self._terms: Dict[int, List[str]] = {}
+        self._keys: List[Tuple[str, int]] = []
+        self._organizer_keys: Dict[int, List[Tuple[str, int]]] = {}
+        self._generation: Optional[str] = None
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _insert(self, hackathon_id: int, entry: Tuple[int, str, Optional[str], Optional[str]]):
+        organizer_id, name, theme, organizer_name = entry
+        terms = _index_terms(name, theme, organizer_name)
+        organizer_keys = self._organizer_keys.setdefault(organizer_id, [])
+        for term in terms:
+            insort(self._keys, (term, hackathon_id))
+            insort(organizer_keys, (term, hackathon_id))
+        self._entries[hackathon_id] = entry
+        self._terms[hackathon_id] = terms
+
+    def _delete(self, hackathon_id: int):
+        entry = self._entries.pop(hackathon_id, None)
+        if entry is None:
+            return
+        organizer_keys = self._organizer_keys[entry[0]]
+        for term in self._terms.pop(hackathon_id):
+            for keys in (self._keys, organizer_keys):
+                index = bisect_left(keys, (term, hackathon_id))
+                if index < len(keys) and keys[index] == (term, hackathon_id):
+                    del keys[index]
+        if not organizer_keys:
+            del self._organizer_keys[entry[0]]
+
+    def load(self, rows: Iterable[Tuple[int, int, str, Optional[str], Optional[str]]], generation: str):
+        """Replace the index with ``(hackathon_id, organizer_id, name, theme, organizer_name)`` rows"""
+        entries = {row[0]: tuple(row[1:]) for row in rows}
+        terms = {}
+        keys = []
+        organizer_keys: Dict[int, List[Tuple[str, int]]] = {}
+        for hackathon_id, (organizer_id, name, theme, organizer_name) in entries.items():
+            hackathon_terms = _index_terms(name, theme, organizer_name)
+            terms[hackathon_id] = hackathon_terms
+            pairs = [(term, hackathon_id) for term in hackathon_terms]
+            keys.extend(pairs)
+            organizer_keys.setdefault(organizer_id, []).extend(pairs)
+        keys.sort()
+        for pairs in organizer_keys.values():
+            pairs.sort()
+        with self._lock:
+            self._entries, self._terms, self._keys, self._organizer_keys = entries, terms, keys, organizer_keys
+            self._generation = generation
+            self._loaded_at = time.monotonic()
+
+    def put(self, hackathon_id: int, organizer_id: int, name: str, theme: Optional[str], organizer_name: Optional[str]) -> bool:
+        """Add or refresh one hackathon; returns False if nothing indexed changed"""
+        entry = (organizer_id, name, theme, organizer_name)
+        with self._lock:
+            if self._generation is None:
+                # Not loaded here; the change only needs announcing
+                return True
+            if self._entries.get(hackathon_id) == entry:
+                return False
+            self._delete(hackathon_id)
+            self._insert(hackathon_id, entry)
+            return True
+
+    def remove(self, hackathon_ids: Iterable[int]) -> bool:
+        """Drop hackathons; returns False if none of them was indexed"""
+        with self._lock:
+            if self._generation is None:
+                return True
+            removed = False
+            for hackathon_id in hackathon_ids:
+                removed = hackathon_id in self._entries or removed
+                self._delete(hackathon_id)
+            return removed
+
+    def search(self, prefix: str, limit: int, organizer_id: Optional[int] = None) -> List[dict]:
+        """First ``limit`` hackathons with a term starting with ``prefix``, in term order"""
+        key = normalize_term(prefix)
+        if not key or limit <= 0:
+            return []
+        with self._lock:
+            keys = self._keys if organizer_id is None else self._organizer_keys.get(organizer_id, [])
+            results = []
+            seen = set()
+            index = bisect_left(keys, (key,))
+            while index < len(keys) and len(results) < limit:
+                term, hackathon_id = keys[index]
+                if not term.startswith(key):
+                    break
+                index += 1
+                if hackathon_id in seen:
+                    continue
+                seen.add(hackathon_id)
+                _, name, theme, organizer_name = self._entries[hackathon_id]
+                results.append({"id": hackathon_id, "name": name, "theme": theme, "organizer_name": organizer_name})
+            return results
+
+    def is_current(self) -> bool:
+        """Whether no other worker has changed the index since it was loaded"""
+        if self._generation is None or time.monotonic() - self._loaded_at > AUTOCOMPLETE_MAX_AGE_SECONDS:
+            return False
+        return cache.get(GENERATION_CACHE_KEY) == self._generation
+
+    def publish(self, adopt: bool = True):
+        """Announce a change so other workers reload; ``adopt`` keeps this worker's index as current"""
+        generation = _announce_generation()
+        with self._lock:
+            self._generation = generation if adopt and self._generation is not None else None
+
+autocomplete_index = PrefixIndex()
+
+def reload_autocomplete_index(db: Session):
+    """Rebuild the index from the database and adopt (or start) the shared generation"""
+    generation = cache.get(GENERATION_CACHE_KEY) or _announce_generation()
+    rows = (
+        db.query(Hackathon.id, Hackathon.organizer_id, Hackathon.name, Hackathon.theme, User.full_name)
+        .join(User, User.id == Hackathon.organizer_id)
+        .all()
+    )
+    autocomplete_index.load(rows, generation)
+
+def get_autocomplete_index(db: Session) -> PrefixIndex:
+    """The index of this worker, reloaded first if another worker changed it"""
+    if not autocomplete_index.is_current():
+        reload_autocomplete_index(db)
+    return autocomplete_index
+
+def index_hackathon(hackathon: Hackathon):
+    """Refresh a created or updated hackathon (call after commit)"""
+    # A local index another worker already changed is not patched, it reloads on the next query
+    current = autocomplete_index.is_current()
+    organizer_name = hackathon.organizer.full_name if hackathon.organizer else None
+    if autocomplete_index.put(hackathon.id, hackathon.organizer_id, hackathon.name, hackathon.theme, organizer_name):
+        autocomplete_index.publish(adopt=current)
+
+def unindex_hackathons(hackathon_ids: List[int]):
+    """Drop deleted or archived hackathons (call after commit)"""
+    current = autocomplete_index.is_current()
+    if autocomplete_index.remove(hackathon_ids):
+        autocomplete_index.publish(adopt=current)
+
+@event.listens_for(User, "after_update")
+def _note_organizer_rename(mapper, connection, user: User):
+    if inspect(user).attrs.full_name.history.has_changes():
+        inspect(user).session.info["autocomplete_stale"] = True
+
+@event.listens_for(Session, "after_commit")
+def _publish_organizer_renames(session: Session):
+    # Every worker, this one included, reloads the names on its next query
+    if session.info.pop("autocomplete_stale", False):
+        autocomplete_index.publish(adopt=False)
+
+@event.listens_for(Session, "after_soft_rollback")
+def _forget_organizer_renames(session: Session, previous_transaction):
+    session.info.pop("autocomplete_stale", None)
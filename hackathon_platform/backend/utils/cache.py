@@ -0,0 +1,294 @@
+"""
+Two-tier cache shared by all uvicorn workers.
+
+Every worker keeps a small in-memory LRU in front of an optional shared store.
+With ``CACHE_BACKEND=sqlite`` (the shared store is a local SQLite file at
+``CACHE_SQLITE_PATH``), invalidations are also appended to a message table
+that every worker polls at most every ``CACHE_INVALIDATION_INTERVAL`` seconds
+before serving a read. So a write evicts an entry in all workers within that
+bound. The default ``memory`` backend is a single-process LRU.
+
+The shared store also carries a small append-only message log, which is how
+change events (``utils/events.py``) reach subscribers on every worker.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, List, Optional, Tuple
+
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "memory")
+CACHE_SQLITE_PATH = os.getenv("CACHE_SQLITE_PATH", "./cache.sqlite3")
+CACHE_LOCAL_MAX_ENTRIES = int(os.getenv("CACHE_LOCAL_MAX_ENTRIES", "1024"))
+CACHE_DEFAULT_TTL = float(os.getenv("CACHE_DEFAULT_TTL", "300"))
+CACHE_INVALIDATION_INTERVAL = float(os.getenv("CACHE_INVALIDATION_INTERVAL", "1"))
+# Invalidation and log messages older than this are pruned from the shared store
+INVALIDATION_RETENTION_SECONDS = 3600
+
+class LRUCache:
+    """In-process LRU with per-entry expiry"""
+
+    def __init__(self, max_entries: int = CACHE_LOCAL_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            expires_at, value = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return False, None
+            self._entries.move_to_end(key)
+            return True, value
+
+    def set(self, key: str, value: Any, expires_at: float):
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def delete_prefix(self, prefix: str):
+        with self._lock:
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+class SharedStore(ABC):
+    """Interface of the shared tier; values are JSON strings"""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Tuple[str, float]]:
+        """Value and expiry of a live entry, or None"""
+
+    @abstractmethod
+    def set(self, key: str, value: str, expires_at: float):
+        """Store a value until ``expires_at`` (a ``time.time()`` timestamp)"""
+
+    @abstractmethod
+    def add(self, key: str, value: str, expires_at: float) -> bool:
+        """Store a value only if the key has no live entry; returns whether it was stored"""
+
+    @abstractmethod
+    def invalidate(self, pattern: str):
+        """Remove ``pattern`` (a key, or a prefix ending in ``*``) and notify other workers"""
+
+    @abstractmethod
+    def invalidations_since(self, last_id: int) -> Tuple[int, List[str]]:
+        """Newest invalidation id and the patterns invalidated after ``last_id``"""
+
+    @abstractmethod
+    def latest_invalidation_id(self) -> int:
+        """Id of the newest invalidation, so a new worker only applies later ones"""
+
+    @abstractmethod
+    def append_message(self, channel: str, body: str) -> int:
+        """Append a message to a channel of the log and return its id"""
+
+    @abstractmethod
+    def messages_since(self, channel: str, last_id: int, limit: int) -> List[Tuple[int, str]]:
+        """Up to ``limit`` ``(id, body)`` messages of a channel after ``last_id``, oldest first"""
+
+    @abstractmethod
+    def latest_message_id(self, channel: str) -> int:
+        """Id of the newest message of a channel"""
+
+class SQLiteSharedStore(SharedStore):
+    """Shared tier in a local SQLite file (WAL mode, one connection per thread)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        connection = self._connection()
+        connection.executescript(
+            """
+            PRAGMA journal_mode=WAL;
+            CREATE TABLE IF NOT EXISTS cache_entries (
+                key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS cache_invalidations (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, pattern TEXT NOT NULL, created_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS cache_messages (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, channel TEXT NOT NULL, body TEXT NOT NULL, created_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS ix_cache_messages_channel ON cache_messages (channel, id);
+            """
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def get(self, key: str) -> Optional[Tuple[str, float]]:
+        row = self._connection().execute(
+            "SELECT value, expires_at FROM cache_entries WHERE key = ? AND expires_at > ?",
+            (key, time.time())
+        ).fetchone()
+        return row
+
+    def set(self, key: str, value: str, expires_at: float):
+        self._connection().execute(
+            "INSERT OR REPLACE INTO cache_entries (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, value, expires_at)
+        )
+
+    def add(self, key: str, value: str, expires_at: float) -> bool:
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.execute("DELETE FROM cache_entries WHERE key = ? AND expires_at <= ?", (key, time.time()))
+            added = connection.execute(
+                "INSERT OR IGNORE INTO cache_entries (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, expires_at)
+            ).rowcount == 1
+            connection.execute("COMMIT")
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+        return added
+
+    def invalidate(self, pattern: str):
+        connection = self._connection()
+        now = time.time()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            if pattern.endswith("*"):
+                prefix = pattern[:-1]
+                connection.execute(
+                    "DELETE FROM cache_entries WHERE substr(key, 1, ?) = ?", (len(prefix), prefix)
+                )
+            else:
+                connection.execute("DELETE FROM cache_entries WHERE key = ?", (pattern,))
+            connection.execute(
+                "INSERT INTO cache_invalidations (pattern, created_at) VALUES (?, ?)", (pattern, now)
+            )
+            connection.execute(
+                "DELETE FROM cache_invalidations WHERE created_at < ?", (now - INVALIDATION_RETENTION_SECONDS,)
+            )
+            connection.execute("COMMIT")
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+
+    def invalidations_since(self, last_id: int) -> Tuple[int, List[str]]:
+        rows = self._connection().execute(
+            "SELECT id, pattern FROM cache_invalidations WHERE id > ? ORDER BY id", (last_id,)
+        ).fetchall()
+        if not rows:
+            return last_id, []
+        return rows[-1][0], [pattern for _, pattern in rows]
+
+    def latest_invalidation_id(self) -> int:
+        row = self._connection().execute("SELECT MAX(id) FROM cache_invalidations").fetchone()
+        return row[0] or 0
+
+    def append_message(self, channel: str, body: str) -> int:
+        connection = self._connection()
+        now = time.time()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            message_id = connection.execute(
+                "INSERT INTO cache_messages (channel, body, created_at) VALUES (?, ?, ?)", (channel, body, now)
+            ).lastrowid
+            connection.execute(
+                "DELETE FROM cache_messages WHERE created_at < ?", (now - INVALIDATION_RETENTION_SECONDS,)
+            )
+            connection.execute("COMMIT")
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+        return message_id
+
+    def messages_since(self, channel: str, last_id: int, limit: int) -> List[Tuple[int, str]]:
+        return self._connection().execute(
+            "SELECT id, body FROM cache_messages WHERE channel = ? AND id > ? ORDER BY id LIMIT ?",
+            (channel, last_id, limit)
+        ).fetchall()
+
+    def latest_message_id(self, channel: str) -> int:
+        row = self._connection().execute(
+            "SELECT MAX(id) FROM cache_messages WHERE channel = ?", (channel,)
+        ).fetchone()
+        return row[0] or 0
+
+class Cache:
+    """Local LRU tier in front of an optional shared tier"""
+
+    def __init__(self, shared: Optional[SharedStore] = None, local: Optional[LRUCache] = None):
+        self.local = local or LRUCache()
+        self.shared = shared
+        self._last_sync = time.monotonic()
+        self._last_invalidation_id = shared.latest_invalidation_id() if shared is not None else 0
+        self._sync_lock = threading.Lock()
+
+    def _sync_invalidations(self):
+        if self.shared is None or time.monotonic() - self._last_sync < CACHE_INVALIDATION_INTERVAL:
+            return
+        if not self._sync_lock.acquire(blocking=False):
+            return
+        try:
+            self._last_invalidation_id, patterns = self.shared.invalidations_since(self._last_invalidation_id)
+            for pattern in patterns:
+                self._evict_local(pattern)
+            self._last_sync = time.monotonic()
+        finally:
+            self._sync_lock.release()
+
+    def _evict_local(self, pattern: str):
+        if pattern.endswith("*"):
+            self.local.delete_prefix(pattern[:-1])
+        else:
+            self.local.delete(pattern)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        self._sync_invalidations()
+        found, value = self.local.get(key)
+        if found:
+            return value
+        if self.shared is not None:
+            row = self.shared.get(key)
+            if row is not None:
+                raw, expires_at = row
+                value = json.loads(raw)
+                self.local.set(key, value, expires_at)
+                return value
+        return default
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        """Store a JSON-serializable value in both tiers"""
+        expires_at = time.time() + (ttl if ttl is not None else CACHE_DEFAULT_TTL)
+        self.local.set(key, value, expires_at)
+        if self.shared is not None:
+            self.shared.set(key, json.dumps(value, default=str), expires_at)
+
+    def invalidate(self, pattern: str):
+        """Evict a key (or every key starting with the prefix before a trailing ``*``) everywhere"""
+        self._evict_local(pattern)
+        if self.shared is not None:
+            self.shared.invalidate(pattern)
+
+def _create_cache() -> Cache:
+    if CACHE_BACKEND == "sqlite":
+        return Cache(shared=SQLiteSharedStore(CACHE_SQLITE_PATH))
+    return Cache()
+
+cache = _create_cache()
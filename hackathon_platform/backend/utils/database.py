@@ -1,7 +1,10 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+import glob
 import os
+import re
+from typing import Set
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -15,6 +18,19 @@ engine = create_engine(
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Optional read replicas, comma-separated (see utils/replicas.py for routing)
+REPLICA_DATABASE_URLS = [url.strip() for url in os.getenv("REPLICA_DATABASE_URLS", "").split(",") if url.strip()]
+
+replica_engines = [
+    create_engine(url, connect_args={"check_same_thread": False} if "sqlite" in url else {})
+    for url in REPLICA_DATABASE_URLS
+]
+
+ReplicaSessionLocals = [
+    sessionmaker(autocommit=False, autoflush=False, bind=replica_engine)
+    for replica_engine in replica_engines
+]
+
 Base = declarative_base()
 
 def get_db():
@@ -26,3 +42,45 @@ def get_db():
 
 def create_tables():
     Base.metadata.create_all(bind=engine)
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MIGRATIONS_DIR = os.path.join(BACKEND_DIR, "migrations")
+
+def schema_heads() -> Set[str]:
+    """Head revision ids of the migration scripts, read without importing Alembic"""
+    revisions, parents = set(), set()
+    for path in glob.glob(os.path.join(MIGRATIONS_DIR, "versions", "*.py")):
+        with open(path, encoding="utf-8") as script:
+            source = script.read()
+        revision = re.search(r"^revision\b[^=]*=\s*['\"]([^'\"]+)['\"]", source, re.M)
+        down_revision = re.search(r"^down_revision\b[^=]*=\s*(.+)$", source, re.M)
+        if revision:
+            revisions.add(revision.group(1))
+        if down_revision:
+            parents.update(re.findall(r"['\"]([^'\"]+)['\"]", down_revision.group(1)))
+    return revisions - parents
+
+def current_revisions() -> Set[str]:
+    """Revisions recorded in the database's alembic_version table"""
+    with engine.connect() as connection:
+        if not inspect(connection).has_table("alembic_version"):
+            return set()
+        return {row[0] for row in connection.execute(text("SELECT version_num FROM alembic_version"))}
+
+def ensure_schema() -> bool:
+    """Bring the schema to the latest migration; returns False when it already was.
+
+    The common case is one small query against alembic_version. Alembic is
+    only imported when an upgrade is actually needed.
+    """
+    if current_revisions() == schema_heads():
+        return False
+    
+    from alembic import command
+    from alembic.config import Config
+    
+    config = Config(os.path.join(BACKEND_DIR, "alembic.ini"))
+    config.set_main_option("script_location", MIGRATIONS_DIR)
+    config.attributes["configure_logger"] = False
+    command.upgrade(config, "head")
+    return True
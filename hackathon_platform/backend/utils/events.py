@@ -0,0 +1,235 @@
+"""
+Change events for Server-Sent Events subscribers.
+
+With the default in-memory cache every event stays in the publishing process.
+With a shared cache tier (``CACHE_BACKEND=sqlite``), events are appended to
+the shared message log instead. Every worker, the publishing one included,
+reads the log every EVENT_POLL_INTERVAL seconds and delivers it to its own
+subscribers. Event ids are then the log ids, the same on every worker, so a
+client can resume on any of them.
+"""
+import asyncio
+import json
+import os
+import threading
+import uuid
+from collections import deque
+from datetime import datetime
+from typing import Deque, Dict, List, Optional, Tuple
+from utils.cache import SharedStore, cache
+
+# Number of recent events kept for Last-Event-ID resume
+HISTORY_SIZE = 1000
+# Maximum number of undelivered events per connection before it is reset
+SUBSCRIBER_QUEUE_SIZE = 256
+# Seconds between reads of the shared event log
+EVENT_POLL_INTERVAL = float(os.getenv("EVENT_POLL_INTERVAL", "0.25"))
+# Log messages read per poll
+EVENT_POLL_BATCH = 500
+EVENT_CHANNEL = "events"
+
+# Event ids are "<stream>-<sequence>"; ids from another stream (another process
+# or an older boot without a shared log) cannot be resumed and make the client refetch instead
+BOOT_ID = uuid.uuid4().hex[:8]
+SHARED_STREAM_ID = "shared"
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+class Subscription:
+    """One connected client: a bounded queue plus its organizer scope"""
+
+    __slots__ = ("organizer_id", "queue", "overflowed", "cursor")
+
+    def __init__(self, organizer_id: Optional[int]):
+        # None means the subscriber sees every event (superadmin)
+        self.organizer_id = organizer_id
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self.overflowed = False
+        # Events up to this sequence were recorded before subscribing (replayed or not wanted)
+        self.cursor = 0
+
+    def accepts(self, organizer_id: Optional[int]) -> bool:
+        return self.organizer_id is None or self.organizer_id == organizer_id
+
+class EventHub:
+    """Fan-out of change events to Server-Sent Events subscribers.
+
+    Each event is serialized once and shared by every matching subscriber, so
+    an idle connection costs one small queue and one parked coroutine.
+    """
+
+    def __init__(self, history_size: int = HISTORY_SIZE, store: Optional[SharedStore] = None):
+        self._sequence = 0
+        self._history: Deque[Tuple[int, Optional[int], str]] = deque(maxlen=history_size)
+        self._subscriptions: Dict[Subscription, None] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+        self._store = store
+        self._stream_id = BOOT_ID if store is None else SHARED_STREAM_ID
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscriptions)
+
+    def subscribe(self, organizer_id: Optional[int], last_event_id: Optional[str] = None) -> Tuple[Subscription, List[str], bool]:
+        """Register a subscriber.
+
+        Returns the subscription, the serialized events to replay after
+        ``last_event_id`` and whether the client must reset (its id is too old
+        or from another process).
+        """
+        self._loop = asyncio.get_running_loop()
+        subscription = Subscription(organizer_id)
+        with self._lock:
+            replay, reset = self._replay(subscription, last_event_id)
+            # An event recorded but not yet fanned out must not arrive twice
+            subscription.cursor = self._sequence
+            self._subscriptions[subscription] = None
+        return subscription, replay, reset
+
+    def unsubscribe(self, subscription: Subscription):
+        self._subscriptions.pop(subscription, None)
+
+    def _replay(self, subscription: Subscription, last_event_id: Optional[str]) -> Tuple[List[str], bool]:
+        if not last_event_id:
+            return [], False
+        stream, _, sequence = last_event_id.partition("-")
+        if stream != self._stream_id or not sequence.isdigit():
+            return [], True
+        sequence = int(sequence)
+        if self._history and sequence < self._history[0][0] - 1:
+            return [], True
+        return [
+            message
+            for event_sequence, organizer_id, message in self._history
+            if event_sequence > sequence and subscription.accepts(organizer_id)
+        ], False
+
+    def _record(self, sequence: int, event_type: str, organizer_id: Optional[int], data: str) -> str:
+        # Caller holds the lock
+        message = f"id: {self._stream_id}-{sequence}\nevent: {event_type}\ndata: {data}\n\n"
+        self._sequence = sequence
+        self._history.append((sequence, organizer_id, message))
+        return message
+
+    def publish(self, event_type: str, organizer_id: Optional[int], data: dict):
+        """Publish an event to every subscriber allowed to see ``organizer_id``"""
+        payload = {"type": event_type, "timestamp": datetime.utcnow().isoformat(), **data}
+        serialized = json.dumps(payload, default=_json_default, separators=(',', ':'))
+        if self._store is not None:
+            # Delivered by every worker's poller, this one included
+            self._store.append_message(
+                EVENT_CHANNEL,
+                json.dumps({"event": event_type, "organizer_id": organizer_id, "data": serialized})
+            )
+            return
+
+        with self._lock:
+            sequence = self._sequence + 1
+            message = self._record(sequence, event_type, organizer_id, serialized)
+
+        if not self._subscriptions or self._loop is None:
+            return
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is self._loop:
+            self._fan_out(sequence, organizer_id, message)
+        elif not self._loop.is_closed():
+            # Called from a worker thread (sync route or background job)
+            self._loop.call_soon_threadsafe(self._fan_out, sequence, organizer_id, message)
+
+    def _fan_out(self, sequence: int, organizer_id: Optional[int], message: str):
+        for subscription in list(self._subscriptions):
+            if sequence <= subscription.cursor or not subscription.accepts(organizer_id):
+                continue
+            try:
+                subscription.queue.put_nowait(message)
+            except asyncio.QueueFull:
+                # Too far behind: tell the client to refetch instead of buffering forever
+                subscription.overflowed = True
+
+    def start(self):
+        """Start reading the shared event log (no-op without a shared cache tier)"""
+        if self._store is None:
+            return
+        self._loop = asyncio.get_running_loop()
+        with self._lock:
+            # Only events published from now on; older ones predate this worker's subscribers
+            self._sequence = self._store.latest_message_id(EVENT_CHANNEL)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def poll_once(self) -> int:
+        """Deliver the events other workers (and this one) appended to the shared log"""
+        rows = await asyncio.to_thread(self._store.messages_since, EVENT_CHANNEL, self._sequence, EVENT_POLL_BATCH)
+        for message_id, body in rows:
+            event = json.loads(body)
+            with self._lock:
+                message = self._record(message_id, event["event"], event["organizer_id"], event["data"])
+            self._fan_out(message_id, event["organizer_id"], message)
+        return len(rows)
+
+    async def _run(self):
+        while True:
+            try:
+                delivered = await self.poll_once()
+            except Exception:
+                delivered = 0
+            # A full batch means more may be waiting
+            if delivered < EVENT_POLL_BATCH:
+                await asyncio.sleep(EVENT_POLL_INTERVAL)
+
+hub = EventHub(store=cache.shared)
+
+def hackathon_event(event_type: str, hackathon, changed_fields: Optional[List[str]] = None, previous_status: Optional[str] = None) -> Tuple[str, int, dict]:
+    """Build a compact hackathon change event with dashboard count deltas.
+
+    Returns ``(event_type, organizer_id, data)`` for ``hub.publish``; build it
+    before deleting a row and publish it after the commit.
+    """
+    deltas: Dict[str, int] = {}
+    if event_type == "hackathon.created":
+        deltas = {"total_hackathons": 1, f"status.{hackathon.status}": 1}
+    elif event_type == "hackathon.deleted":
+        deltas = {"total_hackathons": -1, f"status.{hackathon.status}": -1}
+    elif event_type == "hackathon.status_changed":
+        deltas = {f"status.{previous_status}": -1, f"status.{hackathon.status}": 1}
+
+    data = {
+        "hackathon_id": hackathon.id,
+        "organizer_id": hackathon.organizer_id,
+        "name": hackathon.name,
+        "status": hackathon.status,
+        "updated_at": hackathon.updated_at,
+    }
+    if changed_fields:
+        data["changed"] = changed_fields
+    if previous_status is not None:
+        data["previous_status"] = previous_status
+    if deltas:
+        data["deltas"] = deltas
+
+    return event_type, hackathon.organizer_id, data
+
+def counts_event(hackathon_id: int, organizer_id: int, deltas: Dict[str, int]) -> Tuple[str, int, dict]:
+    """Build a child count change event (participants, teams, submissions)"""
+    return (
+        "hackathon.counts_changed",
+        organizer_id,
+        {"hackathon_id": hackathon_id, "organizer_id": organizer_id, "deltas": deltas}
+    )
@@ -0,0 +1,146 @@
+import hashlib
+import os
+import re
+from typing import Optional, Tuple
+import anyio
+from fastapi import Request
+from fastapi.staticfiles import StaticFiles
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.responses import FileResponse, Response
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+# File names carrying a content hash, e.g. ``12.3f9a0c1d2e4b5a69.html``
+CONTENT_HASHED_FILE = re.compile(r"\.[0-9a-f]{8,64}\.[A-Za-z0-9]+$")
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "public, no-cache"
+# Paths whose responses are already-compressed files served with byte ranges
+UNCOMPRESSED_PATH_PREFIXES = ("/api/files/",)
+# Read size when a file has to be copied through Python
+FILE_READ_CHUNK_SIZE = 256 * 1024
+
+def weak_etag(*parts) -> str:
+    """Build a weak ETag from the values a response was derived from"""
+    digest = hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=12).hexdigest()
+    return f'W/"{digest}"'
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Weak comparison of an ETag against the request's If-None-Match header"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+class CompressionMiddleware(GZipMiddleware):
+    """GZip middleware that leaves Server-Sent Events streams and file downloads untouched.
+
+    Compressing an event stream buffers events inside the compressor, so
+    paths ending in ``/stream`` are passed through as-is. Downloads are
+    passed through too: a gzipped body would not match its Content-Range.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 500, compresslevel: int = 6):
+        super().__init__(app, minimum_size=minimum_size, compresslevel=compresslevel)
+        self._app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] == "http" and (
+            scope["path"].endswith("/stream") or scope["path"].startswith(UNCOMPRESSED_PATH_PREFIXES)
+        ):
+            await self._app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+class CachedStaticFiles(StaticFiles):
+    """Static files with cache headers: content-hashed names are immutable,
+    everything else is revalidated through the ETag StaticFiles already sends.
+    """
+
+    def file_response(self, full_path, stat_result: os.stat_result, scope: Scope, status_code: int = 200) -> Response:
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        if CONTENT_HASHED_FILE.search(os.path.basename(full_path)):
+            response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+        else:
+            response.headers["Cache-Control"] = REVALIDATE_CACHE_CONTROL
+        return response
+
+def parse_byte_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """Resolve a single ``Range: bytes=...`` header to an inclusive (start, end).
+
+    Returns None when the header is absent, malformed or asks for several
+    ranges (the whole file is sent then) and raises ValueError when the
+    range cannot be satisfied.
+    """
+    if not header or not header.startswith("bytes=") or "," in header:
+        return None
+    first, _, last = header[6:].strip().partition("-")
+    if not (first.isdigit() or first == "") or not (last.isdigit() or last == "") or first == last == "":
+        return None
+    if first == "":
+        # Suffix range: the last N bytes
+        length = int(last)
+        if length == 0 or size == 0:
+            raise ValueError("Unsatisfiable suffix range")
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = int(last) if last else size - 1
+    if last and end < start:
+        return None
+    if start >= size:
+        raise ValueError("Range starts past the end of the file")
+    return start, min(end, size - 1)
+
+class RangedFileResponse(FileResponse):
+    """File response for a whole file or one byte range of it.
+
+    Servers implementing the ASGI ``http.response.zerocopysend`` extension
+    get the open file descriptor and copy it with sendfile; otherwise the
+    range is read in chunks, so memory stays flat for any file size.
+    """
+
+    def __init__(self, path, size: int, byte_range: Optional[Tuple[int, int]] = None, **kwargs):
+        super().__init__(path, stat_result=None, **kwargs)
+        self.start, end = byte_range if byte_range is not None else (0, size - 1)
+        self.length = end - self.start + 1 if size else 0
+        self.headers["content-length"] = str(self.length)
+        self.headers["accept-ranges"] = "bytes"
+        if byte_range is not None:
+            self.status_code = 206
+            self.headers["content-range"] = f"bytes {self.start}-{end}/{size}"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+        if self.send_header_only or self.length == 0:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+        elif "http.response.zerocopysend" in scope.get("extensions", {}):
+            with open(self.path, "rb") as file:
+                await send({
+                    "type": "http.response.zerocopysend",
+                    "file": file.fileno(),
+                    "offset": self.start,
+                    "count": self.length,
+                    "more_body": False
+                })
+        else:
+            async with await anyio.open_file(self.path, mode="rb") as file:
+                await file.seek(self.start)
+                remaining = self.length
+                while remaining > 0:
+                    chunk = await file.read(min(FILE_READ_CHUNK_SIZE, remaining))
+                    if not chunk:
+                        break
+                    remaining -= len(chunk)
+                    await send({"type": "http.response.body", "body": chunk, "more_body": remaining > 0})
+                if remaining > 0:
+                    # File shrank underneath us; end the body rather than hang
+                    await send({"type": "http.response.body", "body": b"", "more_body": False})
+        if self.background is not None:
+            await self.background()
@@ -0,0 +1,191 @@
+"""
+iCalendar (RFC 5545) feeds of hackathon schedules and mentor sessions.
+
+Calendar apps poll subscriptions every few minutes, so a feed is rendered
+once per version of its inputs and kept in the cache under
+``calendar:<scope>:<version>``. The version is the latest ``updated_at`` and
+the row count (which catches deletions) of the hackathons and mentor
+sessions in the feed, read with a single aggregate query per request. A poll
+that finds nothing new is answered with 304 when the client sends the ETag
+back, or from the cache otherwise. Because the key changes with the data,
+writes need no explicit invalidation; superseded feeds simply expire.
+"""
+import hashlib
+import hmac
+import os
+from datetime import datetime
+from typing import List, Optional, Tuple
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from models.database import Hackathon, MentorSession
+from utils.auth import SECRET_KEY
+from utils.cache import cache
+from utils.http_cache import weak_etag
+
+# Seconds a rendered feed stays cached; a newer version is rendered on demand anyway
+CALENDAR_CACHE_TTL = 3600
+# Right-hand side of event UIDs; keep it stable so clients do not duplicate events
+CALENDAR_UID_DOMAIN = os.getenv("CALENDAR_UID_DOMAIN", "hackathon-platform")
+# How often clients are asked to refresh the subscription
+CALENDAR_REFRESH_INTERVAL = "PT1H"
+PRODUCT_ID = "-//Hackathon Platform//Calendar Feeds//EN"
+# Content lines longer than this many octets are folded
+MAX_LINE_OCTETS = 75
+
+def feed_token(user_id: int) -> str:
+    """Secret that authorizes the organizer feed of a user in the subscription URL"""
+    message = f"calendar-feed:{user_id}".encode("utf-8")
+    return hmac.new(SECRET_KEY.encode("utf-8"), message, hashlib.sha256).hexdigest()[:32]
+
+def feed_token_matches(user_id: int, token: str) -> bool:
+    return hmac.compare_digest(feed_token(user_id), token)
+
+# Only what the feed shows is loaded, not whole rows with rules and notes of every hackathon
+HACKATHON_FEED_COLUMNS = (
+    Hackathon.id, Hackathon.name, Hackathon.description, Hackathon.location,
+    Hackathon.start_date, Hackathon.end_date, Hackathon.created_at, Hackathon.updated_at,
+    Hackathon.application_start_date, Hackathon.application_end_date,
+    Hackathon.application_open, Hackathon.application_close
+)
+SESSION_FEED_COLUMNS = (
+    MentorSession.id, MentorSession.hackathon_id, MentorSession.mentor_name, MentorSession.session_topic,
+    MentorSession.session_date, MentorSession.duration_minutes, MentorSession.meeting_link,
+    MentorSession.notes, MentorSession.updated_at
+)
+
+def _escape(value) -> str:
+    text = str(value)
+    for char, escaped in (("\\", "\\\\"), (";", "\\;"), (",", "\\,"), ("\r\n", "\\n"), ("\n", "\\n"), ("\r", "\\n")):
+        text = text.replace(char, escaped)
+    return text
+
+def _fold(line: str) -> str:
+    """Split a content line into 75-octet pieces without breaking a UTF-8 character"""
+    encoded = line.encode("utf-8")
+    if len(encoded) <= MAX_LINE_OCTETS:
+        return line
+    pieces = []
+    start = 0
+    limit = MAX_LINE_OCTETS
+    while start < len(encoded):
+        end = min(start + limit, len(encoded))
+        while end < len(encoded) and (encoded[end] & 0xC0) == 0x80:
+            end -= 1
+        pieces.append(encoded[start:end].decode("utf-8"))
+        start = end
+        # Continuation lines start with a space, which counts towards the limit
+        limit = MAX_LINE_OCTETS - 1
+    return "\r\n ".join(pieces)
+
+def _timestamp(value: datetime) -> str:
+    # Stored datetimes are naive UTC
+    return value.strftime("%Y%m%dT%H%M%SZ")
+
+def _event(lines: List[str], uid: str, stamp: Optional[datetime], start: datetime, summary: str,
+           end: Optional[datetime] = None, duration_minutes: Optional[int] = None,
+           description: Optional[str] = None, location: Optional[str] = None, url: Optional[str] = None):
+    lines.append("BEGIN:VEVENT")
+    lines.append(f"UID:{uid}@{CALENDAR_UID_DOMAIN}")
+    # DTSTAMP comes from the data rather than the clock so a version always renders the same bytes
+    lines.append(f"DTSTAMP:{_timestamp(stamp or start)}")
+    lines.append(f"DTSTART:{_timestamp(start)}")
+    if end is not None and end > start:
+        lines.append(f"DTEND:{_timestamp(end)}")
+    elif duration_minutes:
+        lines.append(f"DURATION:PT{duration_minutes}M")
+    lines.append(f"SUMMARY:{_escape(summary)}")
+    if description:
+        lines.append(f"DESCRIPTION:{_escape(description)}")
+    if location:
+        lines.append(f"LOCATION:{_escape(location)}")
+    if url:
+        lines.append(f"URL:{url}")
+    lines.append("END:VEVENT")
+
+def _scope_version(db: Session, hackathon_filter) -> Tuple:
+    """Row counts and latest updates of the hackathons and mentor sessions in a feed"""
+    hackathon_ids = select(Hackathon.id).where(hackathon_filter).scalar_subquery()
+    session_count = select(func.count(MentorSession.id)).where(
+        MentorSession.hackathon_id.in_(hackathon_ids)
+    ).scalar_subquery()
+    session_updated = select(func.max(MentorSession.updated_at)).where(
+        MentorSession.hackathon_id.in_(hackathon_ids)
+    ).scalar_subquery()
+    return tuple(
+        db.query(
+            func.count(Hackathon.id), func.max(Hackathon.updated_at), session_count, session_updated
+        ).filter(hackathon_filter).one()
+    )
+
+def render_calendar(db: Session, hackathon_filter, calendar_name: Optional[str] = None, include_private: bool = False) -> str:
+    """iCalendar text for the hackathons matching ``hackathon_filter`` and their mentor sessions.
+
+    Without ``calendar_name`` the calendar is named after its first hackathon.
+    Meeting links are only included in private (token-authorized) feeds.
+    """
+    hackathons = (
+        db.query(*HACKATHON_FEED_COLUMNS)
+        .filter(hackathon_filter)
+        .order_by(Hackathon.start_date, Hackathon.id)
+        .all()
+    )
+    names = {hackathon.id: hackathon.name for hackathon in hackathons}
+    sessions = (
+        db.query(*SESSION_FEED_COLUMNS)
+        .filter(MentorSession.hackathon_id.in_(list(names)))
+        .order_by(MentorSession.session_date, MentorSession.id)
+        .all()
+    ) if names else []
+
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:{PRODUCT_ID}",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+        f"X-WR-CALNAME:{_escape(calendar_name or (hackathons[0].name if hackathons else 'Hackathons'))}",
+        f"REFRESH-INTERVAL;VALUE=DURATION:{CALENDAR_REFRESH_INTERVAL}",
+        f"X-PUBLISHED-TTL:{CALENDAR_REFRESH_INTERVAL}",
+    ]
+    for hackathon in hackathons:
+        stamp = hackathon.updated_at or hackathon.created_at
+        if hackathon.start_date:
+            _event(
+                lines, f"hackathon-{hackathon.id}", stamp, hackathon.start_date, hackathon.name,
+                end=hackathon.end_date, description=hackathon.description, location=hackathon.location
+            )
+        # The new window columns are optional; fall back to the legacy ones
+        opens_at = hackathon.application_start_date or hackathon.application_open
+        closes_at = hackathon.application_end_date or hackathon.application_close
+        if opens_at:
+            _event(
+                lines, f"hackathon-{hackathon.id}-applications", stamp, opens_at,
+                f"{hackathon.name}: applications open", end=closes_at
+            )
+    for session in sessions:
+        description = session.notes
+        if include_private and session.meeting_link:
+            description = f"{description}\n\n{session.meeting_link}" if description else session.meeting_link
+        _event(
+            lines, f"mentor-session-{session.id}", session.updated_at, session.session_date,
+            f"{names[session.hackathon_id]}: {session.session_topic} with {session.mentor_name}",
+            duration_minutes=session.duration_minutes or 60, description=description,
+            url=session.meeting_link if include_private else None
+        )
+    lines.append("END:VCALENDAR")
+    return "".join(_fold(line) + "\r\n" for line in lines)
+
+def feed_etag(db: Session, scope: str, hackathon_filter, include_private: bool = False) -> Tuple[str, int]:
+    """ETag of the current version of a feed and the number of hackathons in it"""
+    version = _scope_version(db, hackathon_filter)
+    return weak_etag("calendar", scope, include_private, *version), version[0]
+
+def feed_body(db: Session, scope: str, etag: str, hackathon_filter, calendar_name: Optional[str] = None,
+              include_private: bool = False) -> str:
+    """Feed text for the version named by ``etag``, rendered at most once per version"""
+    cache_key = f"calendar:{scope}:{etag}"
+    body = cache.get(cache_key)
+    if body is None:
+        body = render_calendar(db, hackathon_filter, calendar_name, include_private)
+        cache.set(cache_key, body, CALENDAR_CACHE_TTL)
+    return body
@@ -0,0 +1,207 @@
+"""
+``Idempotency-Key`` support for create endpoints.
+
+A retried request carrying the same key (from the same caller, to the same
+route) gets the stored response replayed instead of running the handler
+again; a duplicate arriving while the first is still running waits for it.
+Reusing a key with a different body is rejected with 422. Requests without
+the header, or to other routes, pass straight through with no lookup.
+
+The caller is the ``Authorization`` header, or the client address for
+anonymous routes such as registration. Records live in the shared cache tier
+for ``IDEMPOTENCY_TTL_SECONDS``, so a retry is recognised by whichever worker
+receives it. Without a shared tier (``CACHE_BACKEND=memory``) they are kept in
+a bounded map of this process.
+"""
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import re
+import time
+import uuid
+from typing import List, Optional, Pattern, Tuple
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from utils.cache import LRUCache, SharedStore, cache
+from utils.rate_limit import client_address
+
+IDEMPOTENCY_TTL_SECONDS = float(os.getenv("IDEMPOTENCY_TTL_SECONDS", "86400"))
+IDEMPOTENCY_MAX_KEYS = int(os.getenv("IDEMPOTENCY_MAX_KEYS", "10000"))
+# A running request holds its key this long; if its worker dies, a retry may run again afterwards
+IDEMPOTENCY_LEASE_SECONDS = float(os.getenv("IDEMPOTENCY_LEASE_SECONDS", "60"))
+# How often a duplicate checks whether the first request has finished
+IDEMPOTENCY_POLL_INTERVAL = 0.05
+MAX_KEY_LENGTH = 255
+
+# (method, path pattern) of the endpoints that honour the header
+IDEMPOTENT_ROUTES: List[Tuple[str, Pattern]] = [
+    ("POST", re.compile(r"^/api/hackathons/?$")),
+    ("POST", re.compile(r"^/api/auth/register/?$")),
+    ("POST", re.compile(r"^/api/hackathons/\d+/apply/?$")),
+]
+
+class IdempotencyStore:
+    """Records of key -> fingerprint and, once finished, the stored response.
+
+    A record is a dict with ``fingerprint``, ``owner`` (the reservation that
+    wrote it) and, when done, ``status``, ``headers`` and ``body``.
+    """
+
+    def __init__(self, shared: Optional[SharedStore] = None, ttl: float = IDEMPOTENCY_TTL_SECONDS,
+                 max_keys: int = IDEMPOTENCY_MAX_KEYS):
+        self.shared = shared
+        self.ttl = ttl
+        self._local = LRUCache(max_keys)
+
+    def get(self, key: str) -> Optional[dict]:
+        if self.shared is None:
+            return self._local.get(key)[1]
+        row = self.shared.get(key)
+        return json.loads(row[0]) if row is not None else None
+
+    def reserve(self, key: str, fingerprint: str) -> Optional[str]:
+        """Claim a key for a new request; returns the reservation, or None if the key is taken"""
+        owner = uuid.uuid4().hex
+        record = {"fingerprint": fingerprint, "owner": owner}
+        expires_at = time.time() + IDEMPOTENCY_LEASE_SECONDS
+        if self.shared is None:
+            # Single event loop: nothing runs between the check and the set
+            if self._local.get(key)[0]:
+                return None
+            self._local.set(key, record, expires_at)
+            return owner
+        return owner if self.shared.add(key, json.dumps(record), expires_at) else None
+
+    def complete(self, key: str, owner: str, status: int, headers: List[Tuple[bytes, bytes]], body: bytes):
+        record = self.get(key)
+        if record is None or record["owner"] != owner:
+            return
+        record.update(
+            status=status,
+            headers=[[name.decode("latin-1"), value.decode("latin-1")] for name, value in headers],
+            body=base64.b64encode(body).decode("ascii")
+        )
+        expires_at = time.time() + self.ttl
+        if self.shared is None:
+            self._local.set(key, record, expires_at)
+        else:
+            self.shared.set(key, json.dumps(record), expires_at)
+
+    def discard(self, key: str, owner: str):
+        record = self.get(key)
+        if record is None or record["owner"] != owner:
+            return
+        if self.shared is None:
+            self._local.delete(key)
+        else:
+            self.shared.invalidate(key)
+
+idempotency_store = IdempotencyStore(cache.shared)
+
+def _is_idempotent_route(method: str, path: str) -> bool:
+    return any(method == route_method and pattern.match(path) for route_method, pattern in IDEMPOTENT_ROUTES)
+
+async def _send_json(send: Send, status_code: int, detail: str):
+    body = json.dumps({"detail": detail}).encode("utf-8")
+    await send({
+        "type": "http.response.start",
+        "status": status_code,
+        "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())]
+    })
+    await send({"type": "http.response.body", "body": body})
+
+class IdempotencyMiddleware:
+    """Replay stored responses for repeated ``Idempotency-Key`` requests"""
+
+    def __init__(self, app: ASGIApp, store: IdempotencyStore = idempotency_store):
+        self.app = app
+        self.store = store
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or not _is_idempotent_route(scope["method"], scope["path"]):
+            await self.app(scope, receive, send)
+            return
+        headers = dict(scope["headers"])
+        raw_key = headers.get(b"idempotency-key")
+        if raw_key is None:
+            await self.app(scope, receive, send)
+            return
+        
+        if not raw_key.strip() or len(raw_key) > MAX_KEY_LENGTH:
+            await _send_json(send, 400, f"Idempotency-Key must be 1 to {MAX_KEY_LENGTH} characters")
+            return
+        
+        # The whole body is needed for the fingerprint; create payloads are small
+        chunks = []
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                break
+        body = b"".join(chunks)
+        
+        # Keys are scoped to the caller and route so clients cannot collide;
+        # anonymous callers are told apart by their address
+        caller = headers.get(b"authorization") or f"client:{client_address(Request(scope))}".encode("utf-8")
+        scoped_key = b"\0".join([caller, scope["method"].encode(), scope["path"].encode("utf-8"), raw_key])
+        key = "idempotency:" + hashlib.sha256(scoped_key).hexdigest()
+        fingerprint = hashlib.sha256(body).hexdigest()
+        
+        while True:
+            record = self.store.get(key)
+            if record is None:
+                owner = self.store.reserve(key, fingerprint)
+                if owner is not None:
+                    break
+                # Another request claimed the key in between
+                continue
+            if record["fingerprint"] != fingerprint:
+                await _send_json(send, 422, "Idempotency-Key was already used with a different request")
+                return
+            if "status" not in record:
+                # Concurrent duplicate, possibly on another worker: wait for the first request to finish
+                await asyncio.sleep(IDEMPOTENCY_POLL_INTERVAL)
+                continue
+            await send({
+                "type": "http.response.start",
+                "status": record["status"],
+                "headers": [
+                    (name.encode("latin-1"), value.encode("latin-1")) for name, value in record["headers"]
+                ] + [(b"idempotent-replayed", b"true")]
+            })
+            await send({"type": "http.response.body", "body": base64.b64decode(record["body"])})
+            return
+        
+        body_sent = False
+        response_status: Optional[int] = None
+        response_headers: List[Tuple[bytes, bytes]] = []
+        response_body = []
+        
+        async def replay_receive() -> Message:
+            nonlocal body_sent
+            if not body_sent:
+                body_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+        
+        async def capture_send(message: Message):
+            nonlocal response_status, response_headers
+            if message["type"] == "http.response.start":
+                response_status = message["status"]
+                response_headers = list(message.get("headers", []))
+            elif message["type"] == "http.response.body":
+                response_body.append(message.get("body", b""))
+            await send(message)
+        
+        try:
+            await self.app(scope, replay_receive, capture_send)
+        finally:
+            # Server errors are not remembered, so the client can retry them
+            if response_status is None or response_status >= 500:
+                self.store.discard(key, owner)
+            else:
+                self.store.complete(key, owner, response_status, response_headers, b"".join(response_body))
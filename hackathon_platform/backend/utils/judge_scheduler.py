@@ -0,0 +1,77 @@
+import heapq
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+class SchedulingError(ValueError):
+    """Raised when submissions cannot be covered with the requested reviews"""
+
+def schedule_reviews(
+    submission_ids: Iterable[int],
+    judge_ids: Iterable[int],
+    reviews_per_submission: int,
+    conflicts: Optional[Dict[int, Set[int]]] = None,
+    capacities: Optional[Dict[int, Optional[int]]] = None,
+    existing_load: Optional[Dict[int, int]] = None,
+) -> List[Tuple[int, int]]:
+    """Assign each submission to ``reviews_per_submission`` distinct judges.
+
+    Judges live in a min-heap keyed by current load, so every submission goes
+    to the least-loaded eligible judges and loads never differ by more than
+    one unless conflicts or capacities force it. Submissions with the fewest
+    eligible judges are placed first so they are not starved by the others.
+    Runs in O(N * R * log M) plus the size of the conflict sets.
+
+    Returns a list of ``(judge_id, submission_id)`` pairs.
+    """
+    conflicts = conflicts or {}
+    capacities = capacities or {}
+    existing_load = existing_load or {}
+    judges = list(dict.fromkeys(judge_ids))
+    submissions = list(dict.fromkeys(submission_ids))
+
+    if not submissions:
+        return []
+    if reviews_per_submission < 1:
+        raise SchedulingError("reviews_per_submission must be at least 1")
+    if reviews_per_submission > len(judges):
+        raise SchedulingError(
+            f"Need at least {reviews_per_submission} judges, only {len(judges)} available"
+        )
+
+    judge_set = set(judges)
+    submissions.sort(key=lambda s: -len(judge_set.intersection(conflicts.get(s, ()))))
+
+    # Heap entries: (load, position, judge_id); position keeps ordering stable
+    heap = [
+        (existing_load.get(j, 0), position, j)
+        for position, j in enumerate(judges)
+        if capacities.get(j) is None or existing_load.get(j, 0) < capacities[j]
+    ]
+    heapq.heapify(heap)
+
+    assignments: List[Tuple[int, int]] = []
+    for submission_id in submissions:
+        excluded = conflicts.get(submission_id, set())
+        chosen = []
+        skipped = []
+        while heap and len(chosen) < reviews_per_submission:
+            entry = heapq.heappop(heap)
+            if entry[2] in excluded:
+                skipped.append(entry)
+            else:
+                chosen.append(entry)
+
+        if len(chosen) < reviews_per_submission:
+            raise SchedulingError(
+                f"Submission {submission_id} has only {len(chosen)} eligible judges "
+                f"with remaining capacity"
+            )
+
+        for load, position, judge_id in chosen:
+            assignments.append((judge_id, submission_id))
+            capacity = capacities.get(judge_id)
+            if capacity is None or load + 1 < capacity:
+                heapq.heappush(heap, (load + 1, position, judge_id))
+        for entry in skipped:
+            heapq.heappush(heap, entry)
+
+    return assignments
@@ -0,0 +1,206 @@
+"""
+Pre-rendered landing pages.
+
+Every hackathon gets its landing payload written to ``static/landing`` as
+content-hashed files that never change, plus stable entry points:
+
+    landing/{id}.{hash}.json   landing/{id}.{hash}.html   (immutable, cached for a year)
+    landing/{id}.json          landing/{id}.html          (revalidated, always current)
+    landing/{id}.manifest.json                            (names of the current hashed files)
+
+Files are rewritten only when the payload (or the template) changes, so
+public landing traffic is plain static file serving; in production a proxy
+or CDN in front of ``static/`` can serve it without reaching the app at all.
+"""
+import hashlib
+import html
+import json
+import os
+import re
+import tempfile
+from typing import Optional
+from models.database import Hackathon
+from models.schemas import is_web_url
+
+STATIC_DIR = os.getenv("STATIC_DIR", "static")
+LANDING_DIR = os.path.join(STATIC_DIR, "landing")
+# Bump when the HTML template changes so every page is re-rendered
+TEMPLATE_VERSION = "2"
+
+HASHED_NAME = re.compile(r"^(\d+)\.([0-9a-f]{16})\.(json|html)$")
+
+def landing_payload(hackathon: Hackathon) -> dict:
+    """Public landing page data of a hackathon"""
+    return {
+        "id": hackathon.id,
+        "name": hackathon.name,
+        "description": hackathon.description,
+        "type": hackathon.type,
+        "theme_focus_area": hackathon.theme,
+        "location": hackathon.location,
+        "start_date": hackathon.start_date.isoformat() if hackathon.start_date else None,
+        "end_date": hackathon.end_date.isoformat() if hackathon.end_date else None,
+        "application_start_date": hackathon.application_start_date.isoformat() if hackathon.application_start_date else None,
+        "application_end_date": hackathon.application_end_date.isoformat() if hackathon.application_end_date else None,
+        "prize_pool_details": hackathon.prize_pool,
+        "rules": hackathon.rules,
+        "min_team_size": hackathon.min_team_size,
+        "max_team_size": hackathon.max_team_size,
+        "landing_page_type": hackathon.landing_page_type or "template",
+        "custom_landing_url": hackathon.custom_landing_url,
+        "landing_color_scheme": hackathon.landing_color_scheme or "#1976d2",
+        "landing_logo_url": hackathon.landing_logo_url,
+        "has_sponsors": hackathon.has_sponsors or False,
+        "sponsors_data": [
+            {
+                "name": sponsor.name,
+                "tier": sponsor.tier,
+                "logo_url": sponsor.logo_url,
+                "banner_url": sponsor.banner_url,
+                "website": sponsor.website,
+                "description": sponsor.description,
+            }
+            for sponsor in hackathon.sponsor_list
+        ],
+    }
+
+def _date(value: Optional[str]) -> str:
+    return value[:10] if value else "TBA"
+
+def _color(value: str) -> str:
+    # Only plain hex colors reach the stylesheet
+    return value if re.fullmatch(r"#[0-9a-fA-F]{3,8}", value or "") else "#1976d2"
+
+def render_landing_html(data: dict) -> str:
+    """Template landing page for a payload; every value is escaped and only http(s) links are kept"""
+    e = lambda value: html.escape(str(value)) if value is not None else ""
+    # Rows stored before URLs were validated may still hold other schemes
+    link = lambda value: value if value and is_web_url(value) else None
+    
+    if data["landing_page_type"] == "custom" and link(data["custom_landing_url"]):
+        url = e(data["custom_landing_url"])
+        return (
+            f'<!DOCTYPE html><html><head><meta charset="utf-8"><title>{e(data["name"])}</title>'
+            f'<meta http-equiv="refresh" content="0; url={url}"></head>'
+            f'<body><a href="{url}">{e(data["name"])}</a></body></html>'
+        )
+    
+    logo = f'<img class="logo" src="{e(data["landing_logo_url"])}" alt="">' if link(data["landing_logo_url"]) else ""
+    sponsors = ""
+    if data["has_sponsors"] and data["sponsors_data"]:
+        items = "".join(
+            '<li class="sponsor">'
+            + (f'<img src="{e(sponsor["logo_url"])}" alt="">' if link(sponsor["logo_url"]) else "")
+            + (f'<a href="{e(sponsor["website"])}">{e(sponsor["name"])}</a>' if link(sponsor["website"]) else e(sponsor["name"]))
+            + (f' <small>{e(sponsor["tier"])}</small>' if sponsor["tier"] else "")
+            + "</li>"
+            for sponsor in data["sponsors_data"]
+        )
+        sponsors = f'<section><h2>Sponsors</h2><ul class="sponsors">{items}</ul></section>'
+    
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{e(data["name"])}</title>
+<meta name="description" content="{e((data["description"] or "")[:160])}">
+<style>
+body{{margin:0;font-family:system-ui,sans-serif;color:#222;line-height:1.5}}
+header{{background:{_color(data["landing_color_scheme"])};color:#fff;padding:48px 24px;text-align:center}}
+.logo{{max-height:96px;margin-bottom:16px}}
+main{{max-width:880px;margin:0 auto;padding:24px}}
+.facts{{display:flex;flex-wrap:wrap;gap:24px;padding:0;list-style:none}}
+.sponsors{{display:flex;flex-wrap:wrap;gap:16px;padding:0;list-style:none}}
+.sponsor img{{max-height:48px;display:block}}
+.rules{{white-space:pre-line}}
+</style>
+</head>
+<body>
+<header>{logo}<h1>{e(data["name"])}</h1><p>{e(data["theme_focus_area"])}</p></header>
+<main>
+<ul class="facts">
+<li><strong>Dates:</strong> {_date(data["start_date"])} &ndash; {_date(data["end_date"])}</li>
+<li><strong>Format:</strong> {e(data["type"] or "TBA")}{(" &middot; " + e(data["location"])) if data["location"] else ""}</li>
+<li><strong>Applications:</strong> {_date(data["application_start_date"])} &ndash; {_date(data["application_end_date"])}</li>
+<li><strong>Teams:</strong> {e(data["min_team_size"])}&ndash;{e(data["max_team_size"])} people</li>
+</ul>
+<section><h2>About</h2><p>{e(data["description"])}</p></section>
+<section><h2>Prizes</h2><p>{e(data["prize_pool_details"])}</p></section>
+<section><h2>Rules</h2><p class="rules">{e(data["rules"])}</p></section>
+{sponsors}
+</main>
+</body>
+</html>
+"""
+
+def _write_atomic(path: str, content: bytes):
+    directory = os.path.dirname(path)
+    descriptor, temporary = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(descriptor, "wb") as handle:
+            handle.write(content)
+        os.chmod(temporary, 0o644)
+        os.replace(temporary, path)
+    except Exception:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+
+def _manifest_path(hackathon_id: int) -> str:
+    return os.path.join(LANDING_DIR, f"{hackathon_id}.manifest.json")
+
+def _remove_hashed(hackathon_id: int, keep: tuple = ()):
+    for name in os.listdir(LANDING_DIR):
+        match = HASHED_NAME.match(name)
+        if match and int(match.group(1)) == hackathon_id and match.group(2) not in keep:
+            os.remove(os.path.join(LANDING_DIR, name))
+
+def prerender_landing(hackathon: Hackathon) -> bool:
+    """Write the landing files of a hackathon; returns False when they were already current"""
+    os.makedirs(LANDING_DIR, exist_ok=True)
+    data = landing_payload(hackathon)
+    payload = json.dumps(data, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    digest = hashlib.sha256(payload + TEMPLATE_VERSION.encode("utf-8")).hexdigest()[:16]
+    
+    manifest_path = _manifest_path(hackathon.id)
+    previous = None
+    try:
+        with open(manifest_path, "rb") as handle:
+            previous = json.load(handle).get("hash")
+    except (OSError, ValueError):
+        pass
+    if previous == digest:
+        return False
+    
+    page = render_landing_html(data).encode("utf-8")
+    # Immutable files first, then the entry points that reference them
+    _write_atomic(os.path.join(LANDING_DIR, f"{hackathon.id}.{digest}.json"), payload)
+    _write_atomic(os.path.join(LANDING_DIR, f"{hackathon.id}.{digest}.html"), page)
+    _write_atomic(os.path.join(LANDING_DIR, f"{hackathon.id}.json"), payload)
+    _write_atomic(os.path.join(LANDING_DIR, f"{hackathon.id}.html"), page)
+    _write_atomic(manifest_path, json.dumps({
+        "hash": digest,
+        "json": f"{hackathon.id}.{digest}.json",
+        "html": f"{hackathon.id}.{digest}.html",
+    }).encode("utf-8"))
+    # The previous version stays for clients that read the old manifest a moment ago
+    _remove_hashed(hackathon.id, keep=(digest, previous))
+    return True
+
+def refresh_landing(hackathon: Hackathon) -> bool:
+    """Best-effort prerender after a committed write; prerender_landing_pages.py repairs misses"""
+    try:
+        return prerender_landing(hackathon)
+    except OSError:
+        return False
+
+def remove_landing(hackathon_id: int):
+    """Delete every landing file of a hackathon"""
+    if not os.path.isdir(LANDING_DIR):
+        return
+    _remove_hashed(hackathon_id)
+    for name in (f"{hackathon_id}.json", f"{hackathon_id}.html", f"{hackathon_id}.manifest.json"):
+        path = os.path.join(LANDING_DIR, name)
+        if os.path.exists(path):
+            os.remove(path)
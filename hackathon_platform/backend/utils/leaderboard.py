@@ -0,0 +1,206 @@
+"""
+In-memory leaderboards, one per hackathon, kept by every worker.
+
+A worker updates its own board when it records a score and publishes a new
+version of the board in the shared cache. Other workers compare their
+board's version with the shared one before serving a read and rebuild from
+the database when it changed, so ranks are never stale for longer than
+CACHE_INVALIDATION_INTERVAL.
+"""
+import asyncio
+import threading
+import uuid
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional, Set, Tuple
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from models.database import Submission, Team
+from utils.cache import cache
+
+# Maximum number of pending change events kept per subscriber
+SUBSCRIBER_QUEUE_SIZE = 100
+# Board versions outlive any scoring session; on expiry every worker rebuilds once
+LEADERBOARD_VERSION_TTL = 24 * 3600
+
+class Leaderboard:
+    """Ordered in-memory ranking of teams by their best submission score.
+
+    Teams are kept in a sorted list of ``(-score, team_id)`` keys so top-K is a
+    slice and rank lookups are a binary search. Ties share a rank using
+    competition ranking (1, 2, 2, 4).
+    """
+
+    def __init__(self, hackathon_id: int):
+        self.hackathon_id = hackathon_id
+        self._keys: List[Tuple[float, int]] = []
+        self._scores: Dict[int, float] = {}
+        self._team_names: Dict[int, str] = {}
+        self._subscribers: Set[asyncio.Queue] = set()
+        # Shared version this board was built from; None until loaded or once stale
+        self.version: Optional[str] = None
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _rank_of_score(self, score: float) -> int:
+        # Number of teams with a strictly higher score, plus one
+        return bisect_left(self._keys, (-score,)) + 1
+
+    def _entry(self, team_id: int) -> dict:
+        score = self._scores[team_id]
+        return {
+            "rank": self._rank_of_score(score),
+            "team_id": team_id,
+            "team_name": self._team_names.get(team_id, ""),
+            "score": score,
+        }
+
+    def load(self, rows: List[Tuple[int, str, float]], version: Optional[str] = None):
+        """Replace the whole ranking with ``(team_id, team_name, score)`` rows.
+
+        Subscribers of a board that was already loaded get a reset event,
+        since the changes in between were made by another worker.
+        """
+        with self._lock:
+            reloaded = self._loaded
+            self._scores = {team_id: float(score) for team_id, _, score in rows}
+            self._team_names = {team_id: name for team_id, name, _ in rows}
+            self._keys = sorted((-score, team_id) for team_id, score in self._scores.items())
+            self.version = version
+            self._loaded = True
+        if reloaded:
+            self._publish({"type": "reset", "hackathon_id": self.hackathon_id})
+
+    def update(self, team_id: int, score: Optional[float], team_name: Optional[str] = None) -> Optional[dict]:
+        """Set a team's score (``None`` removes it) and return the change event"""
+        with self._lock:
+            previous = self._scores.get(team_id)
+            previous_rank = self._rank_of_score(previous) if previous is not None else None
+            if previous is not None:
+                index = bisect_left(self._keys, (-previous, team_id))
+                del self._keys[index]
+                del self._scores[team_id]
+            if team_name is not None:
+                self._team_names[team_id] = team_name
+
+            if score is None:
+                self._team_names.pop(team_id, None)
+                event = {"type": "removed", "team_id": team_id, "previous_rank": previous_rank}
+            else:
+                score = float(score)
+                self._scores[team_id] = score
+                insort(self._keys, (-score, team_id))
+                if score == previous:
+                    return None
+                event = {"type": "score", **self._entry(team_id), "previous_rank": previous_rank}
+
+        event["hackathon_id"] = self.hackathon_id
+        self._publish(event)
+        return event
+
+    def top(self, k: int) -> List[dict]:
+        """Return the first ``k`` entries; ties on the cut-off are all included"""
+        with self._lock:
+            if k <= 0 or not self._keys:
+                return []
+            end = min(k, len(self._keys))
+            if end < len(self._keys):
+                # Extend the slice so teams tied with the last one are not split
+                end = bisect_left(self._keys, (self._keys[end - 1][0], float("inf")))
+            return [self._entry(team_id) for _, team_id in self._keys[:end]]
+
+    def rank_of(self, team_id: int) -> Optional[dict]:
+        """Return the entry for a team, or ``None`` if it has no score yet"""
+        with self._lock:
+            if team_id not in self._scores:
+                return None
+            return self._entry(team_id)
+
+    def subscribe(self) -> asyncio.Queue:
+        """Register a subscriber queue that receives change events"""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        self._subscribers.discard(queue)
+
+    def _publish(self, event: dict):
+        for queue in list(self._subscribers):
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                # Too far behind: replace the backlog with a reset so the client refetches the top-K
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait({"type": "reset", "hackathon_id": self.hackathon_id})
+
+# Loaded leaderboards per hackathon id
+_leaderboards: Dict[int, Leaderboard] = {}
+_registry_lock = threading.Lock()
+
+def _version_key(hackathon_id: int) -> str:
+    return f"leaderboard_version:{hackathon_id}"
+
+def leaderboard_version(hackathon_id: int) -> Optional[str]:
+    """Current shared version of a hackathon leaderboard"""
+    return cache.get(_version_key(hackathon_id))
+
+def _announce_version(hackathon_id: int) -> str:
+    version = uuid.uuid4().hex
+    cache.invalidate(_version_key(hackathon_id))
+    cache.set(_version_key(hackathon_id), version, LEADERBOARD_VERSION_TTL)
+    return version
+
+def _best_scores_query(db: Session, hackathon_id: int):
+    return (
+        db.query(Submission.team_id, Team.name, func.max(Submission.score))
+        .join(Team, Team.id == Submission.team_id)
+        .filter(Submission.hackathon_id == hackathon_id, Submission.score.isnot(None))
+        .group_by(Submission.team_id, Team.name)
+    )
+
+def rebuild_leaderboard(db: Session, hackathon_id: int) -> Leaderboard:
+    """(Re)build a hackathon leaderboard from the database"""
+    with _registry_lock:
+        board = _leaderboards.get(hackathon_id)
+        if board is None:
+            board = Leaderboard(hackathon_id)
+            _leaderboards[hackathon_id] = board
+    # Read the version first: a score written during the rebuild moves it on again
+    version = leaderboard_version(hackathon_id) or _announce_version(hackathon_id)
+    board.load(_best_scores_query(db, hackathon_id).all(), version)
+    return board
+
+def get_leaderboard(db: Session, hackathon_id: int) -> Leaderboard:
+    """Return the leaderboard for a hackathon, rebuilding it if another worker changed it"""
+    board = _leaderboards.get(hackathon_id)
+    if board is None or board.version is None or board.version != leaderboard_version(hackathon_id):
+        board = rebuild_leaderboard(db, hackathon_id)
+    return board
+
+def record_team_score(db: Session, hackathon_id: int, team_id: int) -> Optional[dict]:
+    """Refresh one team's entry after one of its submission scores was written"""
+    board = _leaderboards.get(hackathon_id)
+    current = board is not None and board.version is not None and board.version == leaderboard_version(hackathon_id)
+    version = _announce_version(hackathon_id)
+    if board is None:
+        # Not loaded here; the first read will build it with the new score
+        return None
+    row = _best_scores_query(db, hackathon_id).filter(Submission.team_id == team_id).first()
+    if row is None:
+        event = board.update(team_id, None)
+    else:
+        _, team_name, score = row
+        event = board.update(team_id, score, team_name)
+    # A board that missed another worker's change is rebuilt on the next read
+    board.version = version if current else None
+    return event
+
+def discard_leaderboard(hackathon_id: int):
+    """Forget a hackathon leaderboard (e.g. after the hackathon is deleted) in every worker"""
+    with _registry_lock:
+        _leaderboards.pop(hackathon_id, None)
+    cache.invalidate(_version_key(hackathon_id))
@@ -0,0 +1,77 @@
+from typing import List
+from sqlalchemy import insert, literal, select
+from sqlalchemy.orm import Session
+from models.database import Hackathon, Participant, OutboxMessage
+
+# Hackathon fields whose change is worth an email to participants
+NOTIFY_FIELDS = {
+    "start_date": "Start date",
+    "end_date": "End date",
+    "location": "Location",
+    "type": "Format",
+    "status": "Status",
+    "application_start_date": "Applications open",
+    "application_end_date": "Applications close",
+    "rules": "Rules",
+}
+
+# Participants who still get updates about a hackathon
+NOTIFIED_PARTICIPANT_STATUSES = ("applied", "approved")
+
+def notify_participant_status(db: Session, participant: Participant, hackathon: Hackathon):
+    """Queue the decision email for a participant (caller commits)"""
+    if participant.status == "approved":
+        subject = f"You're in: {hackathon.name}"
+        body = (
+            f"Hi {participant.name},\n\n"
+            f"Your application to {hackathon.name} has been approved. "
+            f"The event starts on {hackathon.start_date:%B %d, %Y}.\n\nSee you there!"
+        )
+    else:
+        subject = f"Your application to {hackathon.name}"
+        body = (
+            f"Hi {participant.name},\n\n"
+            f"Thank you for applying to {hackathon.name}. Unfortunately we are not able "
+            f"to offer you a place this time.\n\nWe hope to see you at a future event."
+        )
+    
+    db.add(OutboxMessage(
+        kind="participant.status_changed",
+        recipient=participant.email,
+        subject=subject,
+        body=body,
+        hackathon_id=hackathon.id
+    ))
+
+def notify_hackathon_update(db: Session, hackathon: Hackathon, changed_fields: List[str]) -> bool:
+    """Queue an update email for every active participant with one INSERT ... SELECT (caller commits)"""
+    changes = [NOTIFY_FIELDS[field] for field in changed_fields if field in NOTIFY_FIELDS]
+    if not changes:
+        return False
+    
+    subject = f"Update: {hackathon.name}"
+    body = (
+        f"There are changes to {hackathon.name}: {', '.join(changes)}.\n\n"
+        f"The event runs from {hackathon.start_date:%B %d, %Y} to {hackathon.end_date:%B %d, %Y}"
+        + (f" at {hackathon.location}" if hackathon.location else "")
+        + ".\n\nCheck the event page for details."
+    )
+    
+    db.execute(insert(OutboxMessage).from_select(
+        ["kind", "recipient", "subject", "body", "status", "attempts", "next_attempt_at", "created_at", "hackathon_id"],
+        select(
+            literal("hackathon.updated"),
+            Participant.email,
+            literal(subject),
+            literal(body),
+            literal("pending"),
+            literal(0),
+            literal(hackathon.updated_at),
+            literal(hackathon.updated_at),
+            literal(hackathon.id)
+        ).where(
+            Participant.hackathon_id == hackathon.id,
+            Participant.status.in_(NOTIFIED_PARTICIPANT_STATUSES)
+        )
+    ))
+    return True
@@ -0,0 +1,272 @@
+"""
+Delivery of queued notifications from the ``outbox_messages`` table.
+
+Handlers only insert outbox rows inside their own transaction, so a change
+and its notification commit or roll back together. The dispatcher, started
+by the lifespan when ``SMTP_HOST`` is set, claims due rows in batches under a
+lease, sends them over a small pool of persistent SMTP connections and
+records the outcome. Failed sends are retried with exponential backoff;
+rows whose lease expired (e.g. the worker was restarted mid-send) are
+claimed again, so delivery is at-least-once.
+
+To try it locally, run an SMTP stand-in that prints messages:
+
+    python -m aiosmtpd -n -l localhost:1025
+    SMTP_HOST=localhost SMTP_PORT=1025 python main.py
+"""
+import asyncio
+import os
+import queue
+import random
+import smtplib
+import threading
+import uuid
+from datetime import datetime, timedelta
+from email.message import EmailMessage
+from typing import List, Optional, Tuple
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session
+from utils.database import SessionLocal
+from models.database import OutboxMessage
+
+SMTP_HOST = os.getenv("SMTP_HOST")
+SMTP_PORT = int(os.getenv("SMTP_PORT", "25"))
+SMTP_USERNAME = os.getenv("SMTP_USERNAME")
+SMTP_PASSWORD = os.getenv("SMTP_PASSWORD")
+SMTP_USE_TLS = os.getenv("SMTP_USE_TLS", "false").lower() == "true"
+SMTP_FROM = os.getenv("SMTP_FROM", "no-reply@hackathon-platform.local")
+SMTP_POOL_SIZE = int(os.getenv("SMTP_POOL_SIZE", "4"))
+SMTP_TIMEOUT = float(os.getenv("SMTP_TIMEOUT", "30"))
+
+OUTBOX_BATCH_SIZE = int(os.getenv("OUTBOX_BATCH_SIZE", "100"))
+OUTBOX_POLL_SECONDS = float(os.getenv("OUTBOX_POLL_SECONDS", "2"))
+OUTBOX_LEASE_SECONDS = float(os.getenv("OUTBOX_LEASE_SECONDS", "300"))
+OUTBOX_MAX_ATTEMPTS = int(os.getenv("OUTBOX_MAX_ATTEMPTS", "8"))
+OUTBOX_BACKOFF_SECONDS = float(os.getenv("OUTBOX_BACKOFF_SECONDS", "30"))
+OUTBOX_MAX_BACKOFF_SECONDS = float(os.getenv("OUTBOX_MAX_BACKOFF_SECONDS", "3600"))
+# Delivered rows are deleted after this many days
+OUTBOX_RETENTION_DAYS = int(os.getenv("OUTBOX_RETENTION_DAYS", "7"))
+
+def _due_filter(now: datetime):
+    return or_(
+        and_(OutboxMessage.status == "pending", OutboxMessage.next_attempt_at <= now),
+        and_(OutboxMessage.status == "sending", OutboxMessage.claimed_until < now)
+    )
+
+def claim_batch(db: Session, worker_id: str, limit: int = OUTBOX_BATCH_SIZE) -> List[OutboxMessage]:
+    """Lease up to ``limit`` due messages to this worker"""
+    now = datetime.utcnow()
+    # SKIP LOCKED lets several dispatchers claim disjoint batches on PostgreSQL;
+    # the guarded UPDATE below keeps claims exclusive everywhere else
+    candidate_ids = [
+        row[0] for row in db.query(OutboxMessage.id)
+        .filter(_due_filter(now))
+        .order_by(OutboxMessage.next_attempt_at, OutboxMessage.id)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    ]
+    if not candidate_ids:
+        db.commit()
+        return []
+    
+    db.query(OutboxMessage).filter(
+        OutboxMessage.id.in_(candidate_ids), _due_filter(now)
+    ).update({
+        OutboxMessage.status: "sending",
+        OutboxMessage.claimed_by: worker_id,
+        OutboxMessage.claimed_until: now + timedelta(seconds=OUTBOX_LEASE_SECONDS)
+    }, synchronize_session=False)
+    db.commit()
+    
+    return (
+        db.query(OutboxMessage)
+        .filter(OutboxMessage.id.in_(candidate_ids), OutboxMessage.claimed_by == worker_id, OutboxMessage.status == "sending")
+        .order_by(OutboxMessage.id)
+        .all()
+    )
+
+def backoff_delay(attempts: int) -> float:
+    """Exponential backoff with jitter for the given number of failed attempts"""
+    delay = min(OUTBOX_MAX_BACKOFF_SECONDS, OUTBOX_BACKOFF_SECONDS * (2 ** (attempts - 1)))
+    return delay * random.uniform(0.8, 1.2)
+
+def record_results(db: Session, worker_id: str, results: List[Tuple[int, Optional[str]]]):
+    """Store (message_id, error or None) outcomes of a claimed batch"""
+    now = datetime.utcnow()
+    sent_ids = [message_id for message_id, error in results if error is None]
+    if sent_ids:
+        db.query(OutboxMessage).filter(
+            OutboxMessage.id.in_(sent_ids), OutboxMessage.claimed_by == worker_id
+        ).update({
+            OutboxMessage.status: "sent",
+            OutboxMessage.sent_at: now,
+            OutboxMessage.claimed_until: None,
+            OutboxMessage.last_error: None
+        }, synchronize_session=False)
+    
+    failures = {message_id: error for message_id, error in results if error is not None}
+    if failures:
+        for message in db.query(OutboxMessage).filter(
+            OutboxMessage.id.in_(failures), OutboxMessage.claimed_by == worker_id
+        ):
+            message.attempts += 1
+            message.last_error = failures[message.id][:1000]
+            message.claimed_until = None
+            if message.attempts >= OUTBOX_MAX_ATTEMPTS:
+                message.status = "failed"
+            else:
+                message.status = "pending"
+                message.next_attempt_at = now + timedelta(seconds=backoff_delay(message.attempts))
+    db.commit()
+
+def prune_sent(db: Session) -> int:
+    deleted = db.query(OutboxMessage).filter(
+        OutboxMessage.status == "sent",
+        OutboxMessage.sent_at < datetime.utcnow() - timedelta(days=OUTBOX_RETENTION_DAYS)
+    ).delete(synchronize_session=False)
+    db.commit()
+    return deleted
+
+class SMTPPool:
+    """A few persistent SMTP connections shared by the sending threads"""
+
+    def __init__(self, size: int = SMTP_POOL_SIZE):
+        self.size = size
+        self._idle: "queue.LifoQueue[smtplib.SMTP]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+
+    def _connect(self) -> smtplib.SMTP:
+        connection = smtplib.SMTP(SMTP_HOST, SMTP_PORT, timeout=SMTP_TIMEOUT)
+        if SMTP_USE_TLS:
+            connection.starttls()
+        if SMTP_USERNAME:
+            connection.login(SMTP_USERNAME, SMTP_PASSWORD or "")
+        return connection
+
+    def send(self, message: EmailMessage):
+        """Send on an idle connection (opening one if needed); broken connections are dropped"""
+        with self._slots:
+            try:
+                connection = self._idle.get_nowait()
+            except queue.Empty:
+                connection = self._connect()
+            try:
+                connection.send_message(message)
+            except smtplib.SMTPRecipientsRefused:
+                # The connection is fine, only this recipient is not
+                self._idle.put(connection)
+                raise
+            except Exception:
+                try:
+                    connection.close()
+                except Exception:
+                    pass
+                raise
+            self._idle.put(connection)
+
+    def close(self):
+        while True:
+            try:
+                connection = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                connection.quit()
+            except Exception:
+                pass
+
+def _to_email(message: OutboxMessage) -> EmailMessage:
+    email = EmailMessage()
+    email["From"] = SMTP_FROM
+    email["To"] = message.recipient
+    email["Subject"] = message.subject
+    email["Message-ID"] = f"<outbox-{message.id}@{SMTP_FROM.split('@')[-1]}>"
+    email.set_content(message.body)
+    return email
+
+class OutboxDispatcher:
+    """Background task that drains the outbox"""
+
+    def __init__(self):
+        self.worker_id = uuid.uuid4().hex
+        self.pool = SMTPPool()
+        self._task: Optional[asyncio.Task] = None
+        self._pruned_at: Optional[datetime] = None
+        self.sent = 0
+        self.errors = 0
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        await asyncio.to_thread(self.pool.close)
+
+    def _send(self, message: OutboxMessage) -> Optional[str]:
+        try:
+            self.pool.send(_to_email(message))
+            return None
+        except Exception as e:
+            return f"{type(e).__name__}: {str(e)}"
+
+    def dispatch_once(self) -> int:
+        """Claim and send one batch; returns the number of messages claimed"""
+        db = SessionLocal()
+        try:
+            now = datetime.utcnow()
+            if self._pruned_at is None or now - self._pruned_at > timedelta(hours=1):
+                prune_sent(db)
+                self._pruned_at = now
+            
+            messages = claim_batch(db, self.worker_id)
+            if not messages:
+                return 0
+            
+            # Every pooled connection sends in parallel
+            results = [None] * len(messages)
+            position = iter(range(len(messages)))
+            lock = threading.Lock()
+            
+            def sender():
+                while True:
+                    with lock:
+                        index = next(position, None)
+                    if index is None:
+                        return
+                    results[index] = (messages[index].id, self._send(messages[index]))
+            
+            threads = [threading.Thread(target=sender) for _ in range(min(self.pool.size, len(messages)))]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            
+            record_results(db, self.worker_id, results)
+            failed = sum(1 for _, error in results if error is not None)
+            self.sent += len(results) - failed
+            self.errors += failed
+            return len(messages)
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    async def _run(self):
+        while True:
+            try:
+                claimed = await asyncio.to_thread(self.dispatch_once)
+            except Exception:
+                claimed = 0
+            # A full batch means more may be due right away
+            if claimed < OUTBOX_BATCH_SIZE:
+                await asyncio.sleep(OUTBOX_POLL_SECONDS)
+
+outbox_dispatcher = OutboxDispatcher() if SMTP_HOST else None
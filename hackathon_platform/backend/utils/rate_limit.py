@@ -0,0 +1,118 @@
+import ipaddress
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Tuple
+
+# Login attempts: burst size and sustained attempts per minute
+LOGIN_IP_BURST = int(os.getenv("LOGIN_IP_BURST", "20"))
+LOGIN_IP_PER_MINUTE = float(os.getenv("LOGIN_IP_PER_MINUTE", "10"))
+LOGIN_ACCOUNT_BURST = int(os.getenv("LOGIN_ACCOUNT_BURST", "5"))
+LOGIN_ACCOUNT_PER_MINUTE = float(os.getenv("LOGIN_ACCOUNT_PER_MINUTE", "1"))
+# Comma-separated addresses or networks of reverse proxies whose X-Forwarded-For is trusted
+TRUSTED_PROXIES = [
+    ipaddress.ip_network(entry.strip(), strict=False)
+    for entry in os.getenv("TRUSTED_PROXIES", "").split(",") if entry.strip()
+]
+# Maximum number of tracked keys per limiter; least recently seen are evicted
+RATE_LIMIT_MAX_KEYS = int(os.getenv("RATE_LIMIT_MAX_KEYS", "100000"))
+
+class TokenBucketLimiter:
+    """Token buckets per key in a bounded LRU map.
+
+    Each bucket is a ``(tokens, last_refill)`` tuple, so a tracked key costs a
+    dict slot and two floats. Evicting a key only forgets its history, which
+    is the same as a full bucket.
+    """
+
+    def __init__(self, capacity: float, refill_per_second: float, max_keys: int = RATE_LIMIT_MAX_KEYS):
+        self.capacity = float(capacity)
+        self.refill_per_second = refill_per_second
+        self.max_keys = max_keys
+        self.allowed = 0
+        self.throttled = 0
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def consume(self, key: str, cost: float = 1.0) -> Tuple[bool, float]:
+        """Take ``cost`` tokens; returns (allowed, seconds until allowed)"""
+        now = time.monotonic()
+        with self._lock:
+            tokens, last_refill = self._buckets.pop(key, (self.capacity, now))
+            tokens = min(self.capacity, tokens + (now - last_refill) * self.refill_per_second)
+
+            if tokens >= cost:
+                tokens -= cost
+                allowed, retry_after = True, 0.0
+                self.allowed += 1
+            else:
+                allowed = False
+                retry_after = (cost - tokens) / self.refill_per_second if self.refill_per_second else math.inf
+                self.throttled += 1
+
+            self._buckets[key] = (tokens, now)
+            if len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+
+        return allowed, retry_after
+
+    def refund(self, key: str, cost: float = 1.0):
+        """Give back tokens taken by ``consume``; an evicted key is already full"""
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                self._buckets[key] = (min(self.capacity, bucket[0] + cost), bucket[1])
+
+    def metrics(self) -> dict:
+        return {"allowed": self.allowed, "throttled": self.throttled, "tracked_keys": len(self._buckets)}
+
+def _is_trusted_proxy(address: str) -> bool:
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    return any(ip in network for network in TRUSTED_PROXIES)
+
+def client_address(request) -> str:
+    """Address of the client, read from X-Forwarded-For only behind a trusted proxy.
+
+    The header is walked from the right, skipping hops added by trusted
+    proxies, so a client cannot pick its own address by sending the header.
+    """
+    address = request.client.host if request.client else "unknown"
+    if not _is_trusted_proxy(address):
+        return address
+    hops = [hop.strip() for hop in ",".join(request.headers.getlist("x-forwarded-for")).split(",") if hop.strip()]
+    for hop in reversed(hops):
+        address = hop
+        if not _is_trusted_proxy(hop):
+            break
+    return address
+
+def _account_key(email: str) -> str:
+    return email.strip().lower()
+
+login_ip_limiter = TokenBucketLimiter(LOGIN_IP_BURST, LOGIN_IP_PER_MINUTE / 60)
+login_account_limiter = TokenBucketLimiter(LOGIN_ACCOUNT_BURST, LOGIN_ACCOUNT_PER_MINUTE / 60)
+
+def check_login_rate(ip_address: str, email: str) -> Tuple[bool, float]:
+    """Fast in-memory check run before any database or bcrypt work"""
+    allowed, retry_after = login_ip_limiter.consume(ip_address)
+    if not allowed:
+        return False, retry_after
+    return login_account_limiter.consume(_account_key(email))
+
+def record_login_success(email: str):
+    """Refund the account attempt, so only failed logins count against an account"""
+    login_account_limiter.refund(_account_key(email))
+
+def login_rate_metrics() -> dict:
+    return {
+        "ip": login_ip_limiter.metrics(),
+        "account": login_account_limiter.metrics(),
+    }
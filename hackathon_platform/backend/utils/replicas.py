@@ -0,0 +1,162 @@
+"""
+Routing of read-only requests to replica databases.
+
+Set ``REPLICA_DATABASE_URLS`` (comma-separated) to enable. Handlers that only
+read depend on ``get_read_db``; everything else keeps using ``get_db`` and the
+primary. A client that just wrote is pinned to the primary for
+``READ_YOUR_WRITES_SECONDS``, and replicas lagging more than
+``REPLICA_MAX_LAG_SECONDS`` are skipped. The pin is a short-lived cookie for
+browsers and, for Bearer clients that keep no cookies, an entry keyed on the
+token's subject in the cache; every worker honours it when the cache has a
+shared tier (``CACHE_BACKEND=sqlite``), otherwise only the worker that served
+the write.
+
+Lag is measured exactly on PostgreSQL. Other databases fall back to
+comparing the newest ``Hackathon.updated_at`` on both sides, which only sees
+hackathon writes: a replica behind on other tables reads as current while no
+hackathon changes, so keep ``READ_YOUR_WRITES_SECONDS`` covering the real lag.
+
+To try it locally with SQLite, copy the primary file and point a replica at it:
+
+    cp hackathon.db replica.db
+    REPLICA_DATABASE_URLS=sqlite:///./replica.db python main.py
+"""
+import itertools
+import os
+import threading
+import time
+from typing import List, Optional
+from fastapi import Request
+from sqlalchemy import func, text
+from sqlalchemy.orm import Session
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from utils.auth import decode_token
+from utils.cache import cache
+from utils.database import SessionLocal, ReplicaSessionLocals, replica_engines
+from models.database import Hackathon
+
+READ_YOUR_WRITES_SECONDS = float(os.getenv("READ_YOUR_WRITES_SECONDS", "5"))
+REPLICA_MAX_LAG_SECONDS = float(os.getenv("REPLICA_MAX_LAG_SECONDS", "5"))
+REPLICA_LAG_CHECK_INTERVAL = float(os.getenv("REPLICA_LAG_CHECK_INTERVAL", "2"))
+# Cookie holding the Unix time until which the client reads from the primary
+PRIMARY_UNTIL_COOKIE = "primary_until"
+
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+def _token_subject(authorization: Optional[str]) -> Optional[str]:
+    """Subject of a valid Bearer access token, or None"""
+    if not authorization or not authorization.lower().startswith("bearer "):
+        return None
+    payload = decode_token(authorization[7:].strip())
+    return payload["sub"] if payload is not None else None
+
+def _pin_key(subject: str) -> str:
+    return f"primary_until:{subject}"
+
+def is_sticky(request: Request) -> bool:
+    """Whether the client wrote within the read-your-writes window"""
+    try:
+        if float(request.cookies.get(PRIMARY_UNTIL_COOKIE, "0")) > time.time():
+            return True
+    except ValueError:
+        pass
+    subject = _token_subject(request.headers.get("authorization"))
+    return subject is not None and cache.get(_pin_key(subject), 0) > time.time()
+
+class ReplicaHealth:
+    """Cached replication lag of one replica, refreshed at most every interval"""
+
+    def __init__(self, index: int):
+        self.index = index
+        self.lag: Optional[float] = None
+        self.checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def usable(self) -> bool:
+        now = time.monotonic()
+        if now - self.checked_at >= REPLICA_LAG_CHECK_INTERVAL and self._lock.acquire(blocking=False):
+            try:
+                self.lag = measure_replica_lag(self.index)
+                self.checked_at = time.monotonic()
+            finally:
+                self._lock.release()
+        return self.lag is not None and self.lag <= REPLICA_MAX_LAG_SECONDS
+
+def measure_replica_lag(index: int) -> Optional[float]:
+    """Return the replica's lag in seconds, or None if it cannot be reached"""
+    replica_engine = replica_engines[index]
+    try:
+        if replica_engine.dialect.name == "postgresql":
+            with replica_engine.connect() as connection:
+                lag = connection.execute(text(
+                    "SELECT COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)"
+                )).scalar()
+            return float(lag)
+
+        # Generic probe: how far the newest hackathon change trails the primary. Blind to
+        # lag on other tables while hackathons are not written (see the module docstring)
+        with SessionLocal() as primary, ReplicaSessionLocals[index]() as replica:
+            primary_latest = primary.query(func.max(Hackathon.updated_at)).scalar()
+            replica_latest = replica.query(func.max(Hackathon.updated_at)).scalar()
+        if primary_latest is None:
+            return 0.0
+        if replica_latest is None:
+            return float("inf")
+        return max(0.0, (primary_latest - replica_latest).total_seconds())
+    except Exception:
+        return None
+
+_replica_health: List[ReplicaHealth] = [ReplicaHealth(index) for index in range(len(ReplicaSessionLocals))]
+_round_robin = itertools.cycle(range(len(ReplicaSessionLocals))) if ReplicaSessionLocals else None
+
+def choose_session_factory(sticky: bool = False):
+    """Pick a healthy replica for a read, or the primary"""
+    if _round_robin is None or sticky:
+        return SessionLocal
+    for _ in range(len(_replica_health)):
+        health = _replica_health[next(_round_robin)]
+        if health.usable():
+            return ReplicaSessionLocals[health.index]
+    return SessionLocal
+
+def get_read_db(request: Request):
+    """Session dependency for read-only handlers; routes to a replica when possible"""
+    db: Session = choose_session_factory(_round_robin is not None and is_sticky(request))()
+    try:
+        yield db
+    finally:
+        db.close()
+
+class ReadYourWritesMiddleware:
+    """Pin the caller to the primary after any successful (2xx) unsafe request.
+
+    The pin travels with the client as a cookie rather than living in one
+    worker, so the next read is routed to the primary whichever worker serves it.
+    Authenticated callers are also pinned by token subject in the cache, for
+    clients that do not keep cookies.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if _round_robin is None or scope["type"] != "http" or scope["method"] in SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message):
+            if message["type"] == "http.response.start" and 200 <= message["status"] < 300:
+                headers = MutableHeaders(scope=message)
+                primary_until = time.time() + READ_YOUR_WRITES_SECONDS
+                headers.append(
+                    "Set-Cookie",
+                    f"{PRIMARY_UNTIL_COOKIE}={primary_until:.3f}; Max-Age={max(1, round(READ_YOUR_WRITES_SECONDS))}; "
+                    "Path=/; HttpOnly; SameSite=Lax"
+                )
+                subject = _token_subject(Headers(scope=scope).get("authorization"))
+                if subject is not None:
+                    cache.set(_pin_key(subject), primary_until, ttl=READ_YOUR_WRITES_SECONDS)
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,117 @@
+import hashlib
+import math
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Optional
+from sqlalchemy.orm import Session
+from models.database import RevokedToken
+
+# Expected number of live revocations and acceptable false positive rate
+REVOCATION_CAPACITY = int(os.getenv("REVOCATION_CAPACITY", "100000"))
+REVOCATION_FALSE_POSITIVE_RATE = float(os.getenv("REVOCATION_FALSE_POSITIVE_RATE", "0.001"))
+# Seconds between pulls of revocations made by other workers
+REVOCATION_SYNC_SECONDS = float(os.getenv("REVOCATION_SYNC_SECONDS", "5"))
+# Each pull re-reads revocations this far back, so rows committed late by slow transactions
+# (or stamped by a worker with a lagging clock) are still picked up
+REVOCATION_SYNC_OVERLAP_SECONDS = float(os.getenv("REVOCATION_SYNC_OVERLAP_SECONDS", "120"))
+
+class BloomFilter:
+    """Fixed-size bloom filter over strings, sized for a capacity and error rate"""
+
+    def __init__(self, capacity: int, false_positive_rate: float):
+        # Standard sizing: m = -n ln p / (ln 2)^2, k = m / n ln 2
+        ln2 = math.log(2)
+        self.size = max(64, int(-capacity * math.log(false_positive_rate) / (ln2 * ln2)))
+        self.hash_count = max(1, round(self.size / capacity * ln2))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        # Double hashing: position_i = h1 + i * h2
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, item: str):
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+class RevocationList:
+    """Revoked token ids: a bloom filter in memory, the exact list in the database.
+
+    A token whose jti is not in the filter (the normal case) is accepted
+    without any I/O. A filter hit is confirmed with one indexed lookup, so
+    false positives never reject a valid token. Revocations from other
+    workers are pulled in by revoked_at at most every REVOCATION_SYNC_SECONDS,
+    overlapping the previous pull by REVOCATION_SYNC_OVERLAP_SECONDS: ids and
+    timestamps are assigned before commit, so rows do not become visible in
+    either order.
+    """
+
+    def __init__(self):
+        self._filter = BloomFilter(REVOCATION_CAPACITY, REVOCATION_FALSE_POSITIVE_RATE)
+        self._last_revoked_at: Optional[datetime] = None
+        self._loaded = False
+        self._synced_at = 0.0
+        self._lock = threading.Lock()
+
+    def _sync(self, db: Session):
+        if self._loaded and time.monotonic() - self._synced_at < REVOCATION_SYNC_SECONDS:
+            return
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            query = db.query(RevokedToken.revoked_at, RevokedToken.jti)
+            if not self._loaded:
+                # Expired revocations no longer matter: the token is rejected on expiry anyway
+                query = query.filter(RevokedToken.expires_at > datetime.utcnow())
+            elif self._last_revoked_at is not None:
+                # Adding a jti twice is harmless, so the overlap only costs a few reads
+                query = query.filter(
+                    RevokedToken.revoked_at >= self._last_revoked_at - timedelta(seconds=REVOCATION_SYNC_OVERLAP_SECONDS)
+                )
+            for revoked_at, jti in query:
+                self._filter.add(jti)
+                if revoked_at is not None and (self._last_revoked_at is None or revoked_at > self._last_revoked_at):
+                    self._last_revoked_at = revoked_at
+            self._loaded = True
+            self._synced_at = time.monotonic()
+        finally:
+            self._lock.release()
+
+    def is_revoked(self, db: Session, jti: str) -> bool:
+        self._sync(db)
+        if jti not in self._filter:
+            return False
+        return db.query(RevokedToken.id).filter(RevokedToken.jti == jti).first() is not None
+
+    def revoke(self, db: Session, jti: str, token_type: str, expires_at: datetime, user_id: int = None):
+        """Record a revocation in the caller's transaction and in the local filter"""
+        db.add(RevokedToken(
+            jti=jti,
+            token_type=token_type,
+            expires_at=expires_at,
+            revoked_at=datetime.utcnow(),
+            user_id=user_id
+        ))
+        self._filter.add(jti)
+
+    def prune(self, db: Session) -> int:
+        """Delete expired revocations and rebuild the filter from the live ones"""
+        deleted = db.query(RevokedToken).filter(
+            RevokedToken.expires_at <= datetime.utcnow()
+        ).delete(synchronize_session=False)
+        db.commit()
+        with self._lock:
+            self._filter = BloomFilter(REVOCATION_CAPACITY, REVOCATION_FALSE_POSITIVE_RATE)
+            self._last_revoked_at = None
+            self._loaded = False
+        self._sync(db)
+        return deleted
+
+revocation_list = RevocationList()
@@ -0,0 +1,150 @@
+"""
+Time-bucketed counters behind the dashboard charts.
+
+Writers call ``record_event`` in the same transaction as the row they insert;
+each event increments one row per stored granularity (minute, hour, day)
+with a dialect upsert. Charts read the few bucket rows of a range instead of
+grouping raw timestamps. Week and month series are summed from day buckets.
+"""
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import and_, func
+from sqlalchemy.orm import Session
+from models.database import MetricRollup
+
+STORED_GRANULARITIES = ("minute", "hour", "day")
+DERIVED_GRANULARITIES = ("week", "month")
+
+_STEPS = {
+    "minute": timedelta(minutes=1),
+    "hour": timedelta(hours=1),
+    "day": timedelta(days=1),
+    "week": timedelta(weeks=1),
+}
+
+def bucket_start(moment: datetime, granularity: str) -> datetime:
+    """Start of the bucket containing ``moment``"""
+    if granularity == "minute":
+        return moment.replace(second=0, microsecond=0)
+    if granularity == "hour":
+        return moment.replace(minute=0, second=0, microsecond=0)
+    day = moment.replace(hour=0, minute=0, second=0, microsecond=0)
+    if granularity == "day":
+        return day
+    if granularity == "week":
+        return day - timedelta(days=day.weekday())
+    if granularity == "month":
+        return day.replace(day=1)
+    raise ValueError(f"Unknown granularity: {granularity}")
+
+def next_bucket(start: datetime, granularity: str) -> datetime:
+    if granularity == "month":
+        return start.replace(year=start.year + start.month // 12, month=start.month % 12 + 1)
+    return start + _STEPS[granularity]
+
+def bucket_range(start: datetime, end: datetime, granularity: str) -> List[datetime]:
+    """Every bucket start from the bucket of ``start`` up to ``end`` inclusive"""
+    buckets = []
+    current = bucket_start(start, granularity)
+    while current <= end:
+        buckets.append(current)
+        current = next_bucket(current, granularity)
+    return buckets
+
+def _upsert(db: Session, rows: List[dict]):
+    """Add each row's value to its bucket, creating missing buckets"""
+    if not rows:
+        return
+    table = MetricRollup.__table__
+    dialect = db.get_bind().dialect.name
+    if dialect in ("sqlite", "postgresql"):
+        if dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        statement = dialect_insert(table)
+        statement = statement.on_conflict_do_update(
+            index_elements=["metric", "granularity", "bucket_start", "hackathon_id", "dimension"],
+            set_={"value": table.c.value + statement.excluded.value}
+        )
+        db.execute(statement, rows)
+        return
+    
+    # Portable fallback: increment, and insert when the bucket does not exist yet
+    for row in rows:
+        result = db.execute(
+            table.update()
+            .where(and_(*(table.c[key] == row[key] for key in (
+                "metric", "granularity", "bucket_start", "hackathon_id", "dimension"
+            ))))
+            .values(value=table.c.value + row["value"])
+        )
+        if result.rowcount == 0:
+            db.execute(table.insert(), [row])
+
+def record_events(
+    db: Session,
+    metric: str,
+    events: Iterable[Tuple[datetime, int, int, str]]
+):
+    """Count ``(moment, hackathon_id, organizer_id, dimension)`` events (caller commits)"""
+    totals = Counter()
+    for moment, hackathon_id, organizer_id, dimension in events:
+        if moment is None:
+            continue
+        for granularity in STORED_GRANULARITIES:
+            totals[(granularity, bucket_start(moment, granularity), hackathon_id, organizer_id, dimension or "")] += 1
+    
+    _upsert(db, [
+        {
+            "metric": metric,
+            "granularity": granularity,
+            "bucket_start": start,
+            "hackathon_id": hackathon_id,
+            "organizer_id": organizer_id,
+            "dimension": dimension,
+            "value": value
+        }
+        for (granularity, start, hackathon_id, organizer_id, dimension), value in totals.items()
+    ])
+
+def record_event(
+    db: Session,
+    metric: str,
+    hackathon_id: int,
+    organizer_id: int,
+    moment: Optional[datetime] = None,
+    dimension: str = ""
+):
+    """Count one event (caller commits)"""
+    record_events(db, metric, [(moment or datetime.utcnow(), hackathon_id, organizer_id, dimension)])
+
+def load_series(
+    db: Session,
+    metric: str,
+    granularity: str,
+    start: datetime,
+    end: datetime,
+    hackathon_id: Optional[int] = None,
+    organizer_id: Optional[int] = None
+) -> Dict[str, Dict[datetime, int]]:
+    """Bucket values per dimension for a range, read from the rollups"""
+    stored = granularity if granularity in STORED_GRANULARITIES else "day"
+    query = db.query(
+        MetricRollup.dimension, MetricRollup.bucket_start, func.sum(MetricRollup.value)
+    ).filter(
+        MetricRollup.metric == metric,
+        MetricRollup.granularity == stored,
+        MetricRollup.bucket_start >= bucket_start(start, granularity),
+        MetricRollup.bucket_start <= end
+    )
+    if hackathon_id is not None:
+        query = query.filter(MetricRollup.hackathon_id == hackathon_id)
+    if organizer_id is not None:
+        query = query.filter(MetricRollup.organizer_id == organizer_id)
+    
+    series = defaultdict(Counter)
+    for dimension, start_of_bucket, value in query.group_by(MetricRollup.dimension, MetricRollup.bucket_start):
+        series[dimension][bucket_start(start_of_bucket, granularity)] += int(value)
+    return series
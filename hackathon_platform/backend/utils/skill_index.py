@@ -0,0 +1,59 @@
+from typing import Iterable, List, Optional, Tuple
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+from models.database import Participant, ParticipantSkill
+
+def normalize_skill(skill) -> Optional[str]:
+    """Canonical form of a skill used as the index key"""
+    if not isinstance(skill, str):
+        return None
+    normalized = " ".join(skill.lower().split())
+    return normalized or None
+
+def skill_keys(skills) -> List[str]:
+    """Distinct normalized skills of a participant, in first-seen order"""
+    keys = []
+    for skill in skills or []:
+        key = normalize_skill(skill)
+        if key is not None and key not in keys:
+            keys.append(key)
+    return keys
+
+def index_participants(db: Session, participants: Iterable[Tuple[int, int, list]]):
+    """Add index rows for just inserted ``(participant_id, hackathon_id, skills)`` (caller commits)"""
+    rows = [
+        {"hackathon_id": hackathon_id, "participant_id": participant_id, "skill": key}
+        for participant_id, hackathon_id, skills in participants
+        for key in skill_keys(skills)
+    ]
+    if rows:
+        db.execute(insert(ParticipantSkill), rows)
+
+def rebuild_skill_index(db: Session, hackathon_id: int, batch_size: int = 1000) -> int:
+    """Recompute the index of one hackathon from the skills column; returns rows written"""
+    db.query(ParticipantSkill).filter(
+        ParticipantSkill.hackathon_id == hackathon_id
+    ).delete(synchronize_session=False)
+    
+    written = 0
+    last_id = 0
+    while True:
+        participants = (
+            db.query(Participant.id, Participant.hackathon_id, Participant.skills)
+            .filter(Participant.hackathon_id == hackathon_id, Participant.id > last_id)
+            .order_by(Participant.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not participants:
+            break
+        last_id = participants[-1].id
+        rows = [
+            {"hackathon_id": hackathon_id, "participant_id": participant_id, "skill": key}
+            for participant_id, _, skills in participants
+            for key in skill_keys(skills)
+        ]
+        if rows:
+            db.execute(insert(ParticipantSkill), rows)
+            written += len(rows)
+    return written
@@ -0,0 +1,362 @@
+"""
+Content-addressed storage for uploaded files.
+
+Request bodies are written to disk in fixed ``UPLOAD_CHUNK_SIZE`` pieces and
+hashed as they arrive, so memory use does not depend on the file size. A
+finished file is stored once under ``objects/<sha[:2]>/<sha[2:4]>/<sha>``;
+uploading the same bytes again reuses the stored object. Resumable uploads
+append to ``partial/<upload id>`` until they are completed. Files are served
+by ``routers/uploads.py`` with ``RangedFileResponse``.
+"""
+import asyncio
+import hashlib
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Optional, Tuple
+from sqlalchemy import and_, or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import ClientDisconnect
+from utils.database import SessionLocal
+from models.database import StoredFile, UploadSession
+
+STORAGE_DIR = os.getenv("STORAGE_DIR", "storage")
+OBJECTS_DIR = os.path.join(STORAGE_DIR, "objects")
+PARTIAL_DIR = os.path.join(STORAGE_DIR, "partial")
+UPLOAD_CHUNK_SIZE = int(os.getenv("UPLOAD_CHUNK_SIZE", str(1024 * 1024)))
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_BYTES", str(2 * 1024 * 1024 * 1024)))
+# Unfinished upload sessions untouched for this long are discarded
+UPLOAD_SESSION_TTL_HOURS = float(os.getenv("UPLOAD_SESSION_TTL_HOURS", "24"))
+# How often each worker looks for abandoned upload sessions
+UPLOAD_PRUNE_INTERVAL_SECONDS = float(os.getenv("UPLOAD_PRUNE_INTERVAL_SECONDS", "3600"))
+# An append or completion holds its upload this long; one whose worker died is released afterwards
+UPLOAD_CLAIM_LEASE_SECONDS = float(os.getenv("UPLOAD_CLAIM_LEASE_SECONDS", "600"))
+# Running hashes of open sessions kept per worker; a miss re-reads the partial file
+MAX_CACHED_HASHERS = 1024
+
+class UploadError(Exception):
+    """Upload rejected; carries the HTTP status the router should answer with"""
+
+    def __init__(self, status_code: int, detail: str):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+def object_path(sha256: str) -> str:
+    return os.path.join(OBJECTS_DIR, sha256[:2], sha256[2:4], sha256)
+
+def partial_path(upload_id: str) -> str:
+    return os.path.join(PARTIAL_DIR, upload_id)
+
+def _write_chunk(handle, hasher, data: bytes):
+    # hashlib releases the GIL for large buffers, so both run well off the event loop
+    handle.write(data)
+    hasher.update(data)
+
+async def write_stream(stream: AsyncIterator[bytes], handle, hasher, limit: int, keep_on_disconnect: bool = False) -> int:
+    """Copy a request body to ``handle`` in fixed-size chunks, hashing on the way.
+
+    With ``keep_on_disconnect`` a dropped connection keeps what has arrived
+    so far and returns its size, which lets a resumable upload continue.
+    """
+    buffer = bytearray()
+    written = 0
+    try:
+        async for data in stream:
+            if written + len(buffer) + len(data) > limit:
+                raise UploadError(413, f"Upload exceeds the {limit} byte limit")
+            buffer += data
+            while len(buffer) >= UPLOAD_CHUNK_SIZE:
+                chunk = bytes(buffer[:UPLOAD_CHUNK_SIZE])
+                del buffer[:UPLOAD_CHUNK_SIZE]
+                await run_in_threadpool(_write_chunk, handle, hasher, chunk)
+                written += len(chunk)
+    except ClientDisconnect:
+        if not keep_on_disconnect:
+            raise
+    if buffer:
+        await run_in_threadpool(_write_chunk, handle, hasher, bytes(buffer))
+        written += len(buffer)
+    return written
+
+def _hash_file(path: str, length: int):
+    hasher = hashlib.sha256()
+    with open(path, "rb") as handle:
+        remaining = length
+        while remaining > 0:
+            chunk = handle.read(min(UPLOAD_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            hasher.update(chunk)
+            remaining -= len(chunk)
+    return hasher
+
+class HasherCache:
+    """Running SHA-256 of open upload sessions, keyed by upload id"""
+
+    def __init__(self, max_entries: int = MAX_CACHED_HASHERS):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[int, object]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, upload_id: str, offset: int):
+        """Return a hasher positioned at ``offset``, or None if it has to be rebuilt"""
+        with self._lock:
+            entry = self._entries.pop(upload_id, None)
+        if entry is None or entry[0] != offset:
+            return None
+        return entry[1]
+
+    def put(self, upload_id: str, offset: int, hasher):
+        with self._lock:
+            self._entries[upload_id] = (offset, hasher)
+            self._entries.move_to_end(upload_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, upload_id: str):
+        with self._lock:
+            self._entries.pop(upload_id, None)
+
+session_hashers = HasherCache()
+
+async def _hasher_at(upload_id: str, offset: int):
+    hasher = session_hashers.take(upload_id, offset)
+    if hasher is None:
+        # Another worker received the earlier chunks, or this one restarted
+        hasher = await run_in_threadpool(_hash_file, partial_path(upload_id), offset)
+    return hasher
+
+def commit_object(db: Session, path: str, sha256: str, size: int, content_type: str, uploaded_by: Optional[int]) -> StoredFile:
+    """Move a fully written file into storage, or drop it if the bytes are already stored"""
+    stored = db.query(StoredFile).filter(StoredFile.sha256 == sha256).first()
+    target = object_path(sha256)
+    if stored is not None and os.path.exists(target):
+        os.remove(path)
+        return stored
+
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    os.replace(path, target)
+    if stored is not None:
+        return stored
+
+    stored = StoredFile(
+        sha256=sha256,
+        size=size,
+        content_type=content_type or "application/octet-stream",
+        uploaded_by=uploaded_by,
+        created_at=datetime.utcnow()
+    )
+    db.add(stored)
+    try:
+        db.commit()
+    except IntegrityError:
+        # The same bytes finished uploading concurrently; reuse that row
+        db.rollback()
+        return db.query(StoredFile).filter(StoredFile.sha256 == sha256).one()
+    db.refresh(stored)
+    return stored
+
+async def store_stream(db: Session, stream: AsyncIterator[bytes], content_type: str, uploaded_by: Optional[int],
+                       expected_sha256: Optional[str] = None, limit: int = MAX_UPLOAD_BYTES) -> StoredFile:
+    """Store a single-request upload"""
+    os.makedirs(PARTIAL_DIR, exist_ok=True)
+    path = partial_path(uuid.uuid4().hex)
+    hasher = hashlib.sha256()
+    try:
+        with open(path, "wb") as handle:
+            size = await write_stream(stream, handle, hasher, limit)
+        sha256 = hasher.hexdigest()
+        if expected_sha256 and expected_sha256.lower() != sha256:
+            raise UploadError(422, "Uploaded bytes do not match the declared SHA-256")
+        return commit_object(db, path, sha256, size, content_type, uploaded_by)
+    finally:
+        if os.path.exists(path):
+            os.remove(path)
+
+def create_upload_session(db: Session, owner_id: int, filename: Optional[str], content_type: Optional[str],
+                          total_size: Optional[int], expected_sha256: Optional[str]) -> UploadSession:
+    if total_size is not None and total_size > MAX_UPLOAD_BYTES:
+        raise UploadError(413, f"Upload exceeds the {MAX_UPLOAD_BYTES} byte limit")
+
+    os.makedirs(PARTIAL_DIR, exist_ok=True)
+    now = datetime.utcnow()
+    upload = UploadSession(
+        id=uuid.uuid4().hex,
+        filename=filename,
+        content_type=content_type or "application/octet-stream",
+        total_size=total_size,
+        received_size=0,
+        expected_sha256=expected_sha256.lower() if expected_sha256 else None,
+        status="open",
+        created_at=now,
+        updated_at=now,
+        owner_id=owner_id
+    )
+    open(partial_path(upload.id), "wb").close()
+    db.add(upload)
+    db.commit()
+    db.refresh(upload)
+    session_hashers.put(upload.id, 0, hashlib.sha256())
+    return upload
+
+def _claim_session(db: Session, upload: UploadSession, offset: int, state: str):
+    """Move an open upload at ``offset`` to ``state`` so no other request writes it meanwhile"""
+    now = datetime.utcnow()
+    claimed = db.query(UploadSession).filter(
+        UploadSession.id == upload.id,
+        UploadSession.received_size == offset,
+        or_(
+            UploadSession.status == "open",
+            and_(
+                UploadSession.status.in_(("appending", "completing")),
+                UploadSession.updated_at < now - timedelta(seconds=UPLOAD_CLAIM_LEASE_SECONDS)
+            )
+        )
+    ).update({UploadSession.status: state, UploadSession.updated_at: now}, synchronize_session=False)
+    db.commit()
+    if not claimed:
+        raise UploadError(409, "Upload is being written by another request; query the offset and retry")
+
+def _release_session(db: Session, upload: UploadSession, state: str, offset: int, new_size: int):
+    db.query(UploadSession).filter(
+        UploadSession.id == upload.id,
+        UploadSession.status == state,
+        UploadSession.received_size == offset
+    ).update(
+        {UploadSession.status: "open", UploadSession.received_size: new_size, UploadSession.updated_at: datetime.utcnow()},
+        synchronize_session=False
+    )
+    db.commit()
+
+async def append_to_session(db: Session, upload: UploadSession, offset: int, stream: AsyncIterator[bytes]) -> int:
+    """Write a request body at ``offset`` of an open upload; returns the new size"""
+    if upload.status == "completed":
+        raise UploadError(409, "Upload is already completed")
+    if offset != upload.received_size:
+        raise UploadError(409, f"Upload offset is {upload.received_size}")
+
+    # Claim the offset before touching the file, so concurrent appends cannot interleave bytes
+    _claim_session(db, upload, offset, "appending")
+    new_size = offset
+    try:
+        limit = (upload.total_size if upload.total_size is not None else MAX_UPLOAD_BYTES) - offset
+        hasher = await _hasher_at(upload.id, offset)
+        with open(partial_path(upload.id), "r+b") as handle:
+            handle.seek(offset)
+            written = await write_stream(stream, handle, hasher, limit, keep_on_disconnect=True)
+        new_size = offset + written
+    finally:
+        # A failed append leaves the offset where it was; its stray bytes are overwritten or truncated
+        _release_session(db, upload, "appending", offset, new_size)
+    session_hashers.put(upload.id, new_size, hasher)
+    return new_size
+
+async def complete_session(db: Session, upload: UploadSession) -> StoredFile:
+    """Check a finished upload and move it into content-addressed storage"""
+    if upload.status == "completed":
+        return db.query(StoredFile).filter(StoredFile.id == upload.file_id).one()
+    if upload.total_size is not None and upload.received_size != upload.total_size:
+        raise UploadError(409, f"Upload has {upload.received_size} of {upload.total_size} bytes")
+
+    size = upload.received_size
+    _claim_session(db, upload, size, "completing")
+    try:
+        path = partial_path(upload.id)
+        # Drop anything a failed append wrote past the accepted size
+        os.truncate(path, size)
+        sha256 = (await _hasher_at(upload.id, size)).hexdigest()
+        if upload.expected_sha256 and upload.expected_sha256 != sha256:
+            raise UploadError(422, "Uploaded bytes do not match the declared SHA-256")
+
+        stored = commit_object(db, path, sha256, size, upload.content_type, upload.owner_id)
+    except Exception:
+        db.rollback()
+        _release_session(db, upload, "completing", size, size)
+        raise
+    upload.status = "completed"
+    upload.file_id = stored.id
+    upload.updated_at = datetime.utcnow()
+    db.commit()
+    session_hashers.discard(upload.id)
+    return stored
+
+def prune_stale_uploads(db: Session) -> int:
+    """Delete unfinished upload sessions (and their partial files) untouched within the TTL.
+
+    Completed sessions are kept: they map the upload id to its stored file.
+    Appends and completions whose worker died count as unfinished once their
+    claim is older than the TTL.
+    """
+    cutoff = datetime.utcnow() - timedelta(hours=UPLOAD_SESSION_TTL_HOURS)
+    is_stale = and_(UploadSession.status != "completed", UploadSession.updated_at < cutoff)
+    candidates = [upload_id for upload_id, in db.query(UploadSession.id).filter(is_stale)]
+    if not candidates:
+        return 0
+    # Re-checked in the delete: a client may have resumed one of them meanwhile
+    db.query(UploadSession).filter(
+        UploadSession.id.in_(candidates), is_stale
+    ).delete(synchronize_session=False)
+    db.commit()
+    resumed = {
+        upload_id for upload_id, in db.query(UploadSession.id).filter(UploadSession.id.in_(candidates))
+    }
+    deleted = [upload_id for upload_id in candidates if upload_id not in resumed]
+    for upload_id in deleted:
+        session_hashers.discard(upload_id)
+        if os.path.exists(partial_path(upload_id)):
+            os.remove(partial_path(upload_id))
+    return len(deleted)
+
+class UploadPruner:
+    """Background task that runs ``prune_stale_uploads`` every ``UPLOAD_PRUNE_INTERVAL_SECONDS``"""
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+        self.pruned = 0
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def prune_once(self) -> int:
+        with SessionLocal() as db:
+            pruned = prune_stale_uploads(db)
+        self.pruned += pruned
+        return pruned
+
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.to_thread(self.prune_once)
+            except Exception:
+                pass
+            await asyncio.sleep(UPLOAD_PRUNE_INTERVAL_SECONDS)
+
+def file_url(sha256: str) -> str:
+    return f"/api/files/{sha256}"
+
+def describe_file(stored: StoredFile) -> dict:
+    """Fields of a StoredFileResponse for a stored file"""
+    return {
+        "sha256": stored.sha256,
+        "size": stored.size,
+        "content_type": stored.content_type,
+        "url": file_url(stored.sha256),
+        "created_at": stored.created_at
+    }
+
+upload_pruner = UploadPruner()
@@ -246,7 +246,12 @@ class Hackathon {
       landingColorScheme: json['landing_color_scheme'] ?? '#1976d2',
       landingLogoUrl: json['landing_logo_url'],
       hasSponsors: json['has_sponsors'] ?? false,
-      sponsorsData: json['sponsors_data'],
+      // The API returns sponsors as a list; keep the encoded form used by the app
+      sponsorsData: json['sponsors_data'] is String
+          ? json['sponsors_data']
+          : (json['sponsors_data'] != null && (json['sponsors_data'] as List).isNotEmpty
+              ? jsonEncode(json['sponsors_data'])
+              : null),
     );
   }
 